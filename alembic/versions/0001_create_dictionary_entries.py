@@ -0,0 +1,40 @@
+"""Create dictionary_entries table
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'dictionary_entries',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('word', sa.String(), nullable=False),
+        sa.Column('definition', sa.String(), nullable=False),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('(CURRENT_TIMESTAMP)'),
+            nullable=False
+        ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_dictionary_entries_id'), 'dictionary_entries', ['id'], unique=False)
+    op.create_index(op.f('ix_dictionary_entries_word'), 'dictionary_entries', ['word'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_dictionary_entries_word'), table_name='dictionary_entries')
+    op.drop_index(op.f('ix_dictionary_entries_id'), table_name='dictionary_entries')
+    op.drop_table('dictionary_entries')
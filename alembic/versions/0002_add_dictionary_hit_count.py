@@ -0,0 +1,28 @@
+"""Add hit_count to dictionary_entries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'dictionary_entries',
+        sa.Column('hit_count', sa.Integer(), server_default='0', nullable=False)
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('dictionary_entries') as batch_op:
+        batch_op.drop_column('hit_count')
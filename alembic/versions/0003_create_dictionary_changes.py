@@ -0,0 +1,43 @@
+"""Create dictionary_changes table
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'dictionary_changes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('word', sa.String(), nullable=False),
+        sa.Column('operation', sa.String(), nullable=False),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('(CURRENT_TIMESTAMP)'),
+            nullable=False
+        ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        op.f('ix_dictionary_changes_created_at'),
+        'dictionary_changes',
+        ['created_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_dictionary_changes_created_at'), table_name='dictionary_changes')
+    op.drop_table('dictionary_changes')
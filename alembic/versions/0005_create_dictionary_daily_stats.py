@@ -0,0 +1,46 @@
+"""Create dictionary_daily_stats table and index entries by created_at
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f('ix_dictionary_entries_created_at'),
+        'dictionary_entries',
+        ['created_at'],
+        unique=False
+    )
+    stats = op.create_table(
+        'dictionary_daily_stats',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('added', sa.Integer(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('day')
+    )
+    
+    # Backfill once from existing entries; the app keeps counters current
+    entries = sa.table('dictionary_entries', sa.column('created_at', sa.DateTime(timezone=True)))
+    day = sa.func.date(entries.c.created_at)
+    op.execute(
+        stats.insert().from_select(
+            ['day', 'added'],
+            sa.select(day, sa.func.count()).group_by(day)
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('dictionary_daily_stats')
+    op.drop_index(op.f('ix_dictionary_entries_created_at'), table_name='dictionary_entries')
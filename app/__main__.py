@@ -0,0 +1,8 @@
+"""Run the API server: ``python -m app``."""
+from app.core.config import settings
+from app.core.logging_config import configure_logging
+from app.core.server import run_server
+
+if __name__ == "__main__":
+    configure_logging(settings)
+    run_server(settings)
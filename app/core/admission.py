@@ -0,0 +1,168 @@
+"""Admission control and load shedding for HTTP routes."""
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionBudget:
+    """
+    Concurrency limit with a bounded, deadline-limited wait queue.
+    
+    Up to max_concurrent requests run at once; up to max_queue more wait
+    at most max_wait_seconds for a slot. Anything beyond that is shed
+    immediately instead of piling up behind a slow dependency. Slots are
+    handed directly to the oldest waiter on release (FIFO).
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int,
+        max_queue: int,
+        max_wait_seconds: float
+    ) -> None:
+        """
+        Initialize the budget.
+        
+        Args:
+            name: Metric name prefix
+            max_concurrent: Requests allowed to run at once
+            max_queue: Requests allowed to wait for a slot
+            max_wait_seconds: Longest time a request may wait
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+    
+    def _update_gauges(self) -> None:
+        """Publish active and queued gauges."""
+        metrics.set_gauge(f"admission.{self.name}.active", self._active)
+        metrics.set_gauge(f"admission.{self.name}.queued", len(self._waiters))
+    
+    def _shed(self, reason: str) -> bool:
+        """Count a shed request and report failure."""
+        metrics.increment(f"admission.{self.name}.shed")
+        metrics.increment(f"admission.{self.name}.shed_{reason}")
+        return False
+    
+    async def acquire(self) -> bool:
+        """
+        Take a slot, waiting in the queue if necessary.
+        
+        Returns:
+            True if a slot was taken, False if the request was shed
+        """
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            self._update_gauges()
+            return True
+        if len(self._waiters) >= self.max_queue:
+            return self._shed("queue_full")
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._update_gauges()
+        queued_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.max_wait_seconds)
+        except asyncio.TimeoutError:
+            return self._shed("timeout")
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before cancellation
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            metrics.observe(f"admission.{self.name}.queue_wait_seconds", time.perf_counter() - queued_at)
+            self._update_gauges()
+        return True
+    
+    def release(self) -> None:
+        """Return a slot, handing it to the oldest live waiter if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._update_gauges()
+                return
+        self._active -= 1
+        self._update_gauges()
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware applying an admission budget per path prefix.
+    
+    Requests matching no prefix pass straight through, so health checks
+    and metrics are always answered. Shed requests get 503 with a
+    Retry-After header.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        budgets: List[Tuple[str, AdmissionBudget]],
+        retry_after_seconds: int = 1
+    ) -> None:
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The wrapped ASGI application
+            budgets: (path prefix, budget) pairs; the longest prefix wins
+            retry_after_seconds: Value of the Retry-After header on 503
+        """
+        self.app = app
+        self.budgets = sorted(budgets, key=lambda item: len(item[0]), reverse=True)
+        self.retry_after_seconds = retry_after_seconds
+    
+    def _budget_for(self, path: str) -> Optional[AdmissionBudget]:
+        """Return the budget for a request path, if any."""
+        for prefix, budget in self.budgets:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return budget
+        return None
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Admit, queue or shed the request."""
+        budget = self._budget_for(scope["path"]) if scope["type"] == "http" else None
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+        
+        if not await budget.acquire():
+            logger.debug("Shed request to %s (%s budget)", scope["path"], budget.name)
+            await self._send_overloaded(send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            budget.release()
+    
+    async def _send_overloaded(self, send: Send) -> None:
+        """Send a 503 response asking the client to retry later."""
+        body = json.dumps({"detail": "Server is overloaded, retry later"}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"retry-after", str(self.retry_after_seconds).encode("ascii")),
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,111 @@
+"""Request body size limits enforced before the body is parsed."""
+import logging
+from typing import Dict, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.exceptions import RequestBodyTooLargeError
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class BodySizeLimitMiddleware:
+    """
+    ASGI middleware rejecting oversized request bodies with 413.
+    
+    A declared Content-Length above the limit is rejected before the app
+    runs. Chunked bodies are counted as they are received and the request
+    fails as soon as the limit is crossed, so an oversized payload is
+    never fully buffered or handed to Pydantic.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_body_bytes: int,
+        path_limits: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The wrapped ASGI application
+            max_body_bytes: Default limit in bytes (0 = unlimited)
+            path_limits: Per path-prefix limits overriding the default;
+                the longest matching prefix wins
+        """
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.path_limits = sorted((path_limits or {}).items(), key=lambda item: len(item[0]), reverse=True)
+    
+    def limit_for(self, path: str) -> int:
+        """
+        Resolve the body limit for a request path.
+        
+        Args:
+            path: Request path
+        
+        Returns:
+            Limit in bytes, 0 if unlimited
+        """
+        for prefix, limit in self.path_limits:
+            if path.startswith(prefix):
+                return limit
+        return self.max_body_bytes
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Reject or meter the request body, then run the app."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        limit = self.limit_for(scope["path"])
+        if not limit:
+            await self.app(scope, receive, send)
+            return
+        
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    declared = int(value)
+                except ValueError:
+                    declared = 0
+                if declared > limit:
+                    await self._reject(scope, receive, send, limit)
+                    return
+                break
+        
+        received = 0
+        response_started = False
+        
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise RequestBodyTooLargeError(limit)
+            return message
+        
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except RequestBodyTooLargeError:
+            if response_started:
+                raise
+            await self._reject(scope, receive, send, limit)
+    
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, limit: int) -> None:
+        """Send a 413 response."""
+        metrics.increment("http.body_too_large")
+        logger.warning("Rejected %s %s: body exceeds %d bytes", scope["method"], scope["path"], limit)
+        error = RequestBodyTooLargeError(limit)
+        response = JSONResponse(status_code=error.status_code, content={"detail": error.detail})
+        await response(scope, receive, send)
@@ -0,0 +1,454 @@
+"""Cache backends with interchangeable in-process, shared-memory and network storage."""
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Optional, Tuple, TypeVar
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+
+class CacheBackend(ABC):
+    """Interface for byte-valued cache stores."""
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a value.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            The stored bytes, or None on a miss
+        """
+        pass
+    
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: Bytes to store
+            ttl_seconds: Seconds the value stays valid
+        """
+        pass
+    
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Remove a value if present.
+        
+        Args:
+            key: Cache key
+        """
+        pass
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all values."""
+        pass
+
+
+class LRUCache(CacheBackend):
+    """
+    Thread-safe in-process LRU cache with per-entry TTL.
+    
+    Accepts any value type, so it can also hold decoded objects as an L1
+    tier in front of a byte-valued backend. Expired entries stay until they
+    are overwritten or evicted, so get_stale() can still serve them while
+    the source of truth is unavailable.
+    """
+    
+    def __init__(self, max_size: int) -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries
+        """
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value for key, or None if missing or expired."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def get_stale(self, key: str) -> Optional[Any]:
+        """Return the value for key even if it has expired, or None if missing."""
+        with self._lock:
+            item = self._entries.get(key)
+            return item[1] if item is not None else None
+    
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+    
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        """Number of entries, including not yet evicted expired ones."""
+        return len(self._entries)
+
+
+class SharedMemoryCache(CacheBackend):
+    """
+    Cross-process cache in a memory-mapped file shared by every worker on a host.
+    
+    The file is a fixed-size open-addressing hash table of equal slots.
+    Writers serialize on an flock; readers are lock-free and use a per-slot
+    sequence number plus CRC to discard torn reads. Values that do not fit
+    in a slot are not cached.
+    """
+    
+    MAGIC = b"DTSC"
+    HEADER = struct.Struct("<4sII")
+    SLOT_HEADER = struct.Struct("<IQdII")
+    MAX_PROBES = 8
+    
+    def __init__(self, path: str, slots: int, slot_size: int) -> None:
+        """
+        Open or create the shared cache file.
+        
+        Args:
+            path: File path, ideally on a tmpfs such as /dev/shm
+            slots: Number of hash table slots
+            slot_size: Bytes per slot, including the slot header
+        """
+        self._slots = slots
+        self._slot_size = slot_size
+        self._capacity = slot_size - self.SLOT_HEADER.size
+        size = self.HEADER.size + slots * slot_size
+        
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            header = os.pread(self._fd, self.HEADER.size, 0)
+            if len(header) < self.HEADER.size or self.HEADER.unpack(header) != (self.MAGIC, slots, slot_size):
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+                os.pwrite(self._fd, self.HEADER.pack(self.MAGIC, slots, slot_size), 0)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, size)
+    
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        """Return a non-zero 64-bit hash of the key."""
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") or 1
+    
+    def _offset(self, slot: int) -> int:
+        """Byte offset of a slot in the mapping."""
+        return self.HEADER.size + slot * self._slot_size
+    
+    def _probe(self, key_hash: int):
+        """Yield the slot indexes probed for a key hash."""
+        start = key_hash % self._slots
+        for step in range(min(self.MAX_PROBES, self._slots)):
+            yield (start + step) % self._slots
+    
+    def _read_slot(self, slot: int) -> Optional[Tuple[int, float, bytes]]:
+        """Read a slot consistently, returning (hash, expiry, payload) or None."""
+        offset = self._offset(slot)
+        for _ in range(2):
+            seq, key_hash, expires_at, length, crc = self.SLOT_HEADER.unpack_from(self._map, offset)
+            if seq % 2 or length > self._capacity:
+                continue
+            start = offset + self.SLOT_HEADER.size
+            payload = self._map[start:start + length]
+            if self.SLOT_HEADER.unpack_from(self._map, offset)[0] != seq:
+                continue
+            if zlib.crc32(payload) != crc:
+                return None
+            return key_hash, expires_at, payload
+        return None
+    
+    def _write_slot(self, slot: int, key_hash: int, expires_at: float, payload: bytes) -> None:
+        """Write a slot; the caller holds the write lock."""
+        offset = self._offset(slot)
+        seq = self.SLOT_HEADER.unpack_from(self._map, offset)[0]
+        struct.pack_into("<I", self._map, offset, (seq + 1) & 0xFFFFFFFF)
+        start = offset + self.SLOT_HEADER.size
+        self._map[start:start + len(payload)] = payload
+        self.SLOT_HEADER.pack_into(
+            self._map, offset, (seq + 2) & 0xFFFFFFFF, key_hash, expires_at, len(payload), zlib.crc32(payload)
+        )
+    
+    @staticmethod
+    def _split(payload: bytes) -> Tuple[bytes, bytes]:
+        """Split a slot payload into (key, value)."""
+        key_length = int.from_bytes(payload[:2], "little")
+        return payload[2:2 + key_length], payload[2 + key_length:]
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value for key, or None if missing, expired or torn."""
+        raw_key = key.encode("utf-8")
+        key_hash = self._hash(raw_key)
+        now = time.time()
+        for slot in self._probe(key_hash):
+            item = self._read_slot(slot)
+            if item is None or item[0] != key_hash:
+                continue
+            stored_key, value = self._split(item[2])
+            if stored_key == raw_key:
+                return value if item[1] >= now else None
+        return None
+    
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """Store a value, replacing the key's slot or the first free or expired one."""
+        raw_key = key.encode("utf-8")
+        payload = len(raw_key).to_bytes(2, "little") + raw_key + value
+        if len(payload) > self._capacity:
+            return
+        key_hash = self._hash(raw_key)
+        now = time.time()
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            target = None
+            free = None
+            for slot in self._probe(key_hash):
+                stored_hash, expires_at = self.SLOT_HEADER.unpack_from(self._map, self._offset(slot))[1:3]
+                if stored_hash == key_hash:
+                    target = slot
+                    break
+                if free is None and (stored_hash == 0 or expires_at < now):
+                    free = slot
+            if target is None:
+                target = free if free is not None else key_hash % self._slots
+            self._write_slot(target, key_hash, now + ttl_seconds, payload)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+    
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        raw_key = key.encode("utf-8")
+        key_hash = self._hash(raw_key)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            for slot in self._probe(key_hash):
+                item = self._read_slot(slot)
+                if item is not None and item[0] == key_hash and self._split(item[2])[0] == raw_key:
+                    self._write_slot(slot, 0, 0.0, b"")
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+    
+    def clear(self) -> None:
+        """Remove all values."""
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            for slot in range(self._slots):
+                self._write_slot(slot, 0, 0.0, b"")
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+    
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self._map.close()
+        os.close(self._fd)
+
+
+class RedisCache(CacheBackend):
+    """
+    Network cache speaking the Redis protocol.
+    
+    Connection errors are treated as misses so a cache outage degrades to
+    database reads instead of failing requests.
+    """
+    
+    def __init__(self, client: Any, prefix: str = "devtools:") -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            client: A redis.Redis compatible client (e.g. fakeredis in tests)
+            prefix: Namespace prepended to every key
+        """
+        import redis
+        
+        self._client = client
+        self._prefix = prefix
+        self._errors = (redis.RedisError, OSError)
+    
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "devtools:") -> "RedisCache":
+        """
+        Create a cache connected to a Redis URL.
+        
+        Args:
+            url: Redis connection URL, e.g. redis://localhost:6379/0
+            prefix: Namespace prepended to every key
+            
+        Returns:
+            Configured RedisCache
+        """
+        import redis
+        
+        return cls(redis.Redis.from_url(url, socket_timeout=0.05), prefix)
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value for key, or None on a miss or connection error."""
+        try:
+            return self._client.get(self._prefix + key)
+        except self._errors as e:
+            logger.debug("Redis get failed: %s", e)
+            return None
+    
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """Store a value with an expiry, ignoring connection errors."""
+        if ttl_seconds <= 0:
+            self.delete(key)
+            return
+        try:
+            self._client.set(self._prefix + key, value, px=max(int(ttl_seconds * 1000), 1))
+        except self._errors as e:
+            logger.debug("Redis set failed: %s", e)
+    
+    def delete(self, key: str) -> None:
+        """Remove a value, ignoring connection errors."""
+        try:
+            self._client.delete(self._prefix + key)
+        except self._errors as e:
+            logger.warning("Redis delete failed: %s", e)
+    
+    def clear(self) -> None:
+        """Remove every key under this cache's prefix."""
+        try:
+            keys = list(self._client.scan_iter(match=self._prefix + "*"))
+            if keys:
+                self._client.delete(*keys)
+        except self._errors as e:
+            logger.warning("Redis clear failed: %s", e)
+
+
+class TieredCache(Generic[V]):
+    """
+    Two-tier cache: an in-process L1 of decoded values over an optional shared L2.
+    
+    L2 hits are decoded once and promoted into L1; writes and deletes go to
+    both tiers.
+    """
+    
+    def __init__(
+        self,
+        l1: LRUCache,
+        l2: Optional[CacheBackend],
+        encode: Callable[[V], bytes],
+        decode: Callable[[bytes], V],
+        l1_ttl: float,
+        l2_ttl: float
+    ) -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            l1: In-process cache holding decoded values
+            l2: Optional shared byte-valued backend
+            encode: Serializer for L2 values
+            decode: Deserializer for L2 values
+            l1_ttl: Seconds values stay in L1
+            l2_ttl: Seconds values stay in L2
+        """
+        self.l1 = l1
+        self.l2 = l2
+        self._encode = encode
+        self._decode = decode
+        self._l1_ttl = l1_ttl
+        self._l2_ttl = l2_ttl
+    
+    def get(self, key: str) -> Optional[V]:
+        """Look up a value in L1, then L2."""
+        value = self.l1.get(key)
+        if value is not None or self.l2 is None:
+            return value
+        raw = self.l2.get(key)
+        if raw is None:
+            return None
+        value = self._decode(raw)
+        self.l1.set(key, value, self._l1_ttl)
+        return value
+    
+    def get_stale(self, key: str) -> Optional[V]:
+        """Look up a value in L1 ignoring its TTL."""
+        return self.l1.get_stale(key)
+    
+    def set(self, key: str, value: V) -> None:
+        """Store a value in both tiers."""
+        self.l1.set(key, value, self._l1_ttl)
+        if self.l2 is not None:
+            self.l2.set(key, self._encode(value), self._l2_ttl)
+    
+    def delete(self, key: str) -> None:
+        """Remove a value from both tiers."""
+        self.l1.delete(key)
+        if self.l2 is not None:
+            self.l2.delete(key)
+    
+    def clear(self) -> None:
+        """Remove all values from both tiers."""
+        self.l1.clear()
+        if self.l2 is not None:
+            self.l2.clear()
+
+
+def create_cache_backend(config: Settings, namespace: str) -> Optional[CacheBackend]:
+    """
+    Build the configured shared (L2) cache backend.
+    
+    Args:
+        config: Application settings
+        namespace: Name distinguishing this cache's keys or file
+        
+    Returns:
+        The backend, or None when CACHE_BACKEND is 'none'
+        
+    Raises:
+        ValueError: If CACHE_BACKEND is not a known backend
+    """
+    backend = config.CACHE_BACKEND.lower()
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return LRUCache(max_size=config.DICTIONARY_CACHE_SIZE)
+    if backend == "shared_memory":
+        return SharedMemoryCache(
+            path=f"{config.SHARED_CACHE_DIR}/devtools-{namespace}.cache",
+            slots=config.SHARED_CACHE_SLOTS,
+            slot_size=config.SHARED_CACHE_SLOT_SIZE
+        )
+    if backend == "redis":
+        return RedisCache.from_url(config.REDIS_URL, prefix=f"devtools:{namespace}:")
+    raise ValueError(f"Unknown cache backend: {config.CACHE_BACKEND}")
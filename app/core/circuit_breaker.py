@@ -0,0 +1,187 @@
+"""Circuit breaker for calls to failing dependencies."""
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable, Tuple, Type, TypeVar
+
+from sqlalchemy.exc import InterfaceError, OperationalError, TimeoutError as PoolTimeoutError
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_GAUGE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency while its circuit is open."""
+    
+    def __init__(self, name: str, retry_after: float) -> None:
+        """
+        Initialize the exception.
+        
+        Args:
+            name: Circuit name
+            retry_after: Seconds until the next probe is allowed
+        """
+        super().__init__(f"Circuit '{name}' is open")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed/open/half-open circuit breaker.
+    
+    After failure_threshold consecutive failures the circuit opens and
+    calls fail immediately. Once recovery_timeout has passed, up to
+    half_open_max_calls probe calls are let through: a success closes the
+    circuit, a failure opens it again. Only failure_exceptions count as
+    failures; other exceptions (e.g. integrity errors) pass through.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        recovery_timeout: float,
+        half_open_max_calls: int = 1,
+        failure_exceptions: Tuple[Type[BaseException], ...] = (Exception,)
+    ) -> None:
+        """
+        Initialize the breaker in the closed state.
+        
+        Args:
+            name: Metric name prefix
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to stay open before probing
+            half_open_max_calls: Concurrent probe calls while half-open
+            failure_exceptions: Exception types counted as failures
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_exceptions = failure_exceptions
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+    
+    @property
+    def state(self) -> str:
+        """Current state: 'closed', 'open' or 'half_open'."""
+        return self._state
+    
+    @property
+    def is_open(self) -> bool:
+        """True while calls would be rejected without probing."""
+        with self._lock:
+            return self._state == OPEN and self._retry_after() > 0
+    
+    def _retry_after(self) -> float:
+        """Seconds until a probe is allowed; caller holds the lock."""
+        return self._opened_at + self.recovery_timeout - time.monotonic()
+    
+    def _set_state(self, state: str) -> None:
+        """Change state and publish it; caller holds the lock."""
+        if state != self._state:
+            logger.warning("Circuit '%s' changed from %s to %s", self.name, self._state, state)
+            self._state = state
+        metrics.set_gauge(f"circuit.{self.name}.state", _STATE_GAUGE[state])
+    
+    def before_call(self) -> None:
+        """
+        Admit a call or reject it.
+        
+        Raises:
+            CircuitOpenError: If the circuit is open or all probes are taken
+        """
+        with self._lock:
+            if self._state == OPEN:
+                retry_after = self._retry_after()
+                if retry_after > 0:
+                    metrics.increment(f"circuit.{self.name}.rejected")
+                    raise CircuitOpenError(self.name, retry_after)
+                self._set_state(HALF_OPEN)
+                self._probes = 0
+            if self._state == HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    metrics.increment(f"circuit.{self.name}.rejected")
+                    raise CircuitOpenError(self.name, self.recovery_timeout)
+                self._probes += 1
+    
+    def record_success(self) -> None:
+        """Record a successful call, closing a half-open circuit."""
+        with self._lock:
+            self._failures = 0
+            if self._state != CLOSED:
+                self._set_state(CLOSED)
+    
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if needed."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    metrics.increment(f"circuit.{self.name}.opened")
+                self._opened_at = time.monotonic()
+                self._set_state(OPEN)
+    
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call func through the breaker.
+        
+        Args:
+            func: The dependency call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            The call's return value
+            
+        Raises:
+            CircuitOpenError: If the call was rejected
+        """
+        self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except self.failure_exceptions:
+            self.record_failure()
+            raise
+        except BaseException:
+            # The dependency answered (e.g. an integrity error), so it is healthy
+            self.record_success()
+            raise
+        self.record_success()
+        return result
+    
+    def reset(self) -> None:
+        """Close the circuit and forget failures."""
+        with self._lock:
+            self._failures = 0
+            self._probes = 0
+            self._set_state(CLOSED)
+
+
+def retry_after_seconds(error: CircuitOpenError) -> int:
+    """Round a breaker's retry delay up to whole seconds for Retry-After."""
+    return max(1, math.ceil(error.retry_after))
+
+
+# Breaker shared by all database calls in this process
+database_breaker = CircuitBreaker(
+    "database",
+    failure_threshold=settings.DB_CIRCUIT_FAILURE_THRESHOLD,
+    recovery_timeout=settings.DB_CIRCUIT_RECOVERY_TIMEOUT,
+    half_open_max_calls=settings.DB_CIRCUIT_HALF_OPEN_MAX_CALLS,
+    failure_exceptions=(OperationalError, InterfaceError, PoolTimeoutError)
+)
@@ -1,7 +1,7 @@
 """Application configuration module using Pydantic Settings."""
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -54,6 +54,343 @@ class Settings(BaseSettings):
     # Database connection retry settings
     DB_MAX_RETRIES: int = Field(default=30, ge=1, description="Max database connection retries")
     DB_RETRY_DELAY: int = Field(default=2, ge=1, description="Delay between retries in seconds")
+    DB_CREATE_SCHEMA_ON_STARTUP: bool = Field(
+        default=True,
+        description="Create missing tables on startup; disable where Alembic manages the schema"
+    )
+    
+    # Connection pool and executor settings
+    DB_POOL_SIZE: int = Field(default=5, ge=1, description="Persistent database connections per process")
+    DB_MAX_OVERFLOW: int = Field(default=10, ge=0, description="Extra connections allowed above DB_POOL_SIZE")
+    DB_PREPARE_THRESHOLD: int = Field(
+        default=5,
+        ge=0,
+        description="Executions before psycopg 3 server-side prepares a statement (0 = always)"
+    )
+    EXECUTOR_MAX_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        description="Service executor threads (0 = DB_POOL_SIZE + DB_MAX_OVERFLOW)"
+    )
+    EXECUTOR_OFFLOAD_MIN_ITEMS: int = Field(
+        default=1_000,
+        ge=0,
+        description="Minimum items or words before pure computations move off the event loop"
+    )
+    
+    @property
+    def executor_max_workers(self) -> int:
+        """
+        Resolve the service executor size.
+        
+        Defaults to the connection pool capacity so executor threads never
+        queue for a database connection.
+        
+        Returns:
+            Number of executor worker threads
+        """
+        return self.EXECUTOR_MAX_WORKERS or (self.DB_POOL_SIZE + self.DB_MAX_OVERFLOW)
+    
+    # SQLite settings (single-node and edge deployments)
+    SQLITE_TUNED: bool = Field(default=True, description="Apply the WAL and caching PRAGMA profile to SQLite")
+    SQLITE_SYNCHRONOUS: str = Field(default="NORMAL", description="PRAGMA synchronous level")
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(
+        default=5_000,
+        ge=0,
+        description="Milliseconds a connection waits for a lock before failing"
+    )
+    SQLITE_CACHE_SIZE_KB: int = Field(default=65_536, ge=0, description="Page cache size per connection in KiB")
+    SQLITE_MMAP_SIZE: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="Bytes of the database file read through mmap"
+    )
+    SQLITE_SERIALIZE_WRITES: bool = Field(
+        default=True,
+        description="Queue writers on an in-process lock so only one writes at a time"
+    )
+    
+    # Query instrumentation settings
+    DB_SLOW_QUERY_SECONDS: float = Field(
+        default=0.2,
+        ge=0,
+        description="Statements slower than this are logged with their plan"
+    )
+    DB_EXPLAIN_SLOW_QUERIES: bool = Field(default=True, description="Capture EXPLAIN output for slow queries")
+    DB_QUERY_STATS_HEADERS: bool = Field(
+        default=False,
+        description="Report per-request query count and time in response headers"
+    )
+    
+    # Circuit breaker settings
+    DB_CIRCUIT_BREAKER_ENABLED: bool = Field(default=True, description="Fail fast while the database is failing")
+    DB_CIRCUIT_FAILURE_THRESHOLD: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive database failures that open the circuit"
+    )
+    DB_CIRCUIT_RECOVERY_TIMEOUT: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds the circuit stays open before a probe is allowed"
+    )
+    DB_CIRCUIT_HALF_OPEN_MAX_CALLS: int = Field(default=1, ge=1, description="Concurrent probes while half-open")
+    
+    # Admission control settings
+    ADMISSION_CONTROL_ENABLED: bool = Field(default=True, description="Limit in-flight requests per route group")
+    ADMISSION_CHEAP_MAX_CONCURRENT: int = Field(
+        default=256,
+        ge=1,
+        description="Concurrent requests for pure endpoints (/shopping, /word)"
+    )
+    ADMISSION_CHEAP_MAX_QUEUE: int = Field(default=512, ge=0, description="Queued requests for pure endpoints")
+    ADMISSION_CHEAP_MAX_WAIT: float = Field(default=0.5, gt=0, description="Max queue wait in seconds for pure endpoints")
+    ADMISSION_DB_MAX_CONCURRENT: int = Field(
+        default=0,
+        ge=0,
+        description="Concurrent requests for database routes (0 = DB_POOL_SIZE + DB_MAX_OVERFLOW)"
+    )
+    ADMISSION_DB_MAX_QUEUE: int = Field(default=64, ge=0, description="Queued requests for database routes")
+    ADMISSION_DB_MAX_WAIT: float = Field(default=2.0, gt=0, description="Max queue wait in seconds for database routes")
+    ADMISSION_RETRY_AFTER: int = Field(default=1, ge=0, description="Retry-After seconds sent with shed requests")
+    
+    @property
+    def admission_db_max_concurrent(self) -> int:
+        """
+        Resolve the concurrency limit for database routes.
+        
+        Returns:
+            ADMISSION_DB_MAX_CONCURRENT, or the connection pool capacity when 0
+        """
+        return self.ADMISSION_DB_MAX_CONCURRENT or (self.DB_POOL_SIZE + self.DB_MAX_OVERFLOW)
+    
+    # Response memoization settings
+    MEMO_ROUTES: str = Field(
+        default="/shopping/total,/word/concat",
+        description="Comma-separated pure routes whose responses are memoized"
+    )
+    MEMO_CACHE_SIZE: int = Field(default=10_000, ge=1, description="Max memoized responses")
+    MEMO_CACHE_TTL: int = Field(default=600, ge=1, description="Seconds a memoized response is reused")
+    MEMO_MAX_BODY_BYTES: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="Requests or responses larger than this are not memoized"
+    )
+    
+    @property
+    def memo_routes(self) -> List[str]:
+        """Parse MEMO_ROUTES into a list of paths."""
+        return [path.strip() for path in self.MEMO_ROUTES.split(",") if path.strip()]
+    
+    # Shopping rules settings
+    SHOPPING_RULE_CACHE_SIZE: int = Field(default=256, ge=1, description="Max compiled shopping rule sets kept")
+    SHOPPING_RULE_CACHE_TTL: int = Field(
+        default=3600,
+        ge=1,
+        description="Seconds a compiled shopping rule set is reused"
+    )
+    
+    # Dictionary cache settings
+    DICTIONARY_CACHE_SIZE: int = Field(default=10_000, ge=1, description="Max cached dictionary entries")
+    DICTIONARY_CACHE_TTL: int = Field(default=300, ge=1, description="Dictionary L1 (in-process) cache TTL in seconds")
+    DICTIONARY_CACHE_L2_TTL: int = Field(default=3600, ge=1, description="Dictionary L2 (shared) cache TTL in seconds")
+    DICTIONARY_HIT_FLUSH_INTERVAL: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds between batched hit-count flushes"
+    )
+    DICTIONARY_WARMUP_TOP_N: int = Field(
+        default=1_000,
+        ge=0,
+        description="Most popular words preloaded into the cache on startup"
+    )
+    
+    # Change feed settings
+    DICTIONARY_CHANGE_POLL_INTERVAL: float = Field(
+        default=1.0,
+        gt=0,
+        description="Seconds between change feed polls"
+    )
+    DICTIONARY_CHANGE_BATCH_SIZE: int = Field(default=500, ge=1, description="Max changes read per poll")
+    DICTIONARY_CHANGE_RETENTION: int = Field(
+        default=86_400,
+        ge=60,
+        description="Seconds change feed rows are kept before pruning"
+    )
+    
+    # Autocomplete settings
+    DICTIONARY_SUGGEST_ENABLED: bool = Field(default=True, description="Maintain the in-memory suggestion index")
+    DICTIONARY_SUGGEST_DEBOUNCE_MS: float = Field(
+        default=50.0,
+        ge=0,
+        description="Quiet time before a WebSocket suggestion query is answered"
+    )
+    DICTIONARY_SUGGEST_MAX_RESULTS: int = Field(default=10, ge=1, description="Max suggestions per reply")
+    DICTIONARY_SUGGEST_REFRESH_INTERVAL: float = Field(
+        default=2.0,
+        gt=0,
+        description="Seconds between suggestion index refreshes"
+    )
+    
+    # Write batching settings
+    DICTIONARY_WRITE_BATCHING: bool = Field(
+        default=False,
+        description="Group concurrent add_word calls into one transaction"
+    )
+    DICTIONARY_WRITE_BATCH_MAX_SIZE: int = Field(default=100, ge=1, description="Max adds per group commit")
+    DICTIONARY_WRITE_BATCH_MAX_DELAY_MS: float = Field(
+        default=5.0,
+        ge=0,
+        description="Milliseconds to wait for more adds before committing"
+    )
+    
+    # Snapshot settings
+    DICTIONARY_SNAPSHOT_PATH: str = Field(
+        default="",
+        description="Path of the memory-mapped dictionary snapshot; empty disables it"
+    )
+    DICTIONARY_SNAPSHOT_REBUILD_INTERVAL: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds between snapshot freshness checks"
+    )
+    DICTIONARY_SEARCH_MAX_RESULTS: int = Field(default=100, ge=1, description="Max entries per prefix search")
+    DICTIONARY_STATS_MAX_DAYS: int = Field(default=365, ge=1, description="Max days of daily additions in /dictionary/stats")
+    DICTIONARY_BATCH_MAX_WORDS: int = Field(default=1000, ge=1, description="Max words per batch lookup")
+    
+    # Background job settings
+    JOBS_ENABLED: bool = Field(default=True, description="Run queued background jobs in this process")
+    JOBS_MAX_WORKERS: int = Field(default=2, ge=1, description="Jobs run concurrently per process")
+    JOBS_CHUNK_SIZE: int = Field(default=5_000, ge=1, description="Units of work committed per checkpoint")
+    JOBS_POLL_INTERVAL: float = Field(default=2.0, gt=0, description="Seconds between checks for runnable jobs")
+    JOBS_STALE_AFTER: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds without a checkpoint before a running job is resumed elsewhere"
+    )
+    JOBS_IMPORT_DIR: str = Field(
+        default="",
+        description="Directory dictionary import files are read from ('' disables imports)"
+    )
+    
+    # Shared cache backend settings
+    CACHE_BACKEND: str = Field(
+        default="none",
+        description="Shared L2 cache backend: 'none', 'memory', 'shared_memory' or 'redis'"
+    )
+    REDIS_URL: str = Field(default="redis://localhost:6379/0", description="Redis URL for the redis cache backend")
+    SHARED_CACHE_DIR: str = Field(default="/dev/shm", description="Directory for shared-memory cache files")
+    SHARED_CACHE_SLOTS: int = Field(default=65_536, ge=1, description="Slots in each shared-memory cache")
+    SHARED_CACHE_SLOT_SIZE: int = Field(default=512, ge=64, description="Bytes per shared-memory cache slot")
+    
+    # Server settings (python -m app)
+    SERVER_HOST: str = Field(default="0.0.0.0", description="Address the server binds to")
+    SERVER_PORT: int = Field(default=8000, ge=1, le=65535, description="Port the server binds to")
+    SERVER_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        description="Worker processes (0 = derived from the cgroup CPU quota)"
+    )
+    SERVER_BACKLOG: int = Field(default=2048, ge=1, description="Listen backlog for pending connections")
+    SERVER_KEEPALIVE_TIMEOUT: int = Field(
+        default=5,
+        ge=1,
+        description="Seconds an idle keep-alive connection stays open"
+    )
+    SERVER_GRACEFUL_TIMEOUT: int = Field(
+        default=30,
+        ge=1,
+        description="Seconds in-flight requests may take to finish after SIGTERM"
+    )
+    SERVER_PRELOAD: bool = Field(
+        default=False,
+        description="Import the app before forking so workers share its memory copy-on-write"
+    )
+    
+    # Memory profiling and request body limits
+    MEMORY_PROFILING_ENABLED: bool = Field(
+        default=False,
+        description="Trace allocations with tracemalloc and record peak memory per route"
+    )
+    MEMORY_PROFILING_FRAMES: int = Field(default=1, ge=1, description="Stack frames kept per traced allocation")
+    MAX_REQUEST_BODY_BYTES: int = Field(
+        default=1024 * 1024,
+        ge=0,
+        description="Largest accepted request body in bytes (0 = unlimited)"
+    )
+    REQUEST_BODY_LIMITS: str = Field(
+        default="/word/concat/batch=8388608,/word/concat/stream=0",
+        description="Per path-prefix body limits overriding MAX_REQUEST_BODY_BYTES, e.g. '/shopping=65536'"
+    )
+    
+    @property
+    def request_body_limits(self) -> Dict[str, int]:
+        """Parse REQUEST_BODY_LIMITS into a path-prefix to byte-limit mapping."""
+        limits: Dict[str, int] = {}
+        for pair in self.REQUEST_BODY_LIMITS.split(','):
+            path, _, limit = pair.partition('=')
+            if path.strip() and limit.strip():
+                limits[path.strip()] = max(0, int(limit))
+        return limits
+    
+    # Tracing settings
+    TRACING_ENABLED: bool = Field(
+        default=False,
+        description="Record request, service, repository and SQL spans"
+    )
+    TRACING_SAMPLE_RATIO: float = Field(
+        default=0.05,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of new traces recorded; incoming traceparent flags are honoured"
+    )
+    TRACING_EXPORTER: str = Field(default="console", description="Span exporter: 'console' or 'file'")
+    TRACING_EXPORT_PATH: str = Field(default="traces.jsonl", description="File the 'file' exporter appends to")
+    TRACING_QUEUE_SIZE: int = Field(
+        default=2048,
+        ge=1,
+        description="Finished spans buffered for export before new ones are dropped"
+    )
+    
+    # Logging settings
+    LOG_LEVEL: str = Field(default="INFO", description="Root log level")
+    LOG_FORMAT: str = Field(default="json", description="Log output format: 'json' or 'text'")
+    LOG_QUEUE_SIZE: int = Field(
+        default=10_000,
+        ge=1,
+        description="Max queued log records before new records are dropped"
+    )
+    LOG_SAMPLING_RATES: str = Field(
+        default="",
+        description="Per-logger keep rates, e.g. 'app.dictionary.service=0.1,app.words=0.01'"
+    )
+    
+    @property
+    def log_sampling_rates(self) -> Dict[str, float]:
+        """Parse LOG_SAMPLING_RATES into a logger-prefix to rate mapping."""
+        rates: Dict[str, float] = {}
+        for pair in self.LOG_SAMPLING_RATES.split(','):
+            name, _, rate = pair.partition('=')
+            if name.strip() and rate.strip():
+                rates[name.strip()] = min(max(float(rate), 0.0), 1.0)
+        return rates
+    
+    # Word concatenation batch settings
+    WORD_BATCH_POOL_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        description="Process pool size for large concat batches (0 = CPU count)"
+    )
+    WORD_BATCH_POOL_THRESHOLD: int = Field(
+        default=50_000,
+        ge=1,
+        description="Minimum total words in a batch before fanning out to the process pool"
+    )
+    WORD_BATCH_CHUNK_SIZE: int = Field(
+        default=64,
+        ge=1,
+        description="Word lists per process pool task"
+    )
     
     @property
     def database_url(self) -> str:
@@ -0,0 +1,131 @@
+"""JSON / MessagePack content negotiation for API routes."""
+import contextvars
+import logging
+from typing import Any, Callable, Coroutine
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+_response_format: contextvars.ContextVar[str] = contextvars.ContextVar("response_format", default="json")
+
+
+def accepts_msgpack(accept: str) -> bool:
+    """
+    Check whether an Accept header asks for MessagePack.
+    
+    Quality values are not weighed: listing a MessagePack media type is
+    enough, since JSON remains the default for everyone else.
+    
+    Args:
+        accept: Raw Accept header value
+        
+    Returns:
+        True if MessagePack is available and requested
+    """
+    if msgpack is None or not accept:
+        return False
+    return any(
+        part.split(";")[0].strip().lower() in MSGPACK_MEDIA_TYPES
+        for part in accept.split(",")
+    )
+
+
+class NegotiatedResponse(JSONResponse):
+    """
+    JSON response that renders MessagePack when the client asked for it.
+    
+    The route's already validated and serialized content is packed
+    directly, so both formats share the same response models.
+    """
+    
+    def __init__(self, content: Any, *args: Any, **kwargs: Any) -> None:
+        """Pick the media type for the current request before rendering."""
+        if _response_format.get() == "msgpack":
+            self.media_type = MSGPACK_MEDIA_TYPE
+        super().__init__(content, *args, **kwargs)
+    
+    def render(self, content: Any) -> bytes:
+        """Render content as MessagePack or JSON."""
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            return msgpack.packb(content, use_bin_type=True)
+        return super().render(content)
+
+
+class NegotiatedRoute(APIRoute):
+    """
+    Route accepting MessagePack request bodies and honoring Accept.
+    
+    A MessagePack body is decoded once and handed to FastAPI as the
+    parsed body, so it goes through the same Pydantic validation as JSON.
+    Use together with NegotiatedResponse as the default response class.
+    """
+    
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the FastAPI handler with body decoding and format selection."""
+        original_handler = super().get_route_handler()
+        
+        async def negotiated_handler(request: Request) -> Response:
+            content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+            # Routes without a body model (e.g. raw streaming) read the body themselves
+            if content_type in MSGPACK_MEDIA_TYPES and self.body_field is not None:
+                request = await _decode_msgpack_request(request)
+            
+            token = _response_format.set(
+                "msgpack" if accepts_msgpack(request.headers.get("accept", "")) else "json"
+            )
+            try:
+                return await original_handler(request)
+            finally:
+                _response_format.reset(token)
+        
+        return negotiated_handler
+
+
+async def _decode_msgpack_request(request: Request) -> Request:
+    """
+    Decode a MessagePack body into a request FastAPI treats as parsed JSON.
+    
+    Args:
+        request: Request with a MessagePack body
+        
+    Returns:
+        Request whose parsed body is the decoded document
+        
+    Raises:
+        HTTPException: 415 if msgpack is not installed, 400 if the body is invalid
+    """
+    if msgpack is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="MessagePack support is not installed"
+        )
+    body = await request.body()
+    try:
+        document = msgpack.unpackb(body, raw=False) if body else None
+    except (ValueError, msgpack.UnpackException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid MessagePack body: {e}"
+        )
+    
+    # Without a content type FastAPI reads the body through request.json(),
+    # which returns the cached, already decoded document
+    scope = dict(request.scope)
+    scope["headers"] = [
+        (name, value) for name, value in request.scope["headers"] if name != b"content-type"
+    ]
+    decoded = Request(scope, request.receive)
+    decoded._body = body
+    decoded._json = document
+    return decoded
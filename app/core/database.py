@@ -5,19 +5,37 @@ from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 
 from app.core.config import settings
+from app.core.query_stats import install_query_hooks
+from app.core.sqlite import install_sqlite_profile
+from app.core.tracing import install_tracing_hooks
 
 # Create engine with connection pooling
 connect_args = {}
+pool_args = {}
 if settings.is_sqlite:
     connect_args = {"check_same_thread": False}
+else:
+    pool_args = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+    if settings.database_url.startswith("postgresql+psycopg:"):
+        # psycopg 3 prepares statements server-side once they repeat
+        connect_args = {"prepare_threshold": settings.DB_PREPARE_THRESHOLD}
 
 engine = create_engine(
     settings.database_url,
     connect_args=connect_args,
+    **pool_args,
     pool_pre_ping=True,  # Verify connections before using
     pool_recycle=300,    # Recycle connections after 5 minutes
     echo=False,          # Set to True for SQL query logging
 )
+install_query_hooks(engine)
+if settings.is_sqlite and settings.SQLITE_TUNED:
+    install_sqlite_profile(engine, settings)
+if settings.TRACING_ENABLED:
+    install_tracing_hooks(engine)
 
 # Create session factory
 SessionLocal = sessionmaker(
@@ -61,6 +79,7 @@ def init_db() -> None:
     """
     # Import all models to ensure they're registered with Base
     from app.dictionary.db_models import DictionaryEntry  # noqa
+    from app.jobs.db_models import Job  # noqa
     
     Base.metadata.create_all(bind=engine)
 
@@ -46,6 +46,74 @@ class DictionaryWordAlreadyExistsError(HTTPException):
         )
 
 
+class DatabaseUnavailableError(HTTPException):
+    """
+    Raised when the database is failing or its circuit breaker is open.
+    
+    Attributes:
+        status_code: HTTP 503 Service Unavailable
+        detail: Error message
+        headers: Retry-After with the seconds until the next probe
+    """
+    
+    def __init__(self, retry_after: int = 1) -> None:
+        """
+        Initialize the exception.
+        
+        Args:
+            retry_after: Seconds the client should wait before retrying
+        """
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database is temporarily unavailable",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+
+class JobNotFoundError(HTTPException):
+    """
+    Raised when a job id does not exist.
+    
+    Attributes:
+        status_code: HTTP 404 Not Found
+        detail: Error message with the job id
+    """
+    
+    def __init__(self, job_id: int) -> None:
+        """
+        Initialize the exception.
+        
+        Args:
+            job_id: The job that was not found
+        """
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+
+
+class RequestBodyTooLargeError(HTTPException):
+    """
+    Raised when a request body exceeds its configured size limit.
+    
+    Attributes:
+        status_code: HTTP 413 Request Entity Too Large
+        detail: Error message with the limit
+    """
+    
+    def __init__(self, limit: int) -> None:
+        """
+        Initialize the exception.
+        
+        Args:
+            limit: The limit in bytes that was exceeded
+        """
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Request body exceeds {limit} bytes"
+        )
+
+
 class DatabaseConnectionError(Exception):
     """
     Raised when database connection fails.
@@ -0,0 +1,133 @@
+"""Bounded thread pool for blocking and CPU-bound service calls."""
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    Size-bounded thread pool that reports queue depth and wait time.
+    
+    Work submitted from the event loop runs on a worker thread with the
+    caller's context variables, so one slow call never stalls the loop.
+    """
+    
+    def __init__(self, max_workers: int, name: str = "service") -> None:
+        """
+        Initialize the executor.
+        
+        Args:
+            max_workers: Maximum number of worker threads
+            name: Metric and thread name prefix
+        """
+        self.max_workers = max_workers
+        self._name = name
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{name}-executor"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+    
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted calls waiting for a worker thread."""
+        return self._queued
+    
+    def _update_gauges(self) -> None:
+        """Publish queue depth and active worker gauges."""
+        metrics.set_gauge(f"executor.{self._name}.queue_depth", self._queued)
+        metrics.set_gauge(f"executor.{self._name}.active", self._active)
+    
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking callable on the pool and await its result.
+        
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            The callable's return value
+        """
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        submitted_at = time.perf_counter()
+        
+        with self._lock:
+            self._queued += 1
+            self._update_gauges()
+        
+        def task() -> T:
+            wait = time.perf_counter() - submitted_at
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._update_gauges()
+            metrics.observe(f"executor.{self._name}.wait_seconds", wait)
+            try:
+                return call()
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._update_gauges()
+        
+        return await asyncio.wrap_future(self._pool.submit(task))
+    
+    def shutdown(self) -> None:
+        """Wait for running calls and stop the worker threads."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+_executor: Optional[BoundedExecutor] = None
+
+
+def get_executor() -> BoundedExecutor:
+    """
+    Return the shared service executor, creating it on first use.
+    
+    Returns:
+        Executor sized by Settings.executor_max_workers
+    """
+    global _executor
+    if _executor is None:
+        _executor = BoundedExecutor(settings.executor_max_workers)
+        logger.info("Started service executor with %d workers", _executor.max_workers)
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking callable on the shared service executor.
+    
+    Args:
+        func: Blocking callable
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+        
+    Returns:
+        The callable's return value
+    """
+    return await get_executor().run(func, *args, **kwargs)
+
+
+def shutdown_executor() -> None:
+    """Shut down the shared service executor if it was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -0,0 +1,164 @@
+"""Non-blocking, structured and sampled logging configuration."""
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from app.core.config import Settings
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format log records as single-line JSON objects.
+    
+    Message arguments are merged here, in the listener thread, so callers
+    only pay for building the record.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Serialize a log record to JSON.
+        
+        Args:
+            record: The record to format
+            
+        Returns:
+            JSON document with timestamp, level, logger and message
+        """
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a configured fraction of records per logger.
+    
+    Rates are matched on the longest dotted logger-name prefix. Records at
+    ERROR or above are never dropped.
+    """
+    
+    def __init__(self, rates: Dict[str, float]) -> None:
+        """
+        Initialize the filter.
+        
+        Args:
+            rates: Mapping of logger name prefix to keep rate in [0, 1]
+        """
+        super().__init__()
+        self._rates = rates
+        self._resolved: Dict[str, float] = {}
+    
+    def _rate_for(self, name: str) -> float:
+        """Resolve and memoize the keep rate for a logger name."""
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1.0
+            prefix = name
+            while prefix:
+                if prefix in self._rates:
+                    rate = self._rates[prefix]
+                    break
+                prefix = prefix.rpartition(".")[0]
+            self._resolved[name] = rate
+        return rate
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True if the record should be emitted."""
+        if record.levelno >= logging.ERROR:
+            return True
+        rate = self._rate_for(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks and defers formatting to the listener.
+    
+    Records are dropped instead of blocking when the queue is full.
+    """
+    
+    def __init__(self, log_queue: queue.Queue) -> None:
+        """
+        Initialize the handler.
+        
+        Args:
+            log_queue: Bounded queue drained by a QueueListener
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record through unformatted; the listener is in-process."""
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(config: Settings) -> QueueListener:
+    """
+    Route all logging through a background queue listener.
+    
+    Replaces any handlers on the root logger with a non-blocking queue
+    handler; a single listener thread formats and writes records.
+    
+    Args:
+        config: Application settings
+        
+    Returns:
+        The started queue listener
+    """
+    global _listener
+    if _listener is None:
+        atexit.register(stop_logging)
+    else:
+        _listener.stop()
+    
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if config.LOG_FORMAT.lower() == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    
+    log_queue: queue.Queue = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    if config.log_sampling_rates:
+        queue_handler.addFilter(SamplingFilter(config.log_sampling_rates))
+    
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(config.LOG_LEVEL.upper())
+    
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,135 @@
+"""Response memoization for pure computation routes."""
+import hashlib
+import logging
+from typing import Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import LRUCache
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+CachedResponse = Tuple[int, List[Tuple[bytes, bytes]], bytes]
+
+
+class ResponseMemoMiddleware:
+    """
+    ASGI middleware replaying stored responses for identical requests.
+    
+    Only for routes whose response is a pure function of the request.
+    The key is a BLAKE2b digest of the method, path, query string,
+    content negotiation headers and raw body, so a hit costs one hash and
+    skips body parsing, validation, the handler and response serialization.
+    Byte-identical bodies are required; payloads differing only in
+    whitespace or key order are cached separately. Only 200 responses are
+    stored.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Iterable[str],
+        max_entries: int,
+        ttl_seconds: float,
+        max_body_bytes: int = 64 * 1024
+    ) -> None:
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The wrapped ASGI application
+            paths: Exact request paths whose responses may be memoized
+            max_entries: Maximum stored responses (LRU eviction)
+            ttl_seconds: Seconds a stored response may be replayed
+            max_body_bytes: Larger requests or responses are not stored
+        """
+        self.app = app
+        self.paths = frozenset(paths)
+        self.ttl_seconds = ttl_seconds
+        self.max_body_bytes = max_body_bytes
+        self._cache = LRUCache(max_entries)
+        self._hits = 0
+        self._misses = 0
+    
+    def _record(self, hit: bool) -> None:
+        """Update hit and miss counters and the hit ratio gauge."""
+        if hit:
+            self._hits += 1
+            metrics.increment("memo.hits")
+        else:
+            self._misses += 1
+            metrics.increment("memo.misses")
+        metrics.set_gauge("memo.hit_ratio", self._hits / (self._hits + self._misses))
+        metrics.set_gauge("memo.entries", len(self._cache))
+    
+    @staticmethod
+    def _key(scope: Scope, body: bytes) -> str:
+        """Hash everything the response may depend on."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(scope["method"].encode("ascii"))
+        digest.update(b"\0" + scope["path"].encode("utf-8"))
+        digest.update(b"\0" + scope.get("query_string", b""))
+        for name, value in scope["headers"]:
+            if name in (b"content-type", b"accept"):
+                digest.update(b"\0" + name + b"=" + value)
+        digest.update(b"\0" + body)
+        return digest.hexdigest()
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Replay a stored response or run the route and store its result."""
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        
+        chunks: List[bytes] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+        
+        key = self._key(scope, body) if len(body) <= self.max_body_bytes else None
+        cached: Optional[CachedResponse] = self._cache.get(key) if key else None
+        if cached is not None:
+            self._record(hit=True)
+            status, headers, response_body = cached
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            await send({"type": "http.response.body", "body": response_body})
+            return
+        if key:
+            self._record(hit=False)
+        
+        replayed = False
+        
+        async def replay_receive() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+        
+        start: Optional[Message] = None
+        response_chunks: List[bytes] = []
+        
+        async def capture_send(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                response_chunks.append(message.get("body", b""))
+            await send(message)
+        
+        await self.app(scope, replay_receive, capture_send)
+        
+        if key and start is not None and start["status"] == 200:
+            response_body = b"".join(response_chunks)
+            if len(response_body) <= self.max_body_bytes:
+                self._cache.set(
+                    key,
+                    (start["status"], list(start.get("headers", [])), response_body),
+                    self.ttl_seconds
+                )
@@ -0,0 +1,200 @@
+"""Opt-in per-route memory profiling based on tracemalloc."""
+import linecache
+import logging
+import resource
+import tracemalloc
+from typing import Any, Dict, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import metrics
+from app.core.route_names import RouteTemplateResolver
+
+logger = logging.getLogger(__name__)
+
+
+class RouteMemoryStats:
+    """Peak allocation summary for one route."""
+    
+    __slots__ = ("requests", "total_peak_bytes", "max_peak_bytes")
+    
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        self.requests = 0
+        self.total_peak_bytes = 0
+        self.max_peak_bytes = 0
+    
+    def record(self, peak_bytes: int) -> None:
+        """Add one request's peak allocation."""
+        self.requests += 1
+        self.total_peak_bytes += peak_bytes
+        self.max_peak_bytes = max(self.max_peak_bytes, peak_bytes)
+
+
+class MemoryProfiler:
+    """
+    Track peak traced allocation per route.
+    
+    tracemalloc keeps a single process-wide peak, so the peak is only
+    reset when no other profiled request is in flight. A request that
+    overlaps others is charged the shared peak since the last reset,
+    which makes the figures an upper bound under concurrency.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize the profiler; tracing starts with start()."""
+        self.routes: Dict[str, RouteMemoryStats] = {}
+        self._active = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether tracemalloc is tracing allocations."""
+        return tracemalloc.is_tracing()
+    
+    def start(self, frames: int = 1) -> None:
+        """
+        Start tracing allocations.
+        
+        Args:
+            frames: Stack frames stored per allocation; more frames give
+                better attribution at a higher CPU and memory cost
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            logger.info("Started memory profiling with %d frame(s) per allocation", frames)
+    
+    def stop(self) -> None:
+        """Stop tracing and forget collected stats."""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.routes.clear()
+        self._active = 0
+    
+    def begin_request(self) -> int:
+        """
+        Mark a request as started.
+        
+        Returns:
+            Traced bytes at the start of the request
+        """
+        self._active += 1
+        if self._active == 1:
+            tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+    
+    def end_request(self, route: str, start_bytes: int) -> int:
+        """
+        Mark a request as finished and record its peak allocation.
+        
+        Args:
+            route: Route the request was served by
+            start_bytes: Value returned by begin_request
+        
+        Returns:
+            Peak bytes allocated above the starting point
+        """
+        self._active = max(0, self._active - 1)
+        peak = max(0, tracemalloc.get_traced_memory()[1] - start_bytes)
+        stats = self.routes.get(route)
+        if stats is None:
+            stats = self.routes[route] = RouteMemoryStats()
+        stats.record(peak)
+        metrics.observe("memory.request_peak_bytes", peak)
+        metrics.set_gauge(f"memory.route_max_peak_bytes.{route}", stats.max_peak_bytes)
+        return peak
+    
+    def report(self, limit: int = 20) -> Dict[str, Any]:
+        """
+        Summarize traced memory, per-route peaks and top allocation sites.
+        
+        Taking the snapshot walks every traced block, so call this off
+        the event loop.
+        
+        Args:
+            limit: Maximum allocation sites to list
+        
+        Returns:
+            JSON-serializable report
+        """
+        report: Dict[str, Any] = {
+            "enabled": self.enabled,
+            "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+            "rss_bytes": _current_rss_bytes(),
+            "routes": [
+                {
+                    "route": route,
+                    "requests": stats.requests,
+                    "max_peak_bytes": stats.max_peak_bytes,
+                    "avg_peak_bytes": stats.total_peak_bytes // stats.requests,
+                }
+                for route, stats in sorted(
+                    self.routes.items(), key=lambda item: item[1].max_peak_bytes, reverse=True
+                )
+            ],
+            "top_allocations": [],
+        }
+        if not self.enabled:
+            return report
+        
+        current, peak = tracemalloc.get_traced_memory()
+        report["traced_current_bytes"] = current
+        report["traced_peak_bytes"] = peak
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        for stat in snapshot.statistics("lineno")[:limit]:
+            frame = stat.traceback[0]
+            report["top_allocations"].append({
+                "site": f"{frame.filename}:{frame.lineno}",
+                "code": linecache.getline(frame.filename, frame.lineno).strip(),
+                "size_bytes": stat.size,
+                "count": stat.count,
+            })
+        return report
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """Read the current resident set size from /proc, where available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# Global profiler for this worker process
+memory_profiler = MemoryProfiler()
+
+
+class MemoryProfilingMiddleware:
+    """
+    ASGI middleware recording each HTTP request's peak allocation by route.
+    
+    Requests are grouped by route path template (e.g. /dictionary/{word})
+    rather than raw path, so the number of routes stays bounded.
+    """
+    
+    def __init__(self, app: ASGIApp, profiler: MemoryProfiler = memory_profiler) -> None:
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The wrapped ASGI application
+            profiler: Profiler collecting the measurements
+        """
+        self.app = app
+        self.profiler = profiler
+        self.routes = RouteTemplateResolver()
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request between begin and end measurements."""
+        if scope["type"] != "http" or not self.profiler.enabled:
+            await self.app(scope, receive, send)
+            return
+        
+        start_bytes = self.profiler.begin_request()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.profiler.end_request(self.routes.label(scope), start_bytes)
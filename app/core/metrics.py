@@ -0,0 +1,85 @@
+"""In-process application metrics."""
+import threading
+from typing import Dict, Union
+
+Number = Union[int, float]
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of counters, gauges and summaries.
+    
+    Summaries keep count, sum and max, which is enough to derive means
+    without storing individual observations.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Number] = {}
+        self._gauges: Dict[str, Number] = {}
+        self._summaries: Dict[str, Dict[str, Number]] = {}
+    
+    def increment(self, name: str, value: Number = 1) -> None:
+        """
+        Increase a counter.
+        
+        Args:
+            name: Counter name
+            value: Amount to add
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+    
+    def set_gauge(self, name: str, value: Number) -> None:
+        """
+        Set a gauge to its current value.
+        
+        Args:
+            name: Gauge name
+            value: Current value
+        """
+        with self._lock:
+            self._gauges[name] = value
+    
+    def observe(self, name: str, value: Number) -> None:
+        """
+        Record one observation in a summary.
+        
+        Args:
+            name: Summary name
+            value: Observed value
+        """
+        with self._lock:
+            summary = self._summaries.get(name)
+            if summary is None:
+                summary = self._summaries[name] = {"count": 0, "sum": 0.0, "max": value}
+            summary["count"] += 1
+            summary["sum"] += value
+            if value > summary["max"]:
+                summary["max"] = value
+    
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Return a copy of all metrics.
+        
+        Returns:
+            Mapping with 'counters', 'gauges' and 'summaries' sections
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "summaries": {name: dict(s) for name, s in self._summaries.items()},
+            }
+    
+    def reset(self) -> None:
+        """Clear all metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._summaries.clear()
+
+
+# Global metrics registry
+metrics = MetricsRegistry()
@@ -0,0 +1,191 @@
+"""Per-request SQL statement counting and slow-query logging."""
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+EXPLAINABLE_STATEMENTS = ("select", "insert", "update", "delete", "with")
+
+
+class QueryStats:
+    """Statement count and total database time for one request."""
+    
+    __slots__ = ("count", "total_seconds")
+    
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        self.count = 0
+        self.total_seconds = 0.0
+
+
+# Stats of the request being served; worker threads started with
+# run_blocking share the same object through the copied context
+_current_stats: contextvars.ContextVar[Optional[QueryStats]] = contextvars.ContextVar(
+    "query_stats", default=None
+)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Return the stats of the current request, if any."""
+    return _current_stats.get()
+
+
+def _explain(cursor: Any, statement: str, parameters: Any, dialect_name: str) -> str:
+    """
+    Fetch the plan of a statement on the raw DBAPI connection.
+    
+    A separate raw cursor is used so the EXPLAIN does not re-enter the
+    engine events or disturb the original cursor's results.
+    """
+    prefix = "EXPLAIN QUERY PLAN " if dialect_name == "sqlite" else "EXPLAIN "
+    explain_cursor = cursor.connection.cursor()
+    try:
+        explain_cursor.execute(prefix + statement, parameters)
+        return "\n".join(" ".join(str(column) for column in row) for row in explain_cursor.fetchall())
+    finally:
+        explain_cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Remember when the statement started."""
+    conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Attribute the statement to the current request and log it if slow."""
+    elapsed = time.perf_counter() - conn.info["query_start_times"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.total_seconds += elapsed
+    metrics.increment("db.queries")
+    metrics.observe("db.query_seconds", elapsed)
+    
+    if elapsed < settings.DB_SLOW_QUERY_SECONDS:
+        return
+    metrics.increment("db.slow_queries")
+    plan = ""
+    if (
+        settings.DB_EXPLAIN_SLOW_QUERIES
+        and not executemany
+        and statement.lstrip().lower().startswith(EXPLAINABLE_STATEMENTS)
+    ):
+        try:
+            plan = _explain(cursor, statement, parameters, conn.dialect.name)
+        except Exception as e:
+            plan = f"<EXPLAIN failed: {e}>"
+    logger.warning(
+        "Slow query (%.1f ms): %s\nPlan:\n%s",
+        elapsed * 1000,
+        statement,
+        plan or "<not captured>"
+    )
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """
+    Attach statement timing hooks to an engine.
+    
+    Args:
+        engine: Engine whose statements are counted and timed
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class CapturedQueries:
+    """Statements executed while capture_queries() was active."""
+    
+    def __init__(self) -> None:
+        """Initialize an empty capture."""
+        self.statements: List[str] = []
+    
+    def __len__(self) -> int:
+        """Number of captured statements."""
+        return len(self.statements)
+
+
+@contextmanager
+def capture_queries(engine: Engine) -> Iterator[CapturedQueries]:
+    """
+    Record every statement an engine executes, from any thread.
+    
+    Meant for tests asserting query budgets, e.g. to catch N+1 patterns.
+    
+    Args:
+        engine: Engine to watch
+        
+    Yields:
+        The capture, filled in as statements run
+    """
+    captured = CapturedQueries()
+    
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        captured.statements.append(statement)
+    
+    event.listen(engine, "after_cursor_execute", record)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "after_cursor_execute", record)
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware collecting query stats per HTTP request.
+    
+    Publishes a db.queries_per_request summary, logs the totals at debug
+    level and, if DB_QUERY_STATS_HEADERS is enabled, reports them in
+    X-DB-Query-Count and X-DB-Query-Time-Ms response headers.
+    """
+    
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The wrapped ASGI application
+        """
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request with fresh stats bound to its context."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.DB_QUERY_STATS_HEADERS:
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (b"x-db-query-count", str(stats.count).encode("ascii")),
+                    (b"x-db-query-time-ms", f"{stats.total_seconds * 1000:.2f}".encode("ascii")),
+                ]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current_stats.reset(token)
+            if stats.count:
+                metrics.observe("db.queries_per_request", stats.count)
+                logger.debug(
+                    "%s %s issued %d queries in %.1f ms",
+                    scope["method"],
+                    scope["path"],
+                    stats.count,
+                    stats.total_seconds * 1000
+                )
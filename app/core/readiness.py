@@ -0,0 +1,59 @@
+"""Readiness tracking for startup dependencies."""
+import threading
+from typing import Dict
+
+
+class ReadinessState:
+    """
+    Track which startup checks have completed.
+    
+    The application is ready once every registered check has passed.
+    Liveness is independent of this state.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize with no registered checks."""
+        self._lock = threading.Lock()
+        self._checks: Dict[str, bool] = {}
+    
+    def register(self, name: str) -> None:
+        """
+        Register a check that must pass before the app reports ready.
+        
+        Args:
+            name: Check name, e.g. 'database'
+        """
+        with self._lock:
+            self._checks.setdefault(name, False)
+    
+    def mark(self, name: str, ok: bool = True) -> None:
+        """
+        Record the outcome of a check.
+        
+        Args:
+            name: Check name
+            ok: Whether the check passed
+        """
+        with self._lock:
+            self._checks[name] = ok
+    
+    @property
+    def is_ready(self) -> bool:
+        """True when every registered check has passed."""
+        with self._lock:
+            return all(self._checks.values())
+    
+    @property
+    def checks(self) -> Dict[str, bool]:
+        """Copy of the current check outcomes."""
+        with self._lock:
+            return dict(self._checks)
+    
+    def reset(self) -> None:
+        """Forget all registered checks."""
+        with self._lock:
+            self._checks.clear()
+
+
+# Global readiness state
+readiness = ReadinessState()
@@ -0,0 +1,50 @@
+"""Resolve the route template an ASGI request was dispatched to."""
+from typing import Any, Dict, List
+
+from starlette.routing import Match
+from starlette.types import Scope
+
+
+class RouteTemplateResolver:
+    """
+    Map requests to route path templates such as /dictionary/{word}.
+    
+    Templates rather than raw paths keep per-route labels bounded. The
+    router records the matched endpoint in the scope; requests answered
+    by an outer middleware (e.g. a memoized replay) never reach it, so
+    those are matched against the application's routes instead.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty endpoint cache."""
+        self._paths: Dict[Any, str] = {}
+    
+    def resolve(self, scope: Scope) -> str:
+        """
+        Resolve the route template for a finished request.
+        
+        Args:
+            scope: ASGI scope of the request
+        
+        Returns:
+            The route's path template, or 'unmatched'
+        """
+        routes: List[Any] = getattr(scope.get("app"), "routes", [])
+        endpoint = scope.get("endpoint")
+        path = self._paths.get(endpoint) if endpoint is not None else None
+        if path is not None:
+            return path
+        for route in routes:
+            if endpoint is not None:
+                matched = getattr(route, "endpoint", None) is endpoint
+            else:
+                matched = route.matches(scope)[0] == Match.FULL
+            if matched:
+                if endpoint is not None:
+                    self._paths[endpoint] = route.path
+                return route.path
+        return "unmatched"
+    
+    def label(self, scope: Scope) -> str:
+        """Resolve the request as 'METHOD template'."""
+        return f"{scope['method']} {self.resolve(scope)}"
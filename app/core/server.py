@@ -0,0 +1,266 @@
+"""Production server runner: pre-forked uvicorn workers sized to the CPU quota."""
+import importlib.util
+import logging
+import math
+import os
+import signal
+import socket
+from typing import Dict, Optional
+
+import uvicorn
+
+from app.core.config import Settings, settings
+from app.core.logging_config import configure_logging, stop_logging
+
+logger = logging.getLogger(__name__)
+
+APP_IMPORT_PATH = "app.main:app"
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def _read_first_line(path: str) -> Optional[str]:
+    """Return the first line of a file, or None if it cannot be read."""
+    try:
+        with open(path) as handle:
+            return handle.readline().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit(
+    cpu_max_path: str = CGROUP_V2_CPU_MAX,
+    quota_path: str = CGROUP_V1_QUOTA,
+    period_path: str = CGROUP_V1_PERIOD
+) -> Optional[float]:
+    """
+    Read the container CPU limit from the cgroup filesystem.
+    
+    Checks cgroup v2 ``cpu.max`` first and falls back to the v1 CFS
+    quota and period files.
+    
+    Args:
+        cpu_max_path: cgroup v2 cpu.max file
+        quota_path: cgroup v1 CFS quota file
+        period_path: cgroup v1 CFS period file
+    
+    Returns:
+        CPUs available to the container, or None if unlimited or unknown
+    """
+    cpu_max = _read_first_line(cpu_max_path)
+    if cpu_max:
+        quota, _, period = cpu_max.partition(" ")
+        if quota == "max":
+            return None
+        try:
+            return int(quota) / int(period or "100000")
+        except ValueError:
+            return None
+    
+    quota, period = _read_first_line(quota_path), _read_first_line(period_path)
+    try:
+        if quota is not None and period is not None and int(quota) > 0:
+            return int(quota) / int(period)
+    except ValueError:
+        pass
+    return None
+
+
+def available_cpus() -> int:
+    """
+    Count the CPUs this process may actually run on.
+    
+    Takes the smallest of the CPU affinity mask and the cgroup quota,
+    rounded up so a 1.5 CPU limit still gets two workers.
+    
+    Returns:
+        Usable CPU count, at least 1
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(1, cpus)
+
+
+def resolve_worker_count(config: Settings) -> int:
+    """
+    Resolve the number of worker processes.
+    
+    Args:
+        config: Application settings
+    
+    Returns:
+        SERVER_WORKERS, or the usable CPU count when it is 0
+    """
+    return config.SERVER_WORKERS or available_cpus()
+
+
+def build_uvicorn_config(config: Settings) -> uvicorn.Config:
+    """
+    Build the uvicorn configuration for one worker.
+    
+    uvloop and httptools are selected explicitly when installed so the
+    choice is logged rather than left to uvicorn's silent fallback.
+    Logging is left to the app's own configuration.
+    
+    Args:
+        config: Application settings
+    
+    Returns:
+        uvicorn configuration serving the FastAPI app
+    """
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    return uvicorn.Config(
+        APP_IMPORT_PATH,
+        host=config.SERVER_HOST,
+        port=config.SERVER_PORT,
+        loop=loop,
+        http=http,
+        backlog=config.SERVER_BACKLOG,
+        timeout_keep_alive=config.SERVER_KEEPALIVE_TIMEOUT,
+        timeout_graceful_shutdown=config.SERVER_GRACEFUL_TIMEOUT,
+        log_config=None,
+        access_log=False
+    )
+
+
+def _preload_app(uvicorn_config: uvicorn.Config) -> None:
+    """Import the app in the parent so forked workers share its pages."""
+    uvicorn_config.load()
+    if settings.DICTIONARY_SNAPSHOT_PATH and os.path.exists(settings.DICTIONARY_SNAPSHOT_PATH):
+        from app.dictionary.snapshot import snapshot_store
+        
+        snapshot_store.refresh(settings.DICTIONARY_SNAPSHOT_PATH)
+
+
+def _run_worker(uvicorn_config: uvicorn.Config, sock: socket.socket) -> None:
+    """
+    Serve requests in a forked worker until told to exit.
+    
+    Threads and pooled connections do not survive a fork, so the log
+    listener is restarted and inherited database connections are dropped
+    without being closed.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    configure_logging(settings)
+    if uvicorn_config.loaded:
+        from app.core.database import engine
+        
+        engine.dispose(close=False)
+    uvicorn.Server(uvicorn_config).run(sockets=[sock])
+
+
+class WorkerSupervisor:
+    """
+    Pre-fork supervisor sharing one listening socket between workers.
+    
+    Workers that die unexpectedly are replaced. SIGTERM or SIGINT is
+    forwarded to every worker, which stops accepting connections and
+    drains in-flight requests for up to SERVER_GRACEFUL_TIMEOUT seconds.
+    """
+    
+    def __init__(self, uvicorn_config: uvicorn.Config, workers: int) -> None:
+        """
+        Initialize the supervisor.
+        
+        Args:
+            uvicorn_config: Configuration shared by all workers
+            workers: Number of worker processes to keep running
+        """
+        self.uvicorn_config = uvicorn_config
+        self.workers = workers
+        self.draining = False
+        self._children: Dict[int, int] = {}
+        self._socket: Optional[socket.socket] = None
+    
+    def _spawn(self, slot: int) -> None:
+        """Fork a worker for the given slot."""
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                _run_worker(self.uvicorn_config, self._socket)
+            except BaseException:
+                logger.exception("Worker %d crashed", os.getpid())
+                exit_code = 1
+            finally:
+                stop_logging()
+                os._exit(exit_code)
+        self._children[pid] = slot
+        logger.info("Started worker %d (pid %d)", slot, pid)
+    
+    def _handle_signal(self, signum: int, frame: object) -> None:
+        """Start draining and forward the signal to every worker."""
+        self.draining = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+    
+    def run(self) -> None:
+        """Bind the socket, fork the workers and supervise them until drained."""
+        self._socket = self.uvicorn_config.bind_socket()
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+        
+        for slot in range(self.workers):
+            self._spawn(slot)
+        
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            slot = self._children.pop(pid, None)
+            if slot is None:
+                continue
+            if not self.draining:
+                logger.warning(
+                    "Worker %d (pid %d) exited with status %d; restarting",
+                    slot,
+                    pid,
+                    os.waitstatus_to_exitcode(status)
+                )
+                self._spawn(slot)
+        
+        self._socket.close()
+        logger.info("All workers stopped")
+
+
+def run_server(config: Settings = settings) -> None:
+    """
+    Run the API server as configured by Settings.
+    
+    A single worker runs uvicorn in this process; more workers are
+    pre-forked from it, optionally after importing the app once
+    (SERVER_PRELOAD) so they share its memory copy-on-write.
+    
+    Args:
+        config: Application settings
+    """
+    uvicorn_config = build_uvicorn_config(config)
+    workers = resolve_worker_count(config)
+    logger.info(
+        "Serving on %s:%d with %d worker(s), loop=%s, http=%s",
+        config.SERVER_HOST,
+        config.SERVER_PORT,
+        workers,
+        uvicorn_config.loop,
+        uvicorn_config.http
+    )
+    
+    if workers == 1:
+        uvicorn.Server(uvicorn_config).run()
+        return
+    
+    if config.SERVER_PRELOAD:
+        _preload_app(uvicorn_config)
+    WorkerSupervisor(uvicorn_config, workers).run()
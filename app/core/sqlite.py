@@ -0,0 +1,121 @@
+"""SQLite tuning for single-node deployments: PRAGMA profile and serialized writers."""
+import logging
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import Settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+WRITE_LOCK_KEY = "sqlite_write_lock_held"
+
+
+def sqlite_pragmas(config: Settings) -> dict:
+    """
+    Build the PRAGMA profile applied to every new SQLite connection.
+    
+    WAL lets readers proceed while a writer commits; NORMAL sync is safe
+    in WAL mode and only risks the last transactions on power loss.
+    
+    Args:
+        config: Application settings
+    
+    Returns:
+        Ordered mapping of PRAGMA name to value
+    """
+    return {
+        "journal_mode": "WAL",
+        "synchronous": config.SQLITE_SYNCHRONOUS,
+        "busy_timeout": config.SQLITE_BUSY_TIMEOUT_MS,
+        "cache_size": -config.SQLITE_CACHE_SIZE_KB,
+        "mmap_size": config.SQLITE_MMAP_SIZE,
+        "temp_store": "MEMORY",
+    }
+
+
+class SQLiteWriteLock:
+    """
+    Process-wide lock letting one connection write at a time.
+    
+    SQLite allows a single writer per database. Queuing writers on a lock
+    instead of on SQLITE_BUSY retries keeps them fair and leaves readers,
+    which never take the lock, free to run concurrently under WAL.
+    """
+    
+    def __init__(self, timeout_seconds: float) -> None:
+        """
+        Initialize the lock.
+        
+        Args:
+            timeout_seconds: Max wait before writing without the lock and
+                leaving it to SQLite's busy timeout
+        """
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+    
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        """Take the lock before a connection's first write in a transaction."""
+        if conn.info.get(WRITE_LOCK_KEY) or not _is_write(context, statement):
+            return
+        started = time.perf_counter()
+        acquired = self._lock.acquire(timeout=self.timeout_seconds)
+        metrics.observe("sqlite.write_lock_wait_seconds", time.perf_counter() - started)
+        if acquired:
+            conn.info[WRITE_LOCK_KEY] = True
+        else:
+            metrics.increment("sqlite.write_lock_timeouts")
+            logger.warning("Timed out waiting for the SQLite write lock; writing anyway")
+    
+    def end_transaction(self, conn) -> None:
+        """Release the lock once the connection commits or rolls back."""
+        self._release(conn.info)
+    
+    def checkin(self, dbapi_connection: Any, connection_record: Any) -> None:
+        """Release the lock if a connection returns to the pool still holding it."""
+        self._release(connection_record.info)
+    
+    def _release(self, info: dict) -> None:
+        """Release the lock if the connection owning info holds it."""
+        if info.pop(WRITE_LOCK_KEY, False):
+            self._lock.release()
+
+
+def _is_write(context: Any, statement: str) -> bool:
+    """Return True if a statement modifies the database."""
+    if context is not None and (context.isinsert or context.isupdate or context.isdelete or context.isddl):
+        return True
+    return not statement.lstrip()[:7].upper().startswith(("SELECT", "PRAGMA", "EXPLAIN", "WITH"))
+
+
+def install_sqlite_profile(engine: Engine, config: Settings) -> None:
+    """
+    Apply the PRAGMA profile and, optionally, the writer lock to an engine.
+    
+    Args:
+        engine: SQLite engine to tune
+        config: Application settings
+    """
+    pragmas = sqlite_pragmas(config)
+    
+    def apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+    
+    event.listen(engine, "connect", apply_pragmas)
+    
+    if config.SQLITE_SERIALIZE_WRITES:
+        write_lock = SQLiteWriteLock(config.SQLITE_BUSY_TIMEOUT_MS / 1000)
+        event.listen(engine, "before_cursor_execute", write_lock.before_cursor_execute)
+        event.listen(engine, "commit", write_lock.end_transaction)
+        event.listen(engine, "rollback", write_lock.end_transaction)
+        event.listen(engine, "checkin", write_lock.checkin)
+    logger.debug("Applied SQLite profile: %s", pragmas)
@@ -1,37 +1,60 @@
 """Application startup logic."""
-import time
+import asyncio
 import logging
+from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import engine, init_db
 from app.core.exceptions import DatabaseConnectionError
+from app.core.executor import run_blocking
+from app.core.readiness import readiness
 
 logger = logging.getLogger(__name__)
 
 
-def wait_for_database() -> None:
+def check_database() -> None:
     """
-    Wait for database to be ready with retries.
+    Verify the database is reachable and optionally create the schema.
     
-    Implements retry logic with exponential backoff for database connectivity.
-    Follows Single Responsibility Principle - handles only startup database connection.
+    Schema creation is skipped unless DB_CREATE_SCHEMA_ON_STARTUP is set;
+    production schemas are managed with Alembic migrations.
+    
+    Raises:
+        OperationalError: If the database cannot be reached
+    """
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    if settings.DB_CREATE_SCHEMA_ON_STARTUP:
+        init_db()
+
+
+async def wait_for_database() -> None:
+    """
+    Wait for the database to be ready without blocking the event loop.
+    
+    Connection attempts run on the service executor and retries sleep
+    asynchronously, so the server keeps answering liveness probes while
+    the database comes up. Marks the 'database' readiness check on success.
     
     Raises:
         DatabaseConnectionError: If database is not available after max retries
     """
     for attempt in range(settings.DB_MAX_RETRIES):
         try:
-            init_db()
+            await run_blocking(check_database)
+            readiness.mark("database")
             logger.info("Database initialized successfully")
             return
         except OperationalError as e:
             if attempt < settings.DB_MAX_RETRIES - 1:
                 logger.warning(
-                    f"Database not ready, retrying in {settings.DB_RETRY_DELAY}s... "
-                    f"(attempt {attempt + 1}/{settings.DB_MAX_RETRIES})"
+                    "Database not ready, retrying in %ss... (attempt %d/%d)",
+                    settings.DB_RETRY_DELAY,
+                    attempt + 1,
+                    settings.DB_MAX_RETRIES
                 )
-                time.sleep(settings.DB_RETRY_DELAY)
+                await asyncio.sleep(settings.DB_RETRY_DELAY)
             else:
                 error_message = (
                     f"Failed to connect to database after "
@@ -39,4 +62,3 @@ def wait_for_database() -> None:
                 )
                 logger.error(error_message)
                 raise DatabaseConnectionError(error_message) from e
-
@@ -0,0 +1,615 @@
+"""Lightweight tracing with W3C trace context and OpenTelemetry-style spans."""
+import atexit
+import contextvars
+import functools
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import Settings
+from app.core.metrics import metrics
+from app.core.route_names import RouteTemplateResolver
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SERVER = "SPAN_KIND_SERVER"
+INTERNAL = "SPAN_KIND_INTERNAL"
+CLIENT = "SPAN_KIND_CLIENT"
+
+MAX_STATEMENT_LENGTH = 2048
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?$")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+
+def parse_traceparent(header: str) -> Optional[Tuple[str, str, bool]]:
+    """
+    Parse a W3C traceparent header.
+    
+    Args:
+        header: Header value, e.g. 00-<trace-id>-<parent-id>-01
+    
+    Returns:
+        (trace_id, parent_span_id, sampled), or None if the header is invalid
+    """
+    match = _TRACEPARENT.match(header.strip())
+    if match is None:
+        return None
+    version, trace_id, parent_id, flags, rest = match.groups()
+    if version == "ff" or (version == "00" and rest):
+        return None
+    if trace_id == _INVALID_TRACE_ID or parent_id == _INVALID_SPAN_ID:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 0x01)
+
+
+def format_traceparent(trace_id: str, span_id: str, sampled: bool = True) -> str:
+    """Format a version 00 W3C traceparent header."""
+    return f"00-{trace_id}-{span_id}-{'01' if sampled else '00'}"
+
+
+class ParentBasedRatioSampler:
+    """
+    Sample a fixed fraction of new traces and follow the caller's decision.
+    
+    Traces started here are sampled on the low 64 bits of the trace id,
+    like OpenTelemetry's TraceIdRatioBased sampler, so every service using
+    the same ratio keeps the same traces.
+    """
+    
+    def __init__(self, ratio: float) -> None:
+        """
+        Initialize the sampler.
+        
+        Args:
+            ratio: Fraction of new traces to sample, between 0 and 1
+        """
+        self.ratio = min(max(ratio, 0.0), 1.0)
+        self._bound = int(self.ratio * (1 << 64))
+    
+    def should_sample(self, trace_id: str, parent_sampled: Optional[bool]) -> bool:
+        """
+        Decide whether a trace is recorded.
+        
+        Args:
+            trace_id: Hex trace id
+            parent_sampled: Sampled flag from the incoming traceparent, if any
+        
+        Returns:
+            True if spans of this trace should be recorded
+        """
+        if parent_sampled is not None:
+            return parent_sampled
+        return int(trace_id[16:], 16) < self._bound
+
+
+class Span:
+    """A timed operation within a trace."""
+    
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "kind",
+        "start_ns", "end_ns", "attributes", "error", "_tracer",
+    )
+    
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        kind: str,
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Start a span.
+        
+        Args:
+            tracer: Tracer the finished span is reported to
+            name: Operation name
+            trace_id: Hex id of the trace the span belongs to
+            parent_id: Hex id of the parent span, None for a root span
+            kind: One of SERVER, INTERNAL or CLIENT
+            attributes: Initial attributes
+        """
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64) or 1:016x}"
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = attributes if attributes is not None else {}
+        self.error: Optional[str] = None
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set one attribute."""
+        self.attributes[key] = value
+    
+    def record_exception(self, exc: BaseException) -> None:
+        """Mark the span as failed by an exception."""
+        self.error = f"{type(exc).__name__}: {exc}"
+        self.attributes["exception.type"] = type(exc).__name__
+    
+    def end(self) -> None:
+        """Finish the span and hand it to the tracer's processor."""
+        if not self.end_ns:
+            self.end_ns = time.time_ns()
+            self._tracer.on_end(self)
+    
+    def to_dict(self, resource: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize the span using OpenTelemetry field names."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": self.attributes,
+            "status": (
+                {"code": "STATUS_CODE_ERROR", "message": self.error}
+                if self.error else {"code": "STATUS_CODE_UNSET"}
+            ),
+            "resource": resource,
+        }
+
+
+# Recording span of the current request; unset when tracing is off or the
+# trace was not sampled, so unsampled requests create no spans at all.
+# run_blocking copies the context, so worker threads see it too.
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+def current_span() -> Optional[Span]:
+    """Return the recording span of the current context, if any."""
+    return _current_span.get()
+
+
+class ConsoleSpanExporter:
+    """Write finished spans to a stream as JSON lines."""
+    
+    def __init__(self, stream: Optional[IO[str]] = None) -> None:
+        """
+        Initialize the exporter.
+        
+        Args:
+            stream: Destination stream, stdout by default
+        """
+        self.stream = stream or sys.stdout
+    
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        """Write a batch of serialized spans."""
+        self.stream.write("".join(json.dumps(span, default=str) + "\n" for span in spans))
+        self.stream.flush()
+    
+    def shutdown(self) -> None:
+        """Nothing to release."""
+        pass
+
+
+class FileSpanExporter(ConsoleSpanExporter):
+    """Append finished spans to a local file as JSON lines."""
+    
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the exporter; the file is opened on first export.
+        
+        Args:
+            path: File to append to
+        """
+        self.path = path
+        self.stream = None
+    
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        """Append a batch of serialized spans."""
+        if self.stream is None:
+            self.stream = open(self.path, "a", encoding="utf-8")
+        super().export(spans)
+    
+    def shutdown(self) -> None:
+        """Close the file."""
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+
+class BatchSpanProcessor:
+    """
+    Queue finished spans and export them in batches from a background thread.
+    
+    Ending a span never blocks: spans are dropped when the queue is full.
+    The export thread is started lazily in the process that ends the
+    first span, so workers forked from a preloaded app get their own.
+    """
+    
+    def __init__(
+        self,
+        exporter: Any,
+        resource: Dict[str, Any],
+        max_queue_size: int = 2048,
+        batch_size: int = 256,
+        flush_interval_seconds: float = 1.0
+    ) -> None:
+        """
+        Initialize the processor.
+        
+        Args:
+            exporter: Object with export(spans) and shutdown() methods
+            resource: Resource attributes attached to every span
+            max_queue_size: Spans buffered before new ones are dropped
+            batch_size: Maximum spans per export call
+            flush_interval_seconds: Longest a span waits before export
+        """
+        self.exporter = exporter
+        self.resource = resource
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._pid = 0
+        self._lock = threading.Lock()
+    
+    def on_end(self, span: Span) -> None:
+        """Enqueue a finished span."""
+        if self._pid != os.getpid():
+            self._start()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            metrics.increment("tracing.spans_dropped")
+    
+    def _start(self) -> None:
+        """Start the export thread for this process."""
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=self.max_queue_size)
+            self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+    
+    def _run(self) -> None:
+        """Export batches until a stop sentinel is received."""
+        spans_queue = self._queue
+        stopping = False
+        while not stopping:
+            batch: List[Span] = []
+            deadline = time.monotonic() + self.flush_interval_seconds
+            while len(batch) < self.batch_size:
+                try:
+                    span = spans_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if span is None:
+                    stopping = True
+                    break
+                batch.append(span)
+            if batch:
+                self._export(batch)
+    
+    def _export(self, batch: List[Span]) -> None:
+        """Serialize and export one batch."""
+        try:
+            self.exporter.export([span.to_dict(self.resource) for span in batch])
+            metrics.increment("tracing.spans_exported", len(batch))
+        except Exception as e:
+            metrics.increment("tracing.export_errors")
+            logger.warning("Failed to export %d spans: %s", len(batch), e)
+    
+    def shutdown(self) -> None:
+        """Export queued spans and stop the thread."""
+        if self._thread is not None and self._pid == os.getpid():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+        self._thread = None
+        self._pid = 0
+        self.exporter.shutdown()
+
+
+class Tracer:
+    """
+    Create spans for sampled requests.
+    
+    Until configured, or for requests that were not sampled, every entry
+    point is a no-op costing one context variable lookup.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize a disabled tracer."""
+        self.sampler = ParentBasedRatioSampler(0.0)
+        self.processor: Optional[BatchSpanProcessor] = None
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are being exported."""
+        return self.processor is not None
+    
+    def configure(self, sampler: ParentBasedRatioSampler, processor: BatchSpanProcessor) -> None:
+        """
+        Enable tracing.
+        
+        Args:
+            sampler: Decides which new traces are recorded
+            processor: Receives finished spans
+        """
+        self.sampler = sampler
+        self.processor = processor
+    
+    def shutdown(self) -> None:
+        """Flush finished spans and disable tracing."""
+        if self.processor is not None:
+            self.processor.shutdown()
+            self.processor = None
+    
+    def on_end(self, span: Span) -> None:
+        """Pass a finished span to the processor."""
+        if self.processor is not None:
+            self.processor.on_end(span)
+    
+    def start_root_span(
+        self,
+        name: str,
+        traceparent: Optional[str],
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> Optional[Span]:
+        """
+        Start a server span for an incoming request.
+        
+        Args:
+            name: Span name
+            traceparent: Incoming traceparent header, if any
+            attributes: Initial attributes
+        
+        Returns:
+            The span, or None if tracing is off or the trace is not sampled
+        """
+        if self.processor is None:
+            return None
+        parent = parse_traceparent(traceparent) if traceparent else None
+        if parent is None:
+            trace_id, parent_id, parent_sampled = f"{random.getrandbits(128) or 1:032x}", None, None
+        else:
+            trace_id, parent_id, parent_sampled = parent
+        if not self.sampler.should_sample(trace_id, parent_sampled):
+            return None
+        return Span(self, name, trace_id, parent_id, SERVER, attributes)
+    
+    def start_child_span(
+        self,
+        name: str,
+        kind: str = INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> Optional[Span]:
+        """
+        Start a span under the current span without activating it.
+        
+        Returns:
+            The span, or None if there is no recording span to attach to
+        """
+        parent = _current_span.get()
+        if parent is None:
+            return None
+        return Span(self, name, parent.trace_id, parent.span_id, kind, attributes)
+    
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        kind: str = INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Optional[Span]]:
+        """
+        Run a block inside a child span of the current span.
+        
+        Args:
+            name: Span name
+            kind: Span kind
+            attributes: Initial attributes
+        
+        Yields:
+            The active span, or None if the current request is not traced
+        """
+        span = self.start_child_span(name, kind, attributes)
+        if span is None:
+            yield None
+            return
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+
+# Global tracer for this process
+tracer = Tracer()
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorate a synchronous function to run inside a child span.
+    
+    Args:
+        name: Span name, the function's qualified name by default
+    
+    Returns:
+        The decorator
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        span_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with tracer.start_span(span_name):
+                return func(*args, **kwargs)
+        
+        return wrapper
+    
+    return decorator
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Start a client span for the statement if the request is traced."""
+    span = None
+    if _current_span.get() is not None:
+        operation = statement.lstrip().split(None, 1)
+        span = tracer.start_child_span(
+            operation[0].upper() if operation else "SQL",
+            CLIENT,
+            {
+                "db.system": conn.dialect.name,
+                "db.statement": statement[:MAX_STATEMENT_LENGTH],
+            }
+        )
+    conn.info.setdefault("trace_spans", []).append(span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Finish the statement's span."""
+    span = conn.info["trace_spans"].pop()
+    if span is not None:
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            span.set_attribute("db.rowcount", cursor.rowcount)
+        span.end()
+
+
+def _handle_error(exception_context) -> None:
+    """Finish the failed statement's span with the error."""
+    conn = exception_context.connection
+    spans = conn.info.get("trace_spans") if conn is not None else None
+    if spans:
+        span = spans.pop()
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.end()
+
+
+def install_tracing_hooks(engine: Engine) -> None:
+    """
+    Attach statement span hooks to an engine.
+    
+    Args:
+        engine: Engine whose statements are traced
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def configure_tracing(config: Settings) -> None:
+    """
+    Enable the global tracer from settings.
+    
+    Args:
+        config: Application settings
+    """
+    if not config.TRACING_ENABLED or tracer.enabled:
+        return
+    if config.TRACING_EXPORTER.lower() == "file":
+        exporter: Any = FileSpanExporter(config.TRACING_EXPORT_PATH)
+    else:
+        exporter = ConsoleSpanExporter()
+    processor = BatchSpanProcessor(
+        exporter,
+        resource={"service.name": config.APP_NAME, "service.version": config.APP_VERSION},
+        max_queue_size=config.TRACING_QUEUE_SIZE
+    )
+    tracer.configure(ParentBasedRatioSampler(config.TRACING_SAMPLE_RATIO), processor)
+    atexit.register(tracer.shutdown)
+    logger.info(
+        "Tracing enabled: sampling %.1f%% of new traces to %s",
+        config.TRACING_SAMPLE_RATIO * 100,
+        config.TRACING_EXPORTER
+    )
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware tracing each HTTP request as a server span.
+    
+    The W3C traceparent header continues the caller's trace and its
+    sampled flag is honoured. Spans are named 'METHOD /route/{template}'
+    and sampled requests get a traceresponse header carrying the trace id.
+    """
+    
+    def __init__(self, app: ASGIApp, tracer: Tracer = tracer) -> None:
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The wrapped ASGI application
+            tracer: Tracer creating the spans
+        """
+        self.app = app
+        self.tracer = tracer
+        self.routes = RouteTemplateResolver()
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request inside a server span."""
+        if scope["type"] != "http" or not self.tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+        
+        traceparent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+        span = self.tracer.start_root_span(
+            scope["method"],
+            traceparent,
+            {"http.request.method": scope["method"], "url.path": scope["path"]}
+        )
+        if span is None:
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_trace(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                span.set_attribute("http.response.status_code", message["status"])
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"traceresponse", format_traceparent(span.trace_id, span.span_id).encode("ascii")),
+                ]
+            await send(message)
+        
+        token = _current_span.set(span)
+        try:
+            await self.app(scope, receive, send_with_trace)
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            route = self.routes.resolve(scope)
+            span.name = f"{scope['method']} {route}"
+            span.set_attribute("http.route", route)
+            if span.attributes.get("http.response.status_code", 500) >= 500 and span.error is None:
+                span.error = "Server error"
+            span.end()
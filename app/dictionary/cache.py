@@ -0,0 +1,141 @@
+"""Two-tier cache for dictionary lookups."""
+import json
+from typing import Any, Optional
+
+from app.core.cache import CacheBackend, LRUCache, TieredCache, create_cache_backend
+from app.core.config import settings
+from app.dictionary.records import DictionaryRecord
+
+
+def normalize_word(word: str) -> str:
+    """
+    Normalize a word for case-insensitive lookups.
+    
+    Args:
+        word: The word as given by the caller
+        
+    Returns:
+        Lowercased word without surrounding whitespace
+    """
+    return word.strip().lower()
+
+
+def _encode_entry(entry: DictionaryRecord) -> bytes:
+    """Serialize an entry for the shared cache tier."""
+    return json.dumps(
+        {"id": entry.id, "word": entry.word, "definition": entry.definition},
+        ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _decode_entry(raw: bytes) -> DictionaryRecord:
+    """Rebuild a record from the shared cache tier."""
+    return DictionaryRecord(**json.loads(raw))
+
+
+class DictionaryCache:
+    """
+    Cache of dictionary entries keyed by normalized word.
+    
+    Entries are stored as compact DictionaryRecord values rather than ORM
+    instances, so cached words do not keep SQLAlchemy state alive. An
+    in-process LRU (L1) sits in front of an optional shared backend (L2)
+    so every worker and replica can reuse lookups made by the others.
+    """
+    
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        shared: Optional[CacheBackend] = None,
+        shared_ttl_seconds: Optional[float] = None
+    ) -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries in the L1 tier
+            ttl_seconds: Seconds an entry stays in L1
+            shared: Optional shared L2 backend
+            shared_ttl_seconds: Seconds an entry stays in L2 (defaults to ttl_seconds)
+        """
+        self._tiers: TieredCache[DictionaryRecord] = TieredCache(
+            l1=LRUCache(max_size),
+            l2=shared,
+            encode=_encode_entry,
+            decode=_decode_entry,
+            l1_ttl=ttl_seconds,
+            l2_ttl=shared_ttl_seconds or ttl_seconds
+        )
+    
+    def get(self, word: str) -> Optional[DictionaryRecord]:
+        """
+        Look up a cached entry.
+        
+        Args:
+            word: The word to look up (any case)
+            
+        Returns:
+            The cached entry, or None on a miss
+        """
+        return self._tiers.get(normalize_word(word))
+    
+    def get_stale(self, word: str) -> Optional[DictionaryRecord]:
+        """
+        Look up an entry in the in-process tier even if it has expired.
+        
+        Args:
+            word: The word to look up (any case)
+            
+        Returns:
+            The cached entry, possibly stale, or None if it was evicted
+        """
+        return self._tiers.get_stale(normalize_word(word))
+    
+    def set(self, word: str, entry: Any) -> None:
+        """
+        Store an entry in both tiers.
+        
+        Args:
+            word: The entry's word (any case)
+            entry: ORM entry or record to cache; it is copied into a record
+        """
+        self._tiers.set(normalize_word(word), DictionaryRecord.from_entry(entry))
+    
+    def invalidate(self, word: str) -> None:
+        """
+        Remove an entry from both tiers.
+        
+        Args:
+            word: The word to remove (any case)
+        """
+        self._tiers.delete(normalize_word(word))
+    
+    def invalidate_local(self, word: str) -> None:
+        """
+        Remove an entry from the in-process tier only.
+        
+        Used when another worker reports a change; it already invalidated
+        the shared tier.
+        
+        Args:
+            word: The word to remove (any case)
+        """
+        self._tiers.l1.delete(normalize_word(word))
+    
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        self._tiers.clear()
+    
+    def __len__(self) -> int:
+        """Number of entries in the L1 tier."""
+        return len(self._tiers.l1)
+
+
+# Global dictionary cache shared by all requests in this process
+dictionary_cache = DictionaryCache(
+    max_size=settings.DICTIONARY_CACHE_SIZE,
+    ttl_seconds=settings.DICTIONARY_CACHE_TTL,
+    shared=create_cache_backend(settings, "dictionary"),
+    shared_ttl_seconds=settings.DICTIONARY_CACHE_L2_TTL
+)
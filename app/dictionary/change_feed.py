@@ -0,0 +1,151 @@
+"""Cross-worker change feed for dictionary invalidation."""
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.executor import run_blocking
+from app.core.metrics import metrics
+from app.dictionary.cache import dictionary_cache
+from app.dictionary.repository import DictionaryRepository
+
+logger = logging.getLogger(__name__)
+
+ChangeSubscriber = Callable[[str, str], None]
+
+
+class ChangeFeed:
+    """
+    Poll the dictionary_changes outbox and fan changes out to subscribers.
+    
+    Writers append a row in the same transaction as the dictionary write,
+    so every committed change is eventually seen by every worker of every
+    replica. Each worker keeps its own cursor; subscribers are called with
+    (word, operation) for each change after the cursor.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize a feed with no cursor and no subscribers."""
+        self._lock = threading.Lock()
+        self._subscribers: List[ChangeSubscriber] = []
+        self._cursor: Optional[int] = None
+    
+    def subscribe(self, callback: ChangeSubscriber) -> None:
+        """
+        Register a callback for every change seen by this worker.
+        
+        Args:
+            callback: Called with (word, operation)
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+    
+    def unsubscribe(self, callback: ChangeSubscriber) -> None:
+        """
+        Remove a previously registered callback.
+        
+        Args:
+            callback: The callback to remove
+        """
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+    
+    def reset(self) -> None:
+        """Forget the cursor so the next poll starts from the newest change."""
+        self._cursor = None
+    
+    def poll(self, repository: DictionaryRepository) -> int:
+        """
+        Deliver changes recorded since the last poll.
+        
+        The first poll only positions the cursor at the newest change:
+        caches start empty, so older changes need no invalidation.
+        
+        Args:
+            repository: Repository to read changes from
+            
+        Returns:
+            Number of changes delivered
+        """
+        if self._cursor is None:
+            self._cursor = repository.latest_change_id()
+            return 0
+        
+        changes = repository.find_changes_after(
+            self._cursor, settings.DICTIONARY_CHANGE_BATCH_SIZE
+        )
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for change in changes:
+            for callback in subscribers:
+                try:
+                    callback(change.word, change.operation)
+                except Exception as e:
+                    logger.warning("Change subscriber failed for '%s': %s", change.word, e)
+            self._cursor = change.id
+        
+        if changes:
+            metrics.increment("dictionary.changes_applied", len(changes))
+            logger.debug("Applied %d dictionary changes", len(changes))
+        return len(changes)
+
+
+# Global change feed for this worker process
+change_feed = ChangeFeed()
+change_feed.subscribe(lambda word, operation: dictionary_cache.invalidate_local(word))
+
+
+def poll_changes() -> int:
+    """
+    Poll the change feed using a fresh database session.
+    
+    Returns:
+        Number of changes delivered
+    """
+    db = SessionLocal()
+    try:
+        return change_feed.poll(DictionaryRepository(db))
+    finally:
+        db.close()
+
+
+def prune_changes() -> int:
+    """
+    Delete change feed rows older than DICTIONARY_CHANGE_RETENTION.
+    
+    Safe to run from every worker; concurrent deletes are idempotent.
+    
+    Returns:
+        Number of deleted rows
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.DICTIONARY_CHANGE_RETENTION)
+    db = SessionLocal()
+    try:
+        repository = DictionaryRepository(db)
+        with repository.transaction():
+            deleted = repository.delete_changes_before(cutoff)
+    finally:
+        db.close()
+    if deleted:
+        logger.info("Pruned %d dictionary changes", deleted)
+    return deleted
+
+
+async def run_change_feed_listener() -> None:
+    """Poll the change feed until cancelled, pruning old rows periodically."""
+    interval = settings.DICTIONARY_CHANGE_POLL_INTERVAL
+    prune_every = max(1, int(settings.DICTIONARY_CHANGE_RETENTION / interval / 10))
+    polls = 0
+    while True:
+        try:
+            await run_blocking(poll_changes)
+            polls += 1
+            if polls % prune_every == 0:
+                await run_blocking(prune_changes)
+        except Exception as e:
+            logger.warning("Failed to poll dictionary changes: %s", e)
+        await asyncio.sleep(interval)
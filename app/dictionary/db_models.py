@@ -1,5 +1,5 @@
 """SQLAlchemy models for dictionary module."""
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Date, Integer, String, DateTime
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -32,10 +32,18 @@ class DictionaryEntry(Base):
         nullable=False,
         doc="The definition of the word"
     )
+    hit_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Number of lookups, flushed in batches from an in-memory counter"
+    )
     created_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
+        index=True,
         doc="Timestamp when the entry was created"
     )
     
@@ -43,3 +51,69 @@ class DictionaryEntry(Base):
         """String representation of the model."""
         return f"<DictionaryEntry(id={self.id}, word='{self.word}')>"
 
+
+class DictionaryDailyStats(Base):
+    """
+    SQLAlchemy model for per-day dictionary counters.
+    
+    Incremented in the same transaction as every insert into
+    dictionary_entries, so totals and daily additions are read from a
+    row per day instead of counting the entries table.
+    """
+    
+    __tablename__ = "dictionary_daily_stats"
+    
+    day = Column(
+        Date,
+        primary_key=True,
+        doc="UTC day the entries were added"
+    )
+    added = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Entries added on that day"
+    )
+    
+    def __repr__(self) -> str:
+        """String representation of the model."""
+        return f"<DictionaryDailyStats(day={self.day}, added={self.added})>"
+
+
+class DictionaryChange(Base):
+    """
+    SQLAlchemy model for the dictionary change feed (outbox).
+    
+    A row is written in the same transaction as each dictionary write and
+    polled by every worker to invalidate its local caches and indexes.
+    """
+    
+    __tablename__ = "dictionary_changes"
+    
+    id = Column(
+        Integer,
+        primary_key=True,
+        doc="Monotonic change sequence number"
+    )
+    word = Column(
+        String,
+        nullable=False,
+        doc="Normalized word that changed"
+    )
+    operation = Column(
+        String,
+        nullable=False,
+        doc="Kind of change, e.g. 'add'"
+    )
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+        doc="Timestamp when the change was recorded"
+    )
+    
+    def __repr__(self) -> str:
+        """String representation of the model."""
+        return f"<DictionaryChange(id={self.id}, word='{self.word}', operation='{self.operation}')>"
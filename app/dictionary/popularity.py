@@ -0,0 +1,148 @@
+"""Word popularity tracking and cache warm-up."""
+import asyncio
+import logging
+import threading
+from collections import Counter
+from typing import Dict
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.executor import run_blocking
+from app.core.readiness import readiness
+from app.dictionary.cache import dictionary_cache, normalize_word
+from app.dictionary.repository import DictionaryRepository
+
+logger = logging.getLogger(__name__)
+
+WARMUP_READINESS_CHECK = "dictionary_cache"
+
+
+class HitCounter:
+    """
+    In-memory per-word lookup counter.
+    
+    Recording a hit is a dictionary increment under a lock; counts are
+    written to the database in batches by a background task instead of
+    one UPDATE per request.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty counter."""
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+    
+    def record(self, word: str) -> None:
+        """
+        Count one lookup of a word.
+        
+        Args:
+            word: The word that was looked up (any case)
+        """
+        key = normalize_word(word)
+        with self._lock:
+            self._counts[key] += 1
+    
+    def drain(self) -> Dict[str, int]:
+        """
+        Take all pending counts and reset the counter.
+        
+        Returns:
+            Mapping of normalized word to hits since the last drain
+        """
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        return dict(counts)
+    
+    def restore(self, counts: Dict[str, int]) -> None:
+        """
+        Put back counts that could not be flushed.
+        
+        Args:
+            counts: Counts previously returned by drain()
+        """
+        with self._lock:
+            self._counts.update(counts)
+
+
+# Global hit counter shared by all requests in this process
+hit_counter = HitCounter()
+
+
+def flush_hit_counts() -> int:
+    """
+    Write pending hit counts to the database in one transaction.
+    
+    Returns:
+        Number of distinct words updated
+    """
+    counts = hit_counter.drain()
+    if not counts:
+        return 0
+    
+    db = SessionLocal()
+    try:
+        repository = DictionaryRepository(db)
+        with repository.transaction():
+            repository.increment_hit_counts(counts)
+    except Exception:
+        hit_counter.restore(counts)
+        raise
+    finally:
+        db.close()
+    
+    logger.debug("Flushed hit counts for %d words", len(counts))
+    return len(counts)
+
+
+async def run_hit_count_flusher() -> None:
+    """Flush hit counts periodically until cancelled, then flush once more."""
+    try:
+        while True:
+            await asyncio.sleep(settings.DICTIONARY_HIT_FLUSH_INTERVAL)
+            try:
+                await run_blocking(flush_hit_counts)
+            except Exception as e:
+                logger.warning("Failed to flush hit counts: %s", e)
+    finally:
+        try:
+            flush_hit_counts()
+        except Exception as e:
+            logger.warning("Failed to flush hit counts on shutdown: %s", e)
+
+
+def warm_up_cache(limit: int) -> int:
+    """
+    Preload the most popular words into the dictionary cache.
+    
+    Args:
+        limit: Maximum number of words to preload
+        
+    Returns:
+        Number of entries loaded
+    """
+    if limit <= 0:
+        return 0
+    
+    db = SessionLocal()
+    try:
+        entries = DictionaryRepository(db).find_most_popular(limit)
+        for entry in entries:
+            dictionary_cache.set(entry.word, entry)
+    finally:
+        db.close()
+    return len(entries)
+
+
+async def warm_up_dictionary_cache() -> None:
+    """
+    Warm the dictionary cache and mark the readiness check.
+    
+    A failed warm-up is logged and does not block readiness; the cache
+    then simply fills on demand.
+    """
+    try:
+        loaded = await run_blocking(warm_up_cache, settings.DICTIONARY_WARMUP_TOP_N)
+        logger.info("Warmed dictionary cache with %d popular words", loaded)
+    except Exception as e:
+        logger.warning("Dictionary cache warm-up failed: %s", e)
+    readiness.mark(WARMUP_READINESS_CHECK)
@@ -0,0 +1,59 @@
+"""Compact, session-independent dictionary values."""
+import sys
+from typing import Any
+
+
+class DictionaryRecord:
+    """
+    Immutable dictionary entry value held by caches and indexes.
+    
+    Uses __slots__ instead of a per-instance dict and carries no
+    SQLAlchemy instance state, so it is a few dozen bytes plus its
+    strings and is safe to share across sessions and threads. Words are
+    interned because the same word string is also used as a cache key
+    and in search indexes.
+    """
+    
+    __slots__ = ("id", "word", "definition")
+    
+    def __init__(self, id: int, word: str, definition: str) -> None:
+        """
+        Initialize the record.
+        
+        Args:
+            id: Database id of the entry
+            word: The word as stored
+            definition: The word's definition
+        """
+        self.id = id
+        self.word = sys.intern(word)
+        self.definition = definition
+    
+    @classmethod
+    def from_entry(cls, entry: Any) -> "DictionaryRecord":
+        """
+        Copy the fields of an ORM entry (or another record).
+        
+        Args:
+            entry: Object with id, word and definition attributes
+            
+        Returns:
+            A detached record
+        """
+        if isinstance(entry, cls):
+            return entry
+        return cls(entry.id, entry.word, entry.definition)
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare records by value."""
+        if not isinstance(other, DictionaryRecord):
+            return NotImplemented
+        return (self.id, self.word, self.definition) == (other.id, other.word, other.definition)
+    
+    def __hash__(self) -> int:
+        """Hash records by value."""
+        return hash((self.id, self.word, self.definition))
+    
+    def __repr__(self) -> str:
+        """String representation of the record."""
+        return f"<DictionaryRecord(id={self.id}, word='{self.word}')>"
@@ -1,18 +1,56 @@
 """Repository pattern for dictionary data access."""
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import date, datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
 from contextlib import contextmanager
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 
-from app.dictionary.db_models import DictionaryEntry
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError, retry_after_seconds
+from app.core.exceptions import DatabaseUnavailableError
+from app.core.tracing import current_span, tracer
+from app.dictionary.db_models import DictionaryChange, DictionaryDailyStats, DictionaryEntry
+from app.dictionary.records import DictionaryRecord
+
+_entries = DictionaryEntry.__table__
+_changes = DictionaryChange.__table__
+_daily_stats = DictionaryDailyStats.__table__
+
+# Hot-path statements are built once; SQLAlchemy then reuses their
+# compiled form instead of rebuilding and compiling a query per call
+_FIND_BY_WORD = select(_entries.c.id, _entries.c.word, _entries.c.definition).where(
+    func.lower(_entries.c.word) == bindparam("normalized_word")
+).limit(1)
+_FIND_BY_WORDS = select(_entries.c.id, _entries.c.word, _entries.c.definition).where(
+    func.lower(_entries.c.word).in_(bindparam("normalized_words", expanding=True))
+)
+_INSERT_ENTRY = insert(_entries).returning(
+    _entries.c.id, _entries.c.word, _entries.c.definition, sort_by_parameter_order=True
+)
+_INSERT_CHANGE = insert(_changes)
+
+
+def _daily_stats_upsert(dialect_insert):
+    """Build an INSERT ... ON CONFLICT that adds to an existing day's counter."""
+    statement = dialect_insert(_daily_stats).values(day=bindparam("day"), added=bindparam("added"))
+    return statement.on_conflict_do_update(
+        index_elements=[_daily_stats.c.day],
+        set_={"added": _daily_stats.c.added + statement.excluded.added}
+    )
+
+
+_UPSERT_DAILY_STATS = {
+    "postgresql": _daily_stats_upsert(postgresql.insert),
+    "sqlite": _daily_stats_upsert(sqlite.insert),
+}
 
 
 class IDictionaryRepository(ABC):
     """Interface for dictionary repository operations."""
     
     @abstractmethod
-    def find_by_word(self, word: str) -> Optional[DictionaryEntry]:
+    def find_by_word(self, word: str) -> Optional[DictionaryRecord]:
         """
         Find a dictionary entry by word (case-insensitive).
         
@@ -20,12 +58,12 @@ class IDictionaryRepository(ABC):
             word: The word to search for
             
         Returns:
-            DictionaryEntry if found, None otherwise
+            DictionaryRecord if found, None otherwise
         """
         pass
     
     @abstractmethod
-    def create(self, word: str, definition: str) -> DictionaryEntry:
+    def create(self, word: str, definition: str) -> DictionaryRecord:
         """
         Create a new dictionary entry.
         
@@ -34,7 +72,130 @@ class IDictionaryRepository(ABC):
             definition: The definition of the word
             
         Returns:
-            The created DictionaryEntry
+            The created entry
+        """
+        pass
+    
+    @abstractmethod
+    def find_by_words(self, words: List[str]) -> List[DictionaryRecord]:
+        """
+        Find dictionary entries for several words in one query (case-insensitive).
+        
+        Args:
+            words: The words to search for
+            
+        Returns:
+            Entries found, in no particular order
+        """
+        pass
+    
+    @abstractmethod
+    def find_by_prefix(self, prefix: str, limit: int, after_id: int = 0) -> List[DictionaryEntry]:
+        """
+        Find entries whose word starts with a prefix (case-insensitive).
+        
+        Args:
+            prefix: Word prefix
+            limit: Maximum number of entries to return
+            after_id: Only return entries with a greater id
+            
+        Returns:
+            Matching entries ordered by word
+        """
+        pass
+    
+    @abstractmethod
+    def create_many(self, items: List[Tuple[str, str]]) -> List[DictionaryRecord]:
+        """
+        Create several dictionary entries with one multi-row insert.
+        
+        Args:
+            items: (word, definition) pairs to add
+            
+        Returns:
+            The created entries, in input order
+        """
+        pass
+    
+    @abstractmethod
+    def count_entries(self) -> int:
+        """
+        Count dictionary entries from the daily counters.
+        
+        Returns:
+            Total number of entries
+        """
+        pass
+    
+    @abstractmethod
+    def find_daily_additions(self, since: date) -> List[Tuple[date, int]]:
+        """
+        Find per-day addition counts.
+        
+        Args:
+            since: First UTC day to include
+            
+        Returns:
+            (day, added) pairs, newest first; days without additions are omitted
+        """
+        pass
+    
+    @abstractmethod
+    def find_recent(self, limit: int, before_id: Optional[int] = None) -> List[Tuple[int, str, datetime]]:
+        """
+        Find the most recently added entries, one keyset page at a time.
+        
+        Args:
+            limit: Maximum number of entries to return
+            before_id: Only return entries older than this id
+            
+        Returns:
+            (id, word, created_at) tuples, newest first
+        """
+        pass
+    
+    @abstractmethod
+    def find_most_popular(self, limit: int) -> List[DictionaryEntry]:
+        """
+        Find the most frequently looked-up entries.
+        
+        Args:
+            limit: Maximum number of entries to return
+            
+        Returns:
+            Entries ordered by descending hit count
+        """
+        pass
+    
+    @abstractmethod
+    def increment_hit_counts(self, counts: Dict[str, int]) -> None:
+        """
+        Add lookup counts to entries in a single batched statement.
+        
+        Args:
+            counts: Mapping of normalized word to hits to add
+        """
+        pass
+    
+    @abstractmethod
+    def record_change(self, word: str, operation: str) -> None:
+        """
+        Append a change to the change feed in the current transaction.
+        
+        Args:
+            word: The word that changed
+            operation: Kind of change, e.g. 'add'
+        """
+        pass
+    
+    @abstractmethod
+    def record_changes(self, words: List[str], operation: str) -> None:
+        """
+        Append one change per word to the change feed in the current transaction.
+        
+        Args:
+            words: The words that changed
+            operation: Kind of change, e.g. 'add'
         """
         pass
     
@@ -65,34 +226,40 @@ class DictionaryRepository(IDictionaryRepository):
         """
         self._db = db
     
-    def find_by_word(self, word: str) -> Optional[DictionaryEntry]:
+    def find_by_word(self, word: str) -> Optional[DictionaryRecord]:
         """
         Find a dictionary entry by word (case-insensitive).
         
+        Runs a prebuilt Core statement and returns a plain record rather
+        than an ORM entity.
+        
         Args:
             word: The word to search for
             
         Returns:
-            DictionaryEntry if found, None otherwise
+            DictionaryRecord if found, None otherwise
         """
         if not word or not word.strip():
             return None
-            
-        word_lower = word.lower().strip()
-        return self._db.query(DictionaryEntry).filter(
-            func.lower(DictionaryEntry.word) == word_lower
+        
+        row = self._db.execute(
+            _FIND_BY_WORD, {"normalized_word": word.lower().strip()}
         ).first()
+        return DictionaryRecord(*row) if row is not None else None
     
-    def create(self, word: str, definition: str) -> DictionaryEntry:
+    def create(self, word: str, definition: str) -> DictionaryRecord:
         """
         Create a new dictionary entry.
         
+        The id comes back through INSERT ... RETURNING, so no follow-up
+        SELECT is needed.
+        
         Args:
             word: The word to add
             definition: The definition of the word
             
         Returns:
-            The created DictionaryEntry
+            The created entry
             
         Raises:
             ValueError: If word or definition is empty
@@ -102,14 +269,278 @@ class DictionaryRepository(IDictionaryRepository):
         if not definition or not definition.strip():
             raise ValueError("Definition cannot be empty")
         
-        entry = DictionaryEntry(
-            word=word.strip(),
-            definition=definition.strip()
+        row = self._db.execute(
+            _INSERT_ENTRY, {"word": word.strip(), "definition": definition.strip()}
+        ).one()
+        self._record_additions(1)
+        return DictionaryRecord(*row)
+    
+    def create_many(self, items: List[Tuple[str, str]]) -> List[DictionaryRecord]:
+        """
+        Create several dictionary entries with one multi-row insert.
+        
+        SQLAlchemy batches the parameter sets into a single
+        INSERT ... VALUES ... RETURNING statement where supported.
+        
+        Args:
+            items: (word, definition) pairs to add
+            
+        Returns:
+            The created entries, in input order
+        """
+        rows = self._db.execute(_INSERT_ENTRY, [
+            {"word": word.strip(), "definition": definition.strip()}
+            for word, definition in items
+        ])
+        records = [DictionaryRecord(*row) for row in rows]
+        self._record_additions(len(records))
+        return records
+    
+    def _record_additions(self, count: int) -> None:
+        """
+        Add count to today's counter in the current transaction.
+        
+        Uses an upsert where the dialect has one; elsewhere it updates the
+        day's row and inserts it if it did not exist yet.
+        """
+        if not count:
+            return
+        today = datetime.now(timezone.utc).date()
+        upsert = _UPSERT_DAILY_STATS.get(self._db.get_bind().dialect.name)
+        if upsert is not None:
+            self._db.execute(upsert, {"day": today, "added": count})
+            return
+        updated = self._db.execute(
+            update(_daily_stats).where(_daily_stats.c.day == today).values(added=_daily_stats.c.added + count)
+        ).rowcount
+        if not updated:
+            self._db.execute(insert(_daily_stats).values(day=today, added=count))
+    
+    def find_by_words(self, words: List[str]) -> List[DictionaryRecord]:
+        """
+        Find dictionary entries for several words in one query (case-insensitive).
+        
+        Args:
+            words: The words to search for
+            
+        Returns:
+            Entries found, in no particular order
+        """
+        normalized = {word.lower().strip() for word in words if word and word.strip()}
+        if not normalized:
+            return []
+        rows = self._db.execute(_FIND_BY_WORDS, {"normalized_words": list(normalized)})
+        return [DictionaryRecord(*row) for row in rows]
+    
+    def find_by_prefix(self, prefix: str, limit: int, after_id: int = 0) -> List[DictionaryEntry]:
+        """
+        Find entries whose word starts with a prefix (case-insensitive).
+        
+        Args:
+            prefix: Word prefix
+            limit: Maximum number of entries to return
+            after_id: Only return entries with a greater id
+            
+        Returns:
+            Matching entries ordered by word
+        """
+        escaped = prefix.lower().strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self._db.query(DictionaryEntry).filter(
+            DictionaryEntry.id > after_id,
+            func.lower(DictionaryEntry.word).like(f"{escaped}%", escape="\\")
+        ).order_by(func.lower(DictionaryEntry.word)).limit(limit).all()
+    
+    def find_words_after(self, after_id: int, limit: int) -> List[Tuple[int, str]]:
+        """
+        Find (id, word) pairs of entries added after a given id.
+        
+        Args:
+            after_id: Last entry id already seen
+            limit: Maximum number of rows to return
+            
+        Returns:
+            Rows in ascending id order
+        """
+        table = DictionaryEntry.__table__
+        rows = self._db.execute(
+            select(table.c.id, table.c.word).where(table.c.id > after_id).order_by(table.c.id).limit(limit)
+        )
+        return [(row.id, row.word) for row in rows]
+    
+    def latest_entry_id(self) -> int:
+        """
+        Get the newest entry id.
+        
+        Returns:
+            Highest entry id, or 0 if the dictionary is empty
+        """
+        return self._db.query(func.max(DictionaryEntry.id)).scalar() or 0
+    
+    def iter_all_entries(self, batch_size: int = 10_000) -> Iterator[Tuple[int, str, str]]:
+        """
+        Stream every entry as plain tuples without building ORM objects.
+        
+        Args:
+            batch_size: Rows fetched per round trip
+            
+        Yields:
+            (id, word, definition) tuples
+        """
+        table = DictionaryEntry.__table__
+        result = self._db.execute(
+            select(table.c.id, table.c.word, table.c.definition).execution_options(yield_per=batch_size)
+        )
+        for row in result:
+            yield row.id, row.word, row.definition
+    
+    def count_entries(self) -> int:
+        """
+        Count dictionary entries from the daily counters.
+        
+        Reads one row per day instead of scanning dictionary_entries.
+        
+        Returns:
+            Total number of entries
+        """
+        return self._db.execute(select(func.coalesce(func.sum(_daily_stats.c.added), 0))).scalar()
+    
+    def find_daily_additions(self, since: date) -> List[Tuple[date, int]]:
+        """
+        Find per-day addition counts.
+        
+        Args:
+            since: First UTC day to include
+            
+        Returns:
+            (day, added) pairs, newest first; days without additions are omitted
+        """
+        rows = self._db.execute(
+            select(_daily_stats.c.day, _daily_stats.c.added)
+            .where(_daily_stats.c.day >= since)
+            .order_by(_daily_stats.c.day.desc())
+        )
+        return [(row.day, row.added) for row in rows]
+    
+    def find_recent(self, limit: int, before_id: Optional[int] = None) -> List[Tuple[int, str, datetime]]:
+        """
+        Find the most recently added entries, one keyset page at a time.
+        
+        Ids grow with insertion order, so paging on the primary key
+        returns the same order as created_at without an OFFSET scan.
+        
+        Args:
+            limit: Maximum number of entries to return
+            before_id: Only return entries older than this id
+            
+        Returns:
+            (id, word, created_at) tuples, newest first
+        """
+        query = select(_entries.c.id, _entries.c.word, _entries.c.created_at)
+        if before_id is not None:
+            query = query.where(_entries.c.id < before_id)
+        rows = self._db.execute(query.order_by(_entries.c.id.desc()).limit(limit))
+        return [(row.id, row.word, row.created_at) for row in rows]
+    
+    def find_most_popular(self, limit: int) -> List[DictionaryEntry]:
+        """
+        Find the most frequently looked-up entries.
+        
+        Args:
+            limit: Maximum number of entries to return
+            
+        Returns:
+            Entries ordered by descending hit count
+        """
+        return self._db.query(DictionaryEntry).filter(
+            DictionaryEntry.hit_count > 0
+        ).order_by(
+            DictionaryEntry.hit_count.desc()
+        ).limit(limit).all()
+    
+    def increment_hit_counts(self, counts: Dict[str, int]) -> None:
+        """
+        Add lookup counts to entries in a single batched statement.
+        
+        Uses one executemany UPDATE for all words rather than a
+        statement per word.
+        
+        Args:
+            counts: Mapping of normalized word to hits to add
+        """
+        if not counts:
+            return
+        table = DictionaryEntry.__table__
+        statement = update(table).where(
+            func.lower(table.c.word) == bindparam("normalized_word")
+        ).values(
+            hit_count=table.c.hit_count + bindparam("hits")
+        )
+        self._db.execute(statement, [
+            {"normalized_word": word, "hits": hits}
+            for word, hits in counts.items()
+        ])
+    
+    def record_change(self, word: str, operation: str) -> None:
+        """
+        Append a change to the change feed in the current transaction.
+        
+        Args:
+            word: The word that changed
+            operation: Kind of change, e.g. 'add'
+        """
+        self._db.execute(_INSERT_CHANGE, {"word": word.strip().lower(), "operation": operation})
+    
+    def record_changes(self, words: List[str], operation: str) -> None:
+        """
+        Append one change per word to the change feed in the current transaction.
+        
+        Args:
+            words: The words that changed
+            operation: Kind of change, e.g. 'add'
+        """
+        if words:
+            self._db.execute(_INSERT_CHANGE, [
+                {"word": word.strip().lower(), "operation": operation} for word in words
+            ])
+    
+    def find_changes_after(self, change_id: int, limit: int) -> List[DictionaryChange]:
+        """
+        Find changes recorded after a given sequence number.
+        
+        Args:
+            change_id: Last change already processed
+            limit: Maximum number of changes to return
+            
+        Returns:
+            Changes in ascending sequence order
+        """
+        return self._db.query(DictionaryChange).filter(
+            DictionaryChange.id > change_id
+        ).order_by(DictionaryChange.id).limit(limit).all()
+    
+    def latest_change_id(self) -> int:
+        """
+        Get the newest change sequence number.
+        
+        Returns:
+            Highest change id, or 0 if the feed is empty
+        """
+        return self._db.query(func.max(DictionaryChange.id)).scalar() or 0
+    
+    def delete_changes_before(self, cutoff: datetime) -> int:
+        """
+        Prune changes older than a cutoff.
+        
+        Args:
+            cutoff: Changes created before this time are deleted
+            
+        Returns:
+            Number of deleted changes
+        """
+        result = self._db.execute(
+            delete(DictionaryChange).where(DictionaryChange.created_at < cutoff)
         )
-        self._db.add(entry)
-        self._db.flush()  # Flush to get ID without committing
-        self._db.refresh(entry)
-        return entry
+        return result.rowcount
     
     def commit(self) -> None:
         """Commit current transaction."""
@@ -135,3 +566,91 @@ class DictionaryRepository(IDictionaryRepository):
             self.rollback()
             raise
 
+
+class CircuitBreakerRepository(IDictionaryRepository):
+    """
+    Repository decorator that routes every call through a circuit breaker.
+    
+    Database failures and rejected calls are both raised as
+    DatabaseUnavailableError, so callers fail fast with 503 (or fall back
+    to cached data) instead of waiting for connection timeouts.
+    """
+    
+    def __init__(self, repository: IDictionaryRepository, breaker: CircuitBreaker) -> None:
+        """
+        Initialize the decorator.
+        
+        Args:
+            repository: Repository to protect
+            breaker: Breaker tracking the database's health
+        """
+        self._repository = repository
+        self._breaker = breaker
+    
+    def _call(self, func, *args):
+        """Call a repository method through the breaker, inside a span if traced."""
+        try:
+            if current_span() is None:
+                return self._breaker.call(func, *args)
+            with tracer.start_span(f"{type(self._repository).__name__}.{func.__name__}"):
+                return self._breaker.call(func, *args)
+        except CircuitOpenError as e:
+            raise DatabaseUnavailableError(retry_after_seconds(e)) from e
+        except self._breaker.failure_exceptions as e:
+            raise DatabaseUnavailableError(max(1, int(self._breaker.recovery_timeout))) from e
+    
+    def find_by_word(self, word: str) -> Optional[DictionaryRecord]:
+        """Find a dictionary entry by word through the breaker."""
+        return self._call(self._repository.find_by_word, word)
+    
+    def find_by_words(self, words: List[str]) -> List[DictionaryRecord]:
+        """Find several dictionary entries through the breaker."""
+        return self._call(self._repository.find_by_words, words)
+    
+    def find_by_prefix(self, prefix: str, limit: int, after_id: int = 0) -> List[DictionaryEntry]:
+        """Find entries by prefix through the breaker."""
+        return self._call(self._repository.find_by_prefix, prefix, limit, after_id)
+    
+    def create(self, word: str, definition: str) -> DictionaryRecord:
+        """Create a dictionary entry through the breaker."""
+        return self._call(self._repository.create, word, definition)
+    
+    def create_many(self, items: List[Tuple[str, str]]) -> List[DictionaryRecord]:
+        """Create several dictionary entries through the breaker."""
+        return self._call(self._repository.create_many, items)
+    
+    def count_entries(self) -> int:
+        """Count entries through the breaker."""
+        return self._call(self._repository.count_entries)
+    
+    def find_daily_additions(self, since: date) -> List[Tuple[date, int]]:
+        """Find per-day addition counts through the breaker."""
+        return self._call(self._repository.find_daily_additions, since)
+    
+    def find_recent(self, limit: int, before_id: Optional[int] = None) -> List[Tuple[int, str, datetime]]:
+        """Find recently added entries through the breaker."""
+        return self._call(self._repository.find_recent, limit, before_id)
+    
+    def find_most_popular(self, limit: int) -> List[DictionaryEntry]:
+        """Find the most popular entries through the breaker."""
+        return self._call(self._repository.find_most_popular, limit)
+    
+    def increment_hit_counts(self, counts: Dict[str, int]) -> None:
+        """Add lookup counts through the breaker."""
+        self._call(self._repository.increment_hit_counts, counts)
+    
+    def record_change(self, word: str, operation: str) -> None:
+        """Append a change to the change feed through the breaker."""
+        self._call(self._repository.record_change, word, operation)
+    
+    def record_changes(self, words: List[str], operation: str) -> None:
+        """Append several changes to the change feed through the breaker."""
+        self._call(self._repository.record_changes, words, operation)
+    
+    def commit(self) -> None:
+        """Commit current transaction through the breaker."""
+        self._call(self._repository.commit)
+    
+    def rollback(self) -> None:
+        """Rollback current transaction; always allowed so sessions are cleaned up."""
+        self._repository.rollback()
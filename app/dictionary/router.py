@@ -1,19 +1,38 @@
 """Dictionary API routes."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, WebSocket, status
 from sqlalchemy.orm import Session
 import logging
+from datetime import datetime, timezone
+from typing import Optional
 
+from app.core.config import settings
+from app.core.content_negotiation import NegotiatedResponse, NegotiatedRoute
 from app.core.database import get_db
+from app.core.executor import run_blocking
 from app.core.exceptions import (
     DictionaryWordNotFoundError,
     DictionaryWordAlreadyExistsError
 )
-from app.dictionary.schemas import WordAddRequest, WordDefinitionResponse
+from app.dictionary.schemas import (
+    DailyAdditions,
+    DictionaryStatsResponse,
+    RecentEntriesResponse,
+    RecentEntry,
+    WordAddRequest,
+    WordBatchRequest,
+    WordBatchResponse,
+    WordDefinitionResponse,
+    WordSearchResponse
+)
 from app.dictionary.service import get_dictionary_service
+from app.dictionary.suggestions import SuggestSession, suggestion_index
+from app.dictionary.write_batcher import get_write_batcher
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
+
+STALE_HEADER = "X-Dictionary-Stale"
 
 
 @router.post("/add", status_code=status.HTTP_201_CREATED)
@@ -24,6 +43,9 @@ async def add_word(
     """
     Add a word with its definition to the dictionary.
     
+    With DICTIONARY_WRITE_BATCHING enabled the add joins the next group
+    commit instead of running its own transaction.
+    
     Args:
         request: Word add request containing word and definition
         db: Database session
@@ -35,10 +57,13 @@ async def add_word(
         HTTPException: If word already exists or validation fails
     """
     try:
-        service = get_dictionary_service(db)
-        service.add_word(request.word, request.definition)
+        if settings.DICTIONARY_WRITE_BATCHING:
+            await get_write_batcher().submit(request.word, request.definition)
+        else:
+            service = get_dictionary_service(db)
+            await run_blocking(service.add_word, request.word, request.definition)
         
-        logger.info(f"Successfully added word: {request.word}")
+        logger.debug("Successfully added word: %s", request.word)
         return {
             "message": f"Word '{request.word}' added successfully",
             "word": request.word
@@ -55,16 +80,168 @@ async def add_word(
         )
 
 
+@router.websocket("/ws/suggest")
+async def suggest_words(websocket: WebSocket) -> None:
+    """
+    Autocomplete session answering prefixes from the in-memory index.
+    
+    One connection serves every keystroke: no per-query headers, CORS
+    handling or database session. See SuggestSession for the protocol.
+    
+    Args:
+        websocket: The client connection
+    """
+    session = SuggestSession(
+        websocket,
+        suggestion_index,
+        debounce_seconds=settings.DICTIONARY_SUGGEST_DEBOUNCE_MS / 1000,
+        max_results=settings.DICTIONARY_SUGGEST_MAX_RESULTS
+    )
+    await session.run()
+
+
+@router.get("/search", response_model=WordSearchResponse)
+async def search_words(
+    prefix: str = Query(..., min_length=1, description="Word prefix"),
+    limit: int = Query(20, ge=1, description="Maximum number of entries"),
+    db: Session = Depends(get_db)
+) -> WordSearchResponse:
+    """
+    Find words starting with a prefix.
+    
+    Declared before /{word} so "search" is not taken as a word.
+    
+    Args:
+        prefix: Word prefix (case-insensitive)
+        limit: Maximum number of entries to return
+        db: Database session
+        
+    Returns:
+        Matching entries ordered by word
+        
+    Raises:
+        HTTPException: If the prefix is invalid
+    """
+    try:
+        service = get_dictionary_service(db)
+        entries = await run_blocking(service.search_prefix, prefix, limit)
+        return WordSearchResponse(entries=[
+            WordDefinitionResponse(word=entry.word, definition=entry.definition)
+            for entry in entries
+        ])
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/stats", response_model=DictionaryStatsResponse)
+async def get_stats(
+    days: int = Query(30, ge=1, description="Days of daily additions, including today"),
+    db: Session = Depends(get_db)
+) -> DictionaryStatsResponse:
+    """
+    Get the total word count and words added per day.
+    
+    Served from daily counters maintained on every insert, so polling it
+    never counts or groups the entries table.
+    
+    Args:
+        days: Number of UTC days to report, capped by DICTIONARY_STATS_MAX_DAYS
+        db: Database session
+        
+    Returns:
+        Totals and daily additions, newest day first
+    """
+    service = get_dictionary_service(db)
+    total, daily = await run_blocking(service.get_stats, days)
+    today = datetime.now(timezone.utc).date()
+    return DictionaryStatsResponse(
+        total_words=total,
+        added_today=next((added for day, added in daily if day == today), 0),
+        daily=[DailyAdditions(day=day, added=added) for day, added in daily]
+    )
+
+
+@router.get("/stats/recent", response_model=RecentEntriesResponse)
+async def get_recent_entries(
+    limit: int = Query(20, ge=1, description="Maximum number of entries"),
+    before_id: Optional[int] = Query(None, ge=1, description="next_before_id from the previous page"),
+    db: Session = Depends(get_db)
+) -> RecentEntriesResponse:
+    """
+    List recently added entries, newest first, with keyset pagination.
+    
+    Args:
+        limit: Maximum number of entries per page
+        before_id: Cursor returned by the previous page
+        db: Database session
+        
+    Returns:
+        One page of entries and the cursor for the next one
+    """
+    service = get_dictionary_service(db)
+    rows, next_before_id = await run_blocking(service.get_recent, limit, before_id)
+    return RecentEntriesResponse(
+        entries=[
+            RecentEntry(id=entry_id, word=word, created_at=created_at)
+            for entry_id, word, created_at in rows
+        ],
+        next_before_id=next_before_id
+    )
+
+
+@router.post("/batch", response_model=WordBatchResponse)
+async def get_words_batch(
+    request: WordBatchRequest,
+    db: Session = Depends(get_db)
+) -> WordBatchResponse:
+    """
+    Retrieve the definitions of several words at once.
+    
+    Args:
+        request: Batch request with the words to look up
+        db: Database session
+        
+    Returns:
+        Entries found and the words that were not found
+        
+    Raises:
+        HTTPException: If the batch is too large or contains an empty word
+    """
+    try:
+        service = get_dictionary_service(db)
+        entries, missing = await run_blocking(service.get_words, request.words)
+        return WordBatchResponse(
+            entries=[
+                WordDefinitionResponse(word=entry.word, definition=entry.definition)
+                for entry in entries
+            ],
+            missing=missing
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 @router.get("/{word}", response_model=WordDefinitionResponse)
 async def get_word(
     word: str,
+    response: Response,
     db: Session = Depends(get_db)
 ) -> WordDefinitionResponse:
     """
     Retrieve the definition of a word.
     
+    While the database is unavailable, cached entries are served even if
+    expired and flagged with STALE_HEADER.
+    
     Args:
         word: The word to retrieve
+        response: Response used to set the stale flag header
         db: Database session
         
     Returns:
@@ -75,7 +252,9 @@ async def get_word(
     """
     try:
         service = get_dictionary_service(db)
-        entry = service.get_word(word)
+        entry, stale = await run_blocking(service.get_word_with_fallback, word)
+        if stale:
+            response.headers[STALE_HEADER] = "true"
         
         return WordDefinitionResponse(
             word=entry.word,
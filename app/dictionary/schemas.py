@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import date, datetime
+from typing import List, Optional
 
 
 class WordAddRequest(BaseModel):
@@ -12,6 +13,45 @@ class WordDefinitionResponse(BaseModel):
     definition: str
 
 
+class WordSearchResponse(BaseModel):
+    """Entries matching a prefix search"""
+    entries: List[WordDefinitionResponse]
+
+
+class WordBatchRequest(BaseModel):
+    words: List[str] = Field(..., min_length=1, description="Words to look up")
+
+
+class WordBatchResponse(BaseModel):
+    """Batch lookup result; missing words are listed separately"""
+    entries: List[WordDefinitionResponse]
+    missing: List[str]
+
+
+class DailyAdditions(BaseModel):
+    day: date
+    added: int
+
+
+class DictionaryStatsResponse(BaseModel):
+    """Dictionary totals read from incrementally maintained daily counters"""
+    total_words: int
+    added_today: int
+    daily: List[DailyAdditions]
+
+
+class RecentEntry(BaseModel):
+    id: int
+    word: str
+    created_at: datetime
+
+
+class RecentEntriesResponse(BaseModel):
+    """One page of recently added entries, newest first"""
+    entries: List[RecentEntry]
+    next_before_id: Optional[int] = Field(None, description="Pass as before_id to fetch the next page")
+
+
 class DictionaryEntryResponse(BaseModel):
     """Full dictionary entry response with metadata"""
     id: int
@@ -1,15 +1,27 @@
 """Business logic layer for dictionary operations."""
 import logging
-from typing import Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
+from app.core.config import settings
+from app.core.circuit_breaker import database_breaker
 from app.core.exceptions import (
+    DatabaseUnavailableError,
     DictionaryWordNotFoundError,
     DictionaryWordAlreadyExistsError
 )
-from app.dictionary.repository import IDictionaryRepository, DictionaryRepository
-from app.dictionary.db_models import DictionaryEntry
+from app.core.tracing import traced
+from app.dictionary.repository import (
+    CircuitBreakerRepository,
+    DictionaryRepository,
+    IDictionaryRepository
+)
+from app.dictionary.cache import DictionaryCache, dictionary_cache, normalize_word
+from app.dictionary.popularity import HitCounter, hit_counter
+from app.dictionary.records import DictionaryRecord
+from app.dictionary.snapshot import DictionarySnapshot, snapshot_store
 
 logger = logging.getLogger(__name__)
 
@@ -22,16 +34,29 @@ class DictionaryService:
     Follows Single Responsibility Principle - handles business logic only.
     """
     
-    def __init__(self, repository: IDictionaryRepository) -> None:
+    def __init__(
+        self,
+        repository: IDictionaryRepository,
+        cache: Optional[DictionaryCache] = None,
+        hits: Optional[HitCounter] = None,
+        snapshot: Optional[DictionarySnapshot] = None
+    ) -> None:
         """
         Initialize service with repository dependency.
         
         Args:
             repository: Dictionary repository implementation
+            cache: Optional read-through cache for lookups
+            hits: Optional counter recording lookups for popularity
+            snapshot: Optional read-only snapshot consulted before the cache
         """
         self._repository = repository
+        self._cache = cache
+        self._hits = hits
+        self._snapshot = snapshot
     
-    def add_word(self, word: str, definition: str) -> DictionaryEntry:
+    @traced()
+    def add_word(self, word: str, definition: str) -> DictionaryRecord:
         """
         Add a word with its definition to the dictionary.
         
@@ -46,30 +71,34 @@ class DictionaryService:
             DictionaryWordAlreadyExistsError: If word already exists
             ValueError: If word or definition is invalid
         """
-        self._validate_word_input(word, definition)
+        validate_word_input(word, definition)
         
         # Check if word already exists (case-insensitive)
         existing = self._repository.find_by_word(word)
         if existing:
-            logger.warning(f"Attempted to add duplicate word: {word}")
+            logger.warning("Attempted to add duplicate word: %s", word)
             raise DictionaryWordAlreadyExistsError(word)
         
         # Create entry with transaction handling
         try:
             entry = self._repository.create(word, definition)
+            self._repository.record_change(word, "add")
             self._repository.commit()
-            logger.info(f"Successfully added word: {word} to database")
+            if self._cache is not None:
+                self._cache.invalidate(word)
+            logger.info("Successfully added word: %s to database", word)
             return entry
         except IntegrityError as e:
             self._repository.rollback()
-            logger.error(f"Database integrity error adding word: {word} - {str(e)}")
+            logger.error("Database integrity error adding word: %s - %s", word, e)
             raise DictionaryWordAlreadyExistsError(word)
         except ValueError as e:
             self._repository.rollback()
-            logger.error(f"Validation error adding word: {word} - {str(e)}")
+            logger.error("Validation error adding word: %s - %s", word, e)
             raise
     
-    def get_word(self, word: str) -> DictionaryEntry:
+    @traced()
+    def get_word(self, word: str) -> DictionaryRecord:
         """
         Retrieve a dictionary entry by word.
         
@@ -77,7 +106,7 @@ class DictionaryService:
             word: The word to retrieve
             
         Returns:
-            The dictionary entry
+            The dictionary entry as a detached record
             
         Raises:
             DictionaryWordNotFoundError: If word not found
@@ -86,30 +115,211 @@ class DictionaryService:
         if not word or not word.strip():
             raise ValueError("Word cannot be empty")
         
-        entry = self._repository.find_by_word(word)
-        if not entry:
-            logger.warning(f"Word not found: {word}")
-            raise DictionaryWordNotFoundError(word)
+        entry = self._lookup_local(word)
+        if entry is None:
+            row = self._repository.find_by_word(word)
+            if not row:
+                logger.debug("Word not found: %s", word)
+                raise DictionaryWordNotFoundError(word)
+            entry = DictionaryRecord.from_entry(row)
+            if self._cache is not None:
+                self._cache.set(word, entry)
+        
+        if self._hits is not None:
+            self._hits.record(word)
         
-        logger.info(f"Retrieved definition for word: {word}")
+        logger.debug("Retrieved definition for word: %s", word)
         return entry
     
-    @staticmethod
-    def _validate_word_input(word: str, definition: str) -> None:
+    @traced()
+    def get_word_with_fallback(self, word: str) -> Tuple[DictionaryRecord, bool]:
         """
-        Validate word and definition inputs.
+        Retrieve a dictionary entry, serving stale cached data if the database is down.
         
         Args:
-            word: The word to validate
-            definition: The definition to validate
+            word: The word to retrieve
+            
+        Returns:
+            Tuple of (entry, stale); stale is True if the entry came from an
+            expired cache entry because the database was unavailable
             
         Raises:
-            ValueError: If validation fails
+            DictionaryWordNotFoundError: If word not found
+            DatabaseUnavailableError: If the database is down and nothing is cached
+            ValueError: If word is invalid
         """
-        if not word or not word.strip():
+        try:
+            return self.get_word(word), False
+        except DatabaseUnavailableError:
+            entry = self._cache.get_stale(word) if self._cache is not None else None
+            if entry is None:
+                raise
+            logger.info("Serving stale entry for '%s' while the database is unavailable", word)
+            return entry, True
+    
+    @traced()
+    def get_words(self, words: List[str]) -> Tuple[List[DictionaryRecord], List[str]]:
+        """
+        Retrieve several dictionary entries at once.
+        
+        Words found in the snapshot or cache are served from memory; the
+        rest are fetched with a single query.
+        
+        Args:
+            words: The words to retrieve
+            
+        Returns:
+            Tuple of (entries found, words not found), both in request
+            order with case-insensitive duplicates removed
+            
+        Raises:
+            ValueError: If there are too many words or a word is empty
+        """
+        if len(words) > settings.DICTIONARY_BATCH_MAX_WORDS:
+            raise ValueError(f"At most {settings.DICTIONARY_BATCH_MAX_WORDS} words per batch")
+        if any(not word or not word.strip() for word in words):
             raise ValueError("Word cannot be empty")
-        if not definition or not definition.strip():
-            raise ValueError("Definition cannot be empty")
+        
+        requested: Dict[str, str] = {}
+        for word in words:
+            requested.setdefault(normalize_word(word), word)
+        
+        found: Dict[str, DictionaryRecord] = {}
+        for key, word in requested.items():
+            entry = self._lookup_local(word)
+            if entry is not None:
+                found[key] = entry
+        
+        pending = [word for key, word in requested.items() if key not in found]
+        if pending:
+            for row in self._repository.find_by_words(pending):
+                entry = DictionaryRecord.from_entry(row)
+                found[normalize_word(entry.word)] = entry
+                if self._cache is not None:
+                    self._cache.set(entry.word, entry)
+        
+        entries: List[DictionaryRecord] = []
+        missing: List[str] = []
+        for key, word in requested.items():
+            if key in found:
+                entries.append(found[key])
+                if self._hits is not None:
+                    self._hits.record(word)
+            else:
+                missing.append(word)
+        return entries, missing
+    
+    @traced()
+    def search_prefix(self, prefix: str, limit: int) -> List[DictionaryRecord]:
+        """
+        Find entries whose word starts with a prefix.
+        
+        With a snapshot loaded only entries newer than the snapshot are
+        searched in the database.
+        
+        Args:
+            prefix: Word prefix (any case)
+            limit: Maximum number of entries to return
+            
+        Returns:
+            Matching entries ordered by normalized word
+            
+        Raises:
+            ValueError: If prefix is empty
+        """
+        if not prefix or not prefix.strip():
+            raise ValueError("Prefix cannot be empty")
+        limit = min(limit, settings.DICTIONARY_SEARCH_MAX_RESULTS)
+        
+        if self._snapshot is None:
+            return [
+                DictionaryRecord.from_entry(row)
+                for row in self._repository.find_by_prefix(prefix, limit)
+            ]
+        
+        entries = self._snapshot.search_prefix(prefix, limit)
+        entries += [
+            DictionaryRecord.from_entry(row)
+            for row in self._repository.find_by_prefix(
+                prefix, limit, after_id=self._snapshot.max_entry_id
+            )
+        ]
+        entries.sort(key=lambda entry: normalize_word(entry.word))
+        return entries[:limit]
+    
+    @traced()
+    def get_stats(self, days: int) -> Tuple[int, List[Tuple[date, int]]]:
+        """
+        Get the total word count and recent daily additions.
+        
+        Both come from the daily counters maintained on insert, so no
+        query touches dictionary_entries.
+        
+        Args:
+            days: Number of UTC days, including today, to report
+            
+        Returns:
+            Total word count and (day, added) pairs, newest first
+        """
+        days = max(1, min(days, settings.DICTIONARY_STATS_MAX_DAYS))
+        since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+        return self._repository.count_entries(), self._repository.find_daily_additions(since)
+    
+    @traced()
+    def get_recent(
+        self,
+        limit: int,
+        before_id: Optional[int] = None
+    ) -> Tuple[List[Tuple[int, str, datetime]], Optional[int]]:
+        """
+        Get one page of recently added entries, newest first.
+        
+        Args:
+            limit: Maximum number of entries to return
+            before_id: Continue after the last id of the previous page
+            
+        Returns:
+            (id, word, created_at) tuples and the before_id of the next
+            page, or None on the last page
+        """
+        limit = min(limit, settings.DICTIONARY_SEARCH_MAX_RESULTS)
+        rows = self._repository.find_recent(limit, before_id)
+        return rows, (rows[-1][0] if len(rows) == limit else None)
+    
+    def _lookup_local(self, word: str) -> Optional[DictionaryRecord]:
+        """
+        Look up a word in the snapshot, then the cache.
+        
+        Args:
+            word: The word to look up
+            
+        Returns:
+            The entry, or None if neither holds it
+        """
+        if self._snapshot is not None:
+            entry = self._snapshot.get(word)
+            if entry is not None:
+                return entry
+        if self._cache is not None:
+            return self._cache.get(word)
+        return None
+
+
+def validate_word_input(word: str, definition: str) -> None:
+    """
+    Validate word and definition inputs.
+    
+    Args:
+        word: The word to validate
+        definition: The definition to validate
+        
+    Raises:
+        ValueError: If validation fails
+    """
+    if not word or not word.strip():
+        raise ValueError("Word cannot be empty")
+    if not definition or not definition.strip():
+        raise ValueError("Definition cannot be empty")
 
 
 def get_dictionary_service(db: Session) -> DictionaryService:
@@ -124,6 +334,13 @@ def get_dictionary_service(db: Session) -> DictionaryService:
     Returns:
         Configured DictionaryService instance
     """
-    repository = DictionaryRepository(db)
-    return DictionaryService(repository)
+    repository: IDictionaryRepository = DictionaryRepository(db)
+    if settings.DB_CIRCUIT_BREAKER_ENABLED:
+        repository = CircuitBreakerRepository(repository, database_breaker)
+    return DictionaryService(
+        repository,
+        cache=dictionary_cache,
+        hits=hit_counter,
+        snapshot=snapshot_store.current()
+    )
 
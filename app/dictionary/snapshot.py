@@ -0,0 +1,276 @@
+"""Memory-mapped, read-only dictionary snapshot shared by all workers."""
+import asyncio
+import fcntl
+import logging
+import mmap
+import os
+import struct
+from typing import Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.executor import run_blocking
+from app.core.metrics import metrics
+from app.dictionary.cache import normalize_word
+from app.dictionary.records import DictionaryRecord
+from app.dictionary.repository import DictionaryRepository
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"DICTSNP1"
+HEADER = struct.Struct("<8sIQ")
+OFFSET = struct.Struct("<Q")
+RECORD = struct.Struct("<IHHI")
+
+
+def build_snapshot(entries: Iterable[Tuple[int, str, str]], path: str) -> int:
+    """
+    Compile entries into a snapshot file and atomically replace path.
+    
+    Layout: header (magic, entry count, highest entry id), a table of
+    record offsets sorted by normalized word, then the records. Each record
+    is (id, key length, word length, definition length) followed by the
+    UTF-8 key, word and definition.
+    
+    Args:
+        entries: (id, word, definition) tuples in any order
+        path: Destination file path
+        
+    Returns:
+        Number of entries written
+    """
+    records = sorted(
+        (normalize_word(word).encode("utf-8"), entry_id, word.encode("utf-8"), definition.encode("utf-8"))
+        for entry_id, word, definition in entries
+    )
+    max_id = max((record[1] for record in records), default=0)
+    
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(records), max_id))
+        offset = HEADER.size + OFFSET.size * len(records)
+        for key, _, word, definition in records:
+            f.write(OFFSET.pack(offset))
+            offset += RECORD.size + len(key) + len(word) + len(definition)
+        for key, entry_id, word, definition in records:
+            f.write(RECORD.pack(entry_id, len(key), len(word), len(definition)))
+            f.write(key)
+            f.write(word)
+            f.write(definition)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+def read_max_entry_id(path: str) -> Optional[int]:
+    """
+    Read the highest entry id recorded in a snapshot file header.
+    
+    Args:
+        path: Snapshot file path
+        
+    Returns:
+        The highest entry id, or None if there is no valid snapshot
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+    except FileNotFoundError:
+        return None
+    if len(header) < HEADER.size:
+        return None
+    magic, _, max_id = HEADER.unpack(header)
+    return max_id if magic == MAGIC else None
+
+
+class DictionarySnapshot:
+    """
+    Read-only view of a snapshot file.
+    
+    The file is mapped once per process and pages are shared through the
+    page cache, so memory per worker stays flat. Lookups binary-search the
+    offset table and decode only the matched records. The dictionary is
+    append-only, so a hit is authoritative; a miss may be an entry added
+    after the snapshot (id above max_entry_id) and must be checked in the
+    database.
+    """
+    
+    def __init__(self, path: str) -> None:
+        """
+        Map a snapshot file.
+        
+        Args:
+            path: Path to a file written by build_snapshot()
+            
+        Raises:
+            ValueError: If the file is not a snapshot
+        """
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.inode = stat.st_ino
+        magic, self._count, self.max_entry_id = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a dictionary snapshot: {path}")
+    
+    def __len__(self) -> int:
+        """Return the number of entries in the snapshot."""
+        return self._count
+    
+    def _record_offset(self, index: int) -> int:
+        """Return the file offset of the record at a sorted position."""
+        return OFFSET.unpack_from(self._map, HEADER.size + OFFSET.size * index)[0]
+    
+    def _key_at(self, index: int) -> bytes:
+        """Return the normalized key at a sorted position."""
+        offset = self._record_offset(index)
+        key_len = RECORD.unpack_from(self._map, offset)[1]
+        start = offset + RECORD.size
+        return self._map[start:start + key_len]
+    
+    def _entry_at(self, index: int) -> DictionaryRecord:
+        """Decode the record at a sorted position."""
+        offset = self._record_offset(index)
+        entry_id, key_len, word_len, definition_len = RECORD.unpack_from(self._map, offset)
+        start = offset + RECORD.size + key_len
+        word = self._map[start:start + word_len].decode("utf-8")
+        start += word_len
+        definition = self._map[start:start + definition_len].decode("utf-8")
+        return DictionaryRecord(entry_id, word, definition)
+    
+    def _lower_bound(self, key: bytes) -> int:
+        """Return the first sorted position whose key is not less than key."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def get(self, word: str) -> Optional[DictionaryRecord]:
+        """
+        Look up a word.
+        
+        Args:
+            word: The word to find (any case)
+            
+        Returns:
+            The entry, or None if it is not in the snapshot
+        """
+        key = normalize_word(word).encode("utf-8")
+        index = self._lower_bound(key)
+        if index < self._count and self._key_at(index) == key:
+            return self._entry_at(index)
+        return None
+    
+    def search_prefix(self, prefix: str, limit: int) -> List[DictionaryRecord]:
+        """
+        Find entries whose normalized word starts with a prefix.
+        
+        Args:
+            prefix: Word prefix (any case)
+            limit: Maximum number of entries to return
+            
+        Returns:
+            Matching entries in word order
+        """
+        key = normalize_word(prefix).encode("utf-8")
+        entries: List[DictionaryRecord] = []
+        index = self._lower_bound(key)
+        while index < self._count and len(entries) < limit and self._key_at(index).startswith(key):
+            entries.append(self._entry_at(index))
+            index += 1
+        return entries
+
+
+class SnapshotStore:
+    """Holds the snapshot currently mapped by this process."""
+    
+    def __init__(self) -> None:
+        """Initialize with no snapshot loaded."""
+        self._snapshot: Optional[DictionarySnapshot] = None
+    
+    def current(self) -> Optional[DictionarySnapshot]:
+        """Return the loaded snapshot, if any."""
+        return self._snapshot
+    
+    def refresh(self, path: str) -> bool:
+        """
+        Map the snapshot at path if it was replaced since the last refresh.
+        
+        The previous mapping is not closed explicitly: requests still
+        reading it keep it alive and it is unmapped once unreferenced.
+        
+        Args:
+            path: Snapshot file path
+            
+        Returns:
+            True if a new snapshot was loaded
+        """
+        try:
+            inode = os.stat(path).st_ino
+        except FileNotFoundError:
+            return False
+        if self._snapshot is not None and self._snapshot.inode == inode:
+            return False
+        self._snapshot = DictionarySnapshot(path)
+        metrics.set_gauge("dictionary.snapshot_entries", len(self._snapshot))
+        logger.info("Loaded dictionary snapshot with %d entries", len(self._snapshot))
+        return True
+    
+    def clear(self) -> None:
+        """Drop the loaded snapshot."""
+        self._snapshot = None
+
+
+# Global snapshot store for this worker process
+snapshot_store = SnapshotStore()
+
+
+def rebuild_snapshot(path: str) -> bool:
+    """
+    Rebuild the snapshot from the database if it is out of date.
+    
+    A lock file makes sure only one worker rebuilds at a time; the others
+    skip and pick up the new file on their next refresh.
+    
+    Args:
+        path: Snapshot file path
+        
+    Returns:
+        True if a new snapshot was written
+    """
+    with open(f"{path}.lock", "a") as lock:
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        try:
+            db = SessionLocal()
+            try:
+                repository = DictionaryRepository(db)
+                max_id = read_max_entry_id(path)
+                if max_id is not None and repository.latest_entry_id() <= max_id:
+                    return False
+                written = build_snapshot(repository.iter_all_entries(), path)
+            finally:
+                db.close()
+        finally:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+    logger.info("Rebuilt dictionary snapshot with %d entries", written)
+    return True
+
+
+async def run_snapshot_maintainer() -> None:
+    """Rebuild and reload the snapshot periodically until cancelled."""
+    path = settings.DICTIONARY_SNAPSHOT_PATH
+    while True:
+        try:
+            await run_blocking(rebuild_snapshot, path)
+            await run_blocking(snapshot_store.refresh, path)
+        except Exception as e:
+            logger.warning("Failed to refresh dictionary snapshot: %s", e)
+        await asyncio.sleep(settings.DICTIONARY_SNAPSHOT_REBUILD_INTERVAL)
@@ -0,0 +1,252 @@
+"""In-memory prefix index and WebSocket autocomplete sessions."""
+import asyncio
+import bisect
+import json
+import logging
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.executor import run_blocking
+from app.core.metrics import metrics
+from app.dictionary.cache import normalize_word
+from app.dictionary.repository import DictionaryRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SuggestionIndex:
+    """
+    Sorted in-memory index of dictionary words for prefix lookups.
+    
+    Holds only normalized keys and interned words, kept in two parallel
+    sorted lists, so a lookup is one binary search plus a short scan.
+    The dictionary is append-only: refresh() loads entries added since the
+    last refresh by id, without rescanning the table.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._lock = threading.Lock()
+        self._keys: List[str] = []
+        self._words: List[str] = []
+        self.max_entry_id = 0
+    
+    def __len__(self) -> int:
+        """Return the number of indexed words."""
+        return len(self._keys)
+    
+    def add(self, entry_id: int, word: str) -> None:
+        """
+        Index one word.
+        
+        Args:
+            entry_id: Database id of the entry
+            word: The word as stored
+        """
+        key = normalize_word(word)
+        with self._lock:
+            position = bisect.bisect_left(self._keys, key)
+            if position == len(self._keys) or self._keys[position] != key:
+                self._keys.insert(position, key)
+                self._words.insert(position, sys.intern(word))
+            self.max_entry_id = max(self.max_entry_id, entry_id)
+    
+    def refresh(self, repository: DictionaryRepository, batch_size: int = 10_000) -> int:
+        """
+        Load entries added since the last refresh.
+        
+        Args:
+            repository: Repository to read new entries from
+            batch_size: Entries fetched per query
+            
+        Returns:
+            Number of entries added
+        """
+        added = 0
+        while True:
+            rows = repository.find_words_after(self.max_entry_id, batch_size)
+            if not rows:
+                break
+            if len(rows) > 100:
+                self._merge(rows)
+            else:
+                for entry_id, word in rows:
+                    self.add(entry_id, word)
+            added += len(rows)
+        if added:
+            metrics.set_gauge("suggest.index_size", len(self))
+        return added
+    
+    def _merge(self, rows: List[Any]) -> None:
+        """Merge a large batch of (id, word) rows with one sort."""
+        with self._lock:
+            merged = dict(zip(self._keys, self._words))
+            for entry_id, word in rows:
+                merged.setdefault(normalize_word(word), sys.intern(word))
+                self.max_entry_id = max(self.max_entry_id, entry_id)
+            keys = sorted(merged)
+            self._words = [merged[key] for key in keys]
+            self._keys = keys
+    
+    def search(self, prefix: str, limit: int) -> List[str]:
+        """
+        Find words starting with a prefix.
+        
+        Args:
+            prefix: Word prefix (any case)
+            limit: Maximum number of words to return
+            
+        Returns:
+            Matching words ordered by normalized word
+        """
+        key = normalize_word(prefix)
+        if not key:
+            return []
+        with self._lock:
+            position = bisect.bisect_left(self._keys, key)
+            end = min(position + limit, len(self._keys))
+            words: List[str] = []
+            while position < end and self._keys[position].startswith(key):
+                words.append(self._words[position])
+                position += 1
+        return words
+    
+    def clear(self) -> None:
+        """Remove all words."""
+        with self._lock:
+            self._keys = []
+            self._words = []
+            self.max_entry_id = 0
+
+
+# Global suggestion index for this worker process
+suggestion_index = SuggestionIndex()
+
+
+def refresh_suggestion_index() -> int:
+    """
+    Load new dictionary words into the suggestion index.
+    
+    Returns:
+        Number of words added
+    """
+    db = SessionLocal()
+    try:
+        return suggestion_index.refresh(DictionaryRepository(db))
+    finally:
+        db.close()
+
+
+async def run_suggestion_index_maintainer() -> None:
+    """Keep the suggestion index up to date until cancelled."""
+    while True:
+        try:
+            added = await run_blocking(refresh_suggestion_index)
+            if added:
+                logger.info("Added %d words to the suggestion index", added)
+        except Exception as e:
+            logger.warning("Failed to refresh suggestion index: %s", e)
+        await asyncio.sleep(settings.DICTIONARY_SUGGEST_REFRESH_INTERVAL)
+
+
+class SuggestSession:
+    """
+    One autocomplete WebSocket connection.
+    
+    Each client message is either a bare prefix or a JSON object
+    {"id": ..., "prefix": ..., "limit": ...}. A query is answered after a
+    short debounce; a newer message cancels a query that has not been
+    answered yet, so fast typists only get results for their latest
+    prefix. Replies are {"id", "prefix", "suggestions"}.
+    """
+    
+    open_connections = 0
+    
+    def __init__(
+        self,
+        websocket: WebSocket,
+        index: SuggestionIndex,
+        debounce_seconds: float,
+        max_results: int
+    ) -> None:
+        """
+        Initialize the session.
+        
+        Args:
+            websocket: The client connection
+            index: Index to answer prefixes from
+            debounce_seconds: Quiet time before a query is answered
+            max_results: Upper bound on suggestions per reply
+        """
+        self._websocket = websocket
+        self._index = index
+        self._debounce = debounce_seconds
+        self._max_results = max_results
+        self._send_lock = asyncio.Lock()
+        self._pending: Optional[asyncio.Task] = None
+    
+    async def run(self) -> None:
+        """Serve the connection until the client disconnects."""
+        await self._websocket.accept()
+        SuggestSession.open_connections += 1
+        metrics.increment("suggest.connections_opened")
+        metrics.set_gauge("suggest.connections", SuggestSession.open_connections)
+        try:
+            while True:
+                text = await self._websocket.receive_text()
+                received_at = time.perf_counter()
+                if self._pending is not None and not self._pending.done():
+                    self._pending.cancel()
+                    metrics.increment("suggest.superseded")
+                self._pending = asyncio.create_task(self._answer(text, received_at))
+        except WebSocketDisconnect:
+            pass
+        finally:
+            if self._pending is not None:
+                self._pending.cancel()
+            SuggestSession.open_connections -= 1
+            metrics.set_gauge("suggest.connections", SuggestSession.open_connections)
+    
+    async def _answer(self, text: str, received_at: float) -> None:
+        """Debounce, look up and send one reply."""
+        await asyncio.sleep(self._debounce)
+        try:
+            query = self._parse(text)
+        except ValueError as e:
+            await self._send({"error": str(e)})
+            return
+        
+        limit = min(query.get("limit") or self._max_results, self._max_results)
+        suggestions = self._index.search(query["prefix"], limit)
+        reply = {"id": query.get("id"), "prefix": query["prefix"], "suggestions": suggestions}
+        # Once the reply is built, finish sending it even if superseded
+        await asyncio.shield(self._send(reply))
+        metrics.observe("suggest.latency_seconds", time.perf_counter() - received_at)
+    
+    @staticmethod
+    def _parse(text: str) -> Dict[str, Any]:
+        """
+        Parse a client message.
+        
+        Raises:
+            ValueError: If a JSON message is malformed
+        """
+        if not text.lstrip().startswith("{"):
+            return {"prefix": text}
+        query = json.loads(text)
+        if not isinstance(query.get("prefix"), str):
+            raise ValueError("'prefix' must be a string")
+        if query.get("limit") is not None and (not isinstance(query["limit"], int) or query["limit"] < 1):
+            raise ValueError("'limit' must be a positive integer")
+        return query
+    
+    async def _send(self, message: Dict[str, Any]) -> None:
+        """Send one JSON message; replies never interleave."""
+        async with self._send_lock:
+            await self._websocket.send_json(message)
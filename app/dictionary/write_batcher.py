@@ -0,0 +1,221 @@
+"""Group-commit batching for dictionary writes."""
+import asyncio
+import logging
+from typing import Callable, List, Optional, Tuple, Union
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.circuit_breaker import CircuitBreaker, database_breaker
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.exceptions import DatabaseUnavailableError, DictionaryWordAlreadyExistsError
+from app.core.executor import run_blocking
+from app.core.metrics import metrics
+from app.dictionary.cache import DictionaryCache, dictionary_cache, normalize_word
+from app.dictionary.records import DictionaryRecord
+from app.dictionary.repository import (
+    CircuitBreakerRepository,
+    DictionaryRepository,
+    IDictionaryRepository
+)
+from app.dictionary.service import DictionaryService, validate_word_input
+
+logger = logging.getLogger(__name__)
+
+WriteResult = Union[DictionaryRecord, Exception]
+
+
+class WriteBatcher:
+    """
+    Collect concurrent add_word calls and commit them together.
+    
+    Adds arriving within max_delay_seconds of each other (up to
+    max_batch_size) are inserted with one multi-row statement in one
+    transaction. Only one batch is written at a time, so adds arriving
+    during a commit form the next batch. Each caller still gets its own
+    entry or its own duplicate/validation error.
+    """
+    
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        cache: Optional[DictionaryCache] = None,
+        max_batch_size: int = 100,
+        max_delay_seconds: float = 0.005,
+        breaker: Optional[CircuitBreaker] = None
+    ) -> None:
+        """
+        Initialize the batcher.
+        
+        Args:
+            session_factory: Creates a database session per batch
+            cache: Optional cache to invalidate after each commit
+            max_batch_size: Maximum adds per transaction
+            max_delay_seconds: Time to wait for more adds before committing
+            breaker: Optional circuit breaker; adds fail fast while it is open
+        """
+        self._session_factory = session_factory
+        self._cache = cache
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay_seconds
+        self._breaker = breaker
+        self._pending: List[Tuple[str, str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._tasks: set = set()
+    
+    async def submit(self, word: str, definition: str) -> DictionaryRecord:
+        """
+        Queue a word for the next group commit and wait for its result.
+        
+        Args:
+            word: The word to add
+            definition: The definition of the word
+            
+        Returns:
+            The created entry
+            
+        Raises:
+            DatabaseUnavailableError: If the database circuit is open
+            DictionaryWordAlreadyExistsError: If word already exists
+            ValueError: If word or definition is invalid
+        """
+        validate_word_input(word, definition)
+        if self._breaker is not None and self._breaker.is_open:
+            raise DatabaseUnavailableError(max(1, int(self._breaker.recovery_timeout)))
+        loop = asyncio.get_running_loop()
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((word, definition, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._start_flush)
+        return await future
+    
+    def _start_flush(self) -> None:
+        """Hand the pending adds to a background flush task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._flush(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _flush(self, batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+        """Write one batch and resolve each caller's future."""
+        async with self._write_lock:
+            try:
+                results = await run_blocking(
+                    self.write_batch, [(word, definition) for word, definition, _ in batch]
+                )
+            except Exception as e:
+                logger.error("Dictionary write batch failed: %s", e)
+                results = [e] * len(batch)
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    
+    def write_batch(self, items: List[Tuple[str, str]]) -> List[WriteResult]:
+        """
+        Insert a batch of adds in one transaction.
+        
+        Duplicates of existing words, or of an earlier word in the same
+        batch, fail individually. If the database still reports a conflict
+        (a concurrent writer elsewhere), the batch is retried one add at a
+        time so only the conflicting callers fail.
+        
+        Args:
+            items: (word, definition) pairs in arrival order
+            
+        Returns:
+            One created record or exception per item, in order
+        """
+        results: List[Optional[WriteResult]] = [None] * len(items)
+        db = self._session_factory()
+        try:
+            repository: IDictionaryRepository = DictionaryRepository(db)
+            if self._breaker is not None:
+                repository = CircuitBreakerRepository(repository, self._breaker)
+            seen = {
+                normalize_word(entry.word)
+                for entry in repository.find_by_words([word for word, _ in items])
+            }
+            accepted: List[int] = []
+            for index, (word, _) in enumerate(items):
+                key = normalize_word(word)
+                if key in seen:
+                    results[index] = DictionaryWordAlreadyExistsError(word)
+                else:
+                    seen.add(key)
+                    accepted.append(index)
+            
+            if accepted:
+                try:
+                    entries = repository.create_many([items[index] for index in accepted])
+                    for index in accepted:
+                        repository.record_change(items[index][0], "add")
+                    repository.commit()
+                    for index, entry in zip(accepted, entries):
+                        results[index] = DictionaryRecord.from_entry(entry)
+                except IntegrityError as e:
+                    repository.rollback()
+                    logger.warning("Group commit conflicted, retrying adds one by one: %s", e)
+                    service = DictionaryService(repository)
+                    for index in accepted:
+                        try:
+                            results[index] = DictionaryRecord.from_entry(service.add_word(*items[index]))
+                        except Exception as error:
+                            results[index] = error
+        finally:
+            db.close()
+        
+        if self._cache is not None:
+            for word, _ in items:
+                self._cache.invalidate(word)
+        metrics.observe("dictionary.write_batch_size", len(items))
+        return results
+    
+    async def close(self) -> None:
+        """Flush pending adds and wait for in-flight batches."""
+        self._start_flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+_write_batcher: Optional[WriteBatcher] = None
+
+
+def get_write_batcher() -> WriteBatcher:
+    """
+    Return the shared write batcher, creating it on first use.
+    
+    Returns:
+        Write batcher configured from settings
+    """
+    global _write_batcher
+    if _write_batcher is None:
+        _write_batcher = WriteBatcher(
+            cache=dictionary_cache,
+            max_batch_size=settings.DICTIONARY_WRITE_BATCH_MAX_SIZE,
+            max_delay_seconds=settings.DICTIONARY_WRITE_BATCH_MAX_DELAY_MS / 1000,
+            breaker=database_breaker if settings.DB_CIRCUIT_BREAKER_ENABLED else None
+        )
+    return _write_batcher
+
+
+async def shutdown_write_batcher() -> None:
+    """Flush and drop the shared write batcher if it was started."""
+    global _write_batcher
+    if _write_batcher is not None:
+        await _write_batcher.close()
+        _write_batcher = None
@@ -0,0 +1,102 @@
+"""SQLAlchemy models for the jobs module."""
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy.sql import false, func
+
+from app.core.database import Base
+
+
+class Job(Base):
+    """
+    SQLAlchemy model for a background job.
+    
+    Jobs run in chunks; after each chunk its checkpoint and progress are
+    committed, so a job picked up again after a restart resumes from the
+    last completed chunk.
+    """
+    
+    __tablename__ = "jobs"
+    
+    id = Column(
+        Integer,
+        primary_key=True,
+        doc="Primary key identifier"
+    )
+    type = Column(
+        String,
+        nullable=False,
+        doc="Job type, selecting the handler that runs it"
+    )
+    status = Column(
+        String,
+        nullable=False,
+        default="queued",
+        server_default="queued",
+        index=True,
+        doc="queued, running, succeeded, failed or cancelled"
+    )
+    params = Column(
+        Text,
+        nullable=False,
+        default="{}",
+        server_default="{}",
+        doc="JSON-encoded handler parameters"
+    )
+    checkpoint = Column(
+        Text,
+        nullable=True,
+        doc="JSON-encoded handler position after the last completed chunk"
+    )
+    processed = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Units of work completed"
+    )
+    total = Column(
+        Integer,
+        nullable=True,
+        doc="Units of work in the job, once known"
+    )
+    error = Column(
+        Text,
+        nullable=True,
+        doc="Failure message for failed jobs"
+    )
+    cancel_requested = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=false(),
+        doc="Set to stop the job after its current chunk"
+    )
+    worker_id = Column(
+        String,
+        nullable=True,
+        doc="Process currently running the job"
+    )
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        doc="Timestamp when the job was submitted"
+    )
+    started_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="Timestamp when the job first started running"
+    )
+    heartbeat_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="Timestamp of the last claim or checkpoint by the running worker"
+    )
+    finished_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="Timestamp when the job reached a final status"
+    )
+    
+    def __repr__(self) -> str:
+        """String representation of the model."""
+        return f"<Job(id={self.id}, type='{self.type}', status='{self.status}')>"
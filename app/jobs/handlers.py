@@ -0,0 +1,264 @@
+"""Job handlers: the chunked work behind each job type."""
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.dictionary.cache import normalize_word
+from app.dictionary.repository import DictionaryRepository
+from app.dictionary.snapshot import rebuild_snapshot, snapshot_store
+
+IMPORT_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+class ChunkResult:
+    """Outcome of one chunk of a job."""
+    
+    __slots__ = ("processed", "total", "checkpoint", "done")
+    
+    def __init__(
+        self,
+        processed: int,
+        total: Optional[int],
+        checkpoint: Optional[Dict[str, Any]],
+        done: bool
+    ) -> None:
+        """
+        Initialize the result.
+        
+        Args:
+            processed: Units completed by this chunk
+            total: Units in the whole job, if known
+            checkpoint: Position to resume from after this chunk
+            done: Whether the job has no work left
+        """
+        self.processed = processed
+        self.total = total
+        self.checkpoint = checkpoint
+        self.done = done
+
+
+class JobHandler(ABC):
+    """
+    Work for one job type, split into resumable chunks.
+    
+    run_chunk writes through the given session without committing; the
+    runner commits the chunk together with its checkpoint, so a chunk is
+    either fully applied and recorded or not at all.
+    """
+    
+    job_type: str = ""
+    
+    def validate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Check submitted parameters before the job is queued.
+        
+        Args:
+            params: Parameters from the submit request
+        
+        Returns:
+            Normalized parameters to store with the job
+        
+        Raises:
+            ValueError: If the parameters are invalid
+        """
+        return params
+    
+    @abstractmethod
+    def run_chunk(
+        self,
+        db: Session,
+        params: Dict[str, Any],
+        checkpoint: Optional[Dict[str, Any]],
+        chunk_size: int
+    ) -> ChunkResult:
+        """
+        Run the next chunk of work.
+        
+        Args:
+            db: Session for the chunk's transaction
+            params: Stored job parameters
+            checkpoint: Position returned by the previous chunk, None at start
+            chunk_size: Maximum units to process
+        
+        Returns:
+            Progress made and the position to resume from
+        """
+        pass
+
+
+class DictionaryImportHandler(JobHandler):
+    """
+    Import dictionary entries from a file, one entry per line.
+    
+    CSV lines are ``word,definition``; NDJSON lines are objects with word
+    and definition keys. Words already in the dictionary, or repeated in
+    the file, are skipped. Files must live under JOBS_IMPORT_DIR.
+    """
+    
+    job_type = "dictionary_import"
+    
+    def validate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve the import file inside JOBS_IMPORT_DIR and its format."""
+        if not settings.JOBS_IMPORT_DIR:
+            raise ValueError("Dictionary imports are disabled: JOBS_IMPORT_DIR is not set")
+        name = params.get("path")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("'path' is required")
+        
+        root = os.path.realpath(settings.JOBS_IMPORT_DIR)
+        path = os.path.realpath(os.path.join(root, name))
+        if os.path.commonpath([root, path]) != root:
+            raise ValueError("'path' must be inside the import directory")
+        if not os.path.isfile(path):
+            raise ValueError(f"Import file '{name}' not found")
+        
+        file_format = params.get("format") or IMPORT_FORMATS.get(os.path.splitext(path)[1].lower(), "csv")
+        if file_format not in ("csv", "ndjson"):
+            raise ValueError("'format' must be 'csv' or 'ndjson'")
+        return {"path": path, "format": file_format}
+    
+    def run_chunk(
+        self,
+        db: Session,
+        params: Dict[str, Any],
+        checkpoint: Optional[Dict[str, Any]],
+        chunk_size: int
+    ) -> ChunkResult:
+        """Import the next chunk_size lines after the checkpointed byte offset."""
+        if checkpoint is None:
+            checkpoint = {"offset": 0, "total": _count_lines(params["path"]), "imported": 0, "skipped": 0}
+        
+        lines: List[bytes] = []
+        with open(params["path"], "rb") as source:
+            source.seek(checkpoint["offset"])
+            while len(lines) < chunk_size:
+                line = source.readline()
+                if not line:
+                    break
+                lines.append(line)
+            offset = source.tell()
+            done = not source.readline()
+        
+        items, invalid = _parse_lines(lines, params["format"])
+        repository = DictionaryRepository(db)
+        seen = {normalize_word(entry.word) for entry in repository.find_by_words([word for word, _ in items])}
+        accepted: List[Tuple[str, str]] = []
+        for word, definition in items:
+            key = normalize_word(word)
+            if key not in seen:
+                seen.add(key)
+                accepted.append((word, definition))
+        if accepted:
+            repository.create_many(accepted)
+            repository.record_changes([word for word, _ in accepted], "add")
+        
+        return ChunkResult(
+            processed=len(lines),
+            total=checkpoint["total"],
+            checkpoint={
+                "offset": offset,
+                "total": checkpoint["total"],
+                "imported": checkpoint["imported"] + len(accepted),
+                "skipped": checkpoint["skipped"] + invalid + len(items) - len(accepted),
+            },
+            done=done
+        )
+
+
+class SnapshotRebuildHandler(JobHandler):
+    """Rebuild the memory-mapped dictionary snapshot and reload it in this worker."""
+    
+    job_type = "snapshot_rebuild"
+    
+    def validate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Require a configured snapshot path."""
+        if not settings.DICTIONARY_SNAPSHOT_PATH:
+            raise ValueError("Snapshots are disabled: DICTIONARY_SNAPSHOT_PATH is not set")
+        return {}
+    
+    def run_chunk(
+        self,
+        db: Session,
+        params: Dict[str, Any],
+        checkpoint: Optional[Dict[str, Any]],
+        chunk_size: int
+    ) -> ChunkResult:
+        """Rebuild the snapshot in a single step."""
+        path = settings.DICTIONARY_SNAPSHOT_PATH
+        rebuild_snapshot(path)
+        snapshot_store.refresh(path)
+        return ChunkResult(processed=1, total=1, checkpoint=None, done=True)
+
+
+def _count_lines(path: str) -> int:
+    """Count the lines in a file without decoding it."""
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as source:
+        for block in iter(lambda: source.read(1 << 20), b""):
+            count += block.count(b"\n")
+            last = block[-1:]
+    return count + (last != b"\n")
+
+
+def _parse_lines(lines: List[bytes], file_format: str) -> Tuple[List[Tuple[str, str]], int]:
+    """
+    Parse import lines into (word, definition) pairs.
+    
+    Args:
+        lines: Raw lines including their newline
+        file_format: 'csv' or 'ndjson'
+    
+    Returns:
+        Valid pairs and the number of invalid non-blank lines
+    """
+    items: List[Tuple[str, str]] = []
+    invalid = 0
+    for raw in lines:
+        try:
+            text = raw.decode("utf-8").strip()
+            if not text:
+                continue
+            if file_format == "ndjson":
+                record = json.loads(text)
+                word, definition = record["word"], record["definition"]
+            else:
+                word, definition = next(csv.reader([text]))
+        except (UnicodeDecodeError, ValueError, KeyError, TypeError):
+            invalid += 1
+            continue
+        if isinstance(word, str) and isinstance(definition, str) and word.strip() and definition.strip():
+            items.append((word, definition))
+        else:
+            invalid += 1
+    return items, invalid
+
+
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    handler.job_type: handler
+    for handler in (DictionaryImportHandler(), SnapshotRebuildHandler())
+}
+
+
+def get_handler(job_type: str) -> JobHandler:
+    """
+    Look up the handler for a job type.
+    
+    Args:
+        job_type: Job type name
+    
+    Returns:
+        The registered handler
+    
+    Raises:
+        ValueError: If the job type is unknown
+    """
+    handler = JOB_HANDLERS.get(job_type)
+    if handler is None:
+        raise ValueError(f"Unknown job type '{job_type}'; expected one of {sorted(JOB_HANDLERS)}")
+    return handler
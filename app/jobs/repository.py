@@ -0,0 +1,211 @@
+"""Repository pattern implementation for background jobs."""
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from app.jobs.db_models import Job
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINAL_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+def _utcnow() -> datetime:
+    """Return the current UTC time."""
+    return datetime.now(timezone.utc)
+
+
+class JobRepository:
+    """
+    Data access for the jobs table.
+    
+    Claims and checkpoints are conditional updates, so several workers,
+    in one process or many, can share the table without double-running a
+    job or committing a chunk for a job they no longer own.
+    """
+    
+    def __init__(self, db: Session) -> None:
+        """
+        Initialize repository with database session.
+        
+        Args:
+            db: SQLAlchemy database session
+        """
+        self._db = db
+    
+    def create(self, job_type: str, params: str) -> Job:
+        """
+        Queue a new job.
+        
+        Args:
+            job_type: Handler name
+            params: JSON-encoded handler parameters
+        
+        Returns:
+            The queued job
+        """
+        job = Job(type=job_type, params=params, status=QUEUED)
+        self._db.add(job)
+        self._db.flush()
+        self._db.refresh(job)
+        return job
+    
+    def get(self, job_id: int) -> Optional[Job]:
+        """
+        Find a job by id.
+        
+        Args:
+            job_id: Job identifier
+        
+        Returns:
+            The job if found, None otherwise
+        """
+        return self._db.get(Job, job_id, populate_existing=True)
+    
+    def claim_next(self, worker_id: str, stale_before: datetime) -> Optional[Job]:
+        """
+        Claim the oldest runnable job for a worker.
+        
+        Runnable jobs are queued ones and running ones whose worker has
+        not checkpointed since stale_before, which resumes jobs orphaned
+        by a crashed or killed process.
+        
+        Args:
+            worker_id: Identifier of the claiming worker
+            stale_before: Heartbeats older than this count as abandoned
+        
+        Returns:
+            The claimed job, or None if nothing is runnable
+        """
+        runnable = or_(
+            Job.status == QUEUED,
+            (Job.status == RUNNING) & (Job.heartbeat_at < stale_before)
+        )
+        candidates = self._db.execute(
+            select(Job.id).where(runnable).order_by(Job.id).limit(5)
+        ).scalars().all()
+        
+        for job_id in candidates:
+            now = _utcnow()
+            claimed = self._db.execute(
+                update(Job)
+                .where(Job.id == job_id, runnable)
+                .values(status=RUNNING, worker_id=worker_id, heartbeat_at=now)
+            ).rowcount
+            if claimed:
+                self._db.execute(
+                    update(Job).where(Job.id == job_id, Job.started_at.is_(None)).values(started_at=now)
+                )
+                self._db.commit()
+                return self.get(job_id)
+        self._db.rollback()
+        return None
+    
+    def save_progress(
+        self,
+        job_id: int,
+        worker_id: str,
+        processed: int,
+        total: Optional[int],
+        checkpoint: Optional[str]
+    ) -> bool:
+        """
+        Record a completed chunk in the current transaction.
+        
+        Args:
+            job_id: Job identifier
+            worker_id: Worker that ran the chunk
+            processed: Units completed so far
+            total: Units in the job, if known
+            checkpoint: JSON-encoded position after the chunk
+        
+        Returns:
+            False if the worker no longer owns the job; the caller must
+            then roll back the chunk
+        """
+        return bool(self._db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.worker_id == worker_id, Job.status == RUNNING)
+            .values(processed=processed, total=total, checkpoint=checkpoint, heartbeat_at=_utcnow())
+        ).rowcount)
+    
+    def is_cancel_requested(self, job_id: int) -> bool:
+        """
+        Check whether cancellation was requested for a job.
+        
+        Args:
+            job_id: Job identifier
+        
+        Returns:
+            True if the job should stop
+        """
+        return bool(self._db.execute(
+            select(Job.cancel_requested).where(Job.id == job_id)
+        ).scalar())
+    
+    def finish(self, job_id: int, worker_id: str, status: str, error: Optional[str] = None) -> None:
+        """
+        Move a job owned by worker_id to a final status.
+        
+        Args:
+            job_id: Job identifier
+            worker_id: Worker that ran the job
+            status: succeeded, failed or cancelled
+            error: Failure message
+        """
+        self._db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.worker_id == worker_id, Job.status == RUNNING)
+            .values(status=status, error=error, worker_id=None, finished_at=_utcnow())
+        )
+    
+    def request_cancel(self, job_id: int) -> Optional[Job]:
+        """
+        Cancel a queued job, or ask a running one to stop after its chunk.
+        
+        Args:
+            job_id: Job identifier
+        
+        Returns:
+            The updated job, or None if it does not exist
+        """
+        self._db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == QUEUED)
+            .values(status=CANCELLED, cancel_requested=True, finished_at=_utcnow())
+        )
+        self._db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == RUNNING)
+            .values(cancel_requested=True)
+        )
+        return self.get(job_id)
+    
+    def requeue_owned(self, worker_id: str) -> int:
+        """
+        Hand a worker's running jobs back to the queue, keeping checkpoints.
+        
+        Args:
+            worker_id: Worker that is shutting down
+        
+        Returns:
+            Number of jobs requeued
+        """
+        return self._db.execute(
+            update(Job)
+            .where(Job.worker_id == worker_id, Job.status == RUNNING)
+            .values(status=QUEUED, worker_id=None)
+        ).rowcount
+    
+    def commit(self) -> None:
+        """Commit current transaction."""
+        self._db.commit()
+    
+    def rollback(self) -> None:
+        """Rollback current transaction."""
+        self._db.rollback()
@@ -0,0 +1,83 @@
+"""Background job API routes."""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+import logging
+
+from app.core.content_negotiation import NegotiatedResponse, NegotiatedRoute
+from app.core.database import get_db
+from app.core.executor import run_blocking
+from app.jobs.runner import get_job_runner
+from app.jobs.schemas import JobResponse, JobSubmitRequest
+from app.jobs.service import get_job_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
+
+
+@router.post("", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(
+    request: JobSubmitRequest,
+    db: Session = Depends(get_db)
+) -> JobResponse:
+    """
+    Queue a long-running job.
+    
+    Args:
+        request: Job type and parameters
+        db: Database session
+    
+    Returns:
+        The queued job; poll GET /jobs/{id} for progress
+    
+    Raises:
+        HTTPException: If the job type or parameters are invalid
+    """
+    try:
+        job = await run_blocking(get_job_service(db).submit, request.type, request.params)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    runner = get_job_runner()
+    if runner is not None:
+        runner.notify()
+    return job
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: int,
+    db: Session = Depends(get_db)
+) -> JobResponse:
+    """
+    Get a job's status, progress, throughput and ETA.
+    
+    Args:
+        job_id: Job identifier
+        db: Database session
+    
+    Returns:
+        The job
+    """
+    return await run_blocking(get_job_service(db).get, job_id)
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+async def cancel_job(
+    job_id: int,
+    db: Session = Depends(get_db)
+) -> JobResponse:
+    """
+    Cancel a job; a running job stops after its current chunk.
+    
+    Args:
+        job_id: Job identifier
+        db: Database session
+    
+    Returns:
+        The job after the cancellation request
+    """
+    return await run_blocking(get_job_service(db).cancel, job_id)
@@ -0,0 +1,255 @@
+"""In-process job runner with a bounded number of concurrent jobs."""
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.executor import run_blocking
+from app.core.metrics import metrics
+from app.jobs.db_models import Job
+from app.jobs.handlers import get_handler
+from app.jobs.repository import CANCELLED, FAILED, SUCCEEDED, JobRepository
+
+logger = logging.getLogger(__name__)
+
+CONTINUE = "continue"
+LOST = "lost"
+
+
+class JobRunner:
+    """
+    Claim jobs from the jobs table and run them chunk by chunk.
+    
+    Each of max_workers coroutines claims one job at a time and runs its
+    chunks on the service executor. After every chunk the checkpoint is
+    committed with the chunk's writes and cancellation is checked. Jobs
+    left running by a process that stopped checkpointing for
+    stale_after_seconds are claimed again and resume from their last
+    checkpoint; on a clean shutdown the runner requeues its jobs itself.
+    """
+    
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_workers: int = 2,
+        chunk_size: int = 5_000,
+        poll_interval_seconds: float = 2.0,
+        stale_after_seconds: float = 60.0,
+        worker_id: Optional[str] = None
+    ) -> None:
+        """
+        Initialize the runner.
+        
+        Args:
+            session_factory: Creates a database session per chunk
+            max_workers: Jobs run concurrently by this process
+            chunk_size: Units each handler processes per chunk
+            poll_interval_seconds: Delay between checks for runnable jobs
+            stale_after_seconds: Checkpoint age after which a running job
+                is considered abandoned
+            worker_id: Identifier recorded on claimed jobs
+        """
+        self._session_factory = session_factory
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+    
+    def start(self) -> None:
+        """Start the worker coroutines on the running event loop."""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._work_loop()) for _ in range(self.max_workers)]
+            logger.info("Started job runner %s with %d workers", self.worker_id, self.max_workers)
+    
+    def notify(self) -> None:
+        """Wake idle workers after a job was submitted."""
+        self._wakeup.set()
+    
+    async def close(self) -> None:
+        """Stop the workers and hand their unfinished jobs back to the queue."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(Exception, asyncio.CancelledError):
+                await task
+        self._tasks = []
+        requeued = await run_blocking(self._requeue_owned)
+        if requeued:
+            logger.info("Requeued %d unfinished jobs", requeued)
+    
+    async def _work_loop(self) -> None:
+        """Claim and run jobs until cancelled."""
+        while True:
+            self._wakeup.clear()
+            try:
+                job = await run_blocking(self.claim_next)
+            except Exception as e:
+                logger.warning("Failed to claim a job: %s", e)
+                job = None
+            if job is None:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval_seconds)
+                continue
+            await self.run_job(job)
+    
+    async def run_job(self, job: Job) -> str:
+        """
+        Run a claimed job to completion, cancellation or failure.
+        
+        Args:
+            job: Job claimed by this runner
+        
+        Returns:
+            The job's final status, or 'lost' if another worker took it over
+        """
+        logger.info("Running job %d (%s) from %d processed", job.id, job.type, job.processed)
+        checkpoint = json.loads(job.checkpoint) if job.checkpoint else None
+        processed = job.processed
+        outcome = CONTINUE
+        while outcome == CONTINUE:
+            try:
+                outcome, checkpoint, processed = await run_blocking(
+                    self.run_chunk, job.id, job.type, job.params, checkpoint, processed
+                )
+            except Exception as e:
+                logger.exception("Job %d failed", job.id)
+                await run_blocking(self._finish, job.id, FAILED, str(e))
+                outcome = FAILED
+        metrics.increment(f"jobs.{outcome}")
+        logger.info("Job %d finished: %s", job.id, outcome)
+        return outcome
+    
+    def claim_next(self) -> Optional[Job]:
+        """
+        Claim the oldest runnable job.
+        
+        Returns:
+            The claimed job, or None if nothing is runnable
+        """
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=self.stale_after_seconds)
+        db = self._session_factory()
+        try:
+            return JobRepository(db).claim_next(self.worker_id, stale_before)
+        finally:
+            db.close()
+    
+    def run_chunk(
+        self,
+        job_id: int,
+        job_type: str,
+        params: str,
+        checkpoint: Optional[Dict[str, Any]],
+        processed: int
+    ) -> Tuple[str, Optional[Dict[str, Any]], int]:
+        """
+        Run and commit one chunk of a job.
+        
+        Args:
+            job_id: Job identifier
+            job_type: Handler name
+            params: JSON-encoded handler parameters
+            checkpoint: Position after the previous chunk
+            processed: Units completed before this chunk
+        
+        Returns:
+            (outcome, checkpoint, processed) where outcome is 'continue',
+            'succeeded', 'cancelled' or 'lost'
+        """
+        db = self._session_factory()
+        try:
+            repository = JobRepository(db)
+            if repository.is_cancel_requested(job_id):
+                repository.finish(job_id, self.worker_id, CANCELLED)
+                repository.commit()
+                return CANCELLED, checkpoint, processed
+            
+            result = get_handler(job_type).run_chunk(db, json.loads(params), checkpoint, self.chunk_size)
+            processed += result.processed
+            owned = repository.save_progress(
+                job_id,
+                self.worker_id,
+                processed,
+                result.total,
+                json.dumps(result.checkpoint) if result.checkpoint is not None else None
+            )
+            if not owned:
+                repository.rollback()
+                logger.warning("Lost ownership of job %d; discarding its last chunk", job_id)
+                return LOST, checkpoint, processed - result.processed
+            if result.done:
+                repository.finish(job_id, self.worker_id, SUCCEEDED)
+            repository.commit()
+            metrics.increment("jobs.units_processed", result.processed)
+            return (SUCCEEDED if result.done else CONTINUE), result.checkpoint, processed
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    
+    def _finish(self, job_id: int, status: str, error: Optional[str] = None) -> None:
+        """Record a final status in its own transaction."""
+        db = self._session_factory()
+        try:
+            repository = JobRepository(db)
+            repository.finish(job_id, self.worker_id, status, error)
+            repository.commit()
+        finally:
+            db.close()
+    
+    def _requeue_owned(self) -> int:
+        """Requeue this runner's running jobs in their own transaction."""
+        db = self._session_factory()
+        try:
+            repository = JobRepository(db)
+            requeued = repository.requeue_owned(self.worker_id)
+            repository.commit()
+            return requeued
+        finally:
+            db.close()
+
+
+_job_runner: Optional[JobRunner] = None
+
+
+def get_job_runner() -> Optional[JobRunner]:
+    """Return this process's job runner, if it was started."""
+    return _job_runner
+
+
+def start_job_runner() -> JobRunner:
+    """
+    Create and start the shared job runner from settings.
+    
+    Returns:
+        The running job runner
+    """
+    global _job_runner
+    if _job_runner is None:
+        _job_runner = JobRunner(
+            max_workers=settings.JOBS_MAX_WORKERS,
+            chunk_size=settings.JOBS_CHUNK_SIZE,
+            poll_interval_seconds=settings.JOBS_POLL_INTERVAL,
+            stale_after_seconds=settings.JOBS_STALE_AFTER
+        )
+        _job_runner.start()
+    return _job_runner
+
+
+async def shutdown_job_runner() -> None:
+    """Stop the shared job runner if it was started."""
+    global _job_runner
+    if _job_runner is not None:
+        await _job_runner.close()
+        _job_runner = None
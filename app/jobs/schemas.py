@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class JobSubmitRequest(BaseModel):
+    type: str = Field(..., description="Job type, e.g. 'dictionary_import' or 'snapshot_rebuild'")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Parameters for the job type")
+
+
+class JobResponse(BaseModel):
+    """Job status with progress, throughput and estimated time left"""
+    id: int
+    type: str
+    status: str
+    processed: int
+    total: Optional[int] = None
+    progress: Optional[float] = Field(None, description="Fraction of the job completed")
+    throughput_per_second: Optional[float] = Field(None, description="Units processed per second since start")
+    eta_seconds: Optional[float] = Field(None, description="Estimated seconds until completion")
+    cancel_requested: bool
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,147 @@
+"""Business logic for background jobs."""
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import JobNotFoundError
+from app.jobs.db_models import Job
+from app.jobs.handlers import get_handler
+from app.jobs.repository import FINAL_STATUSES, RUNNING, JobRepository
+from app.jobs.schemas import JobResponse
+
+logger = logging.getLogger(__name__)
+
+
+class JobService:
+    """
+    Service for submitting, inspecting and cancelling jobs.
+    
+    Jobs are only recorded here; a JobRunner picks them up from the table.
+    """
+    
+    def __init__(self, repository: JobRepository) -> None:
+        """
+        Initialize service with repository dependency.
+        
+        Args:
+            repository: Job repository
+        """
+        self._repository = repository
+    
+    def submit(self, job_type: str, params: Dict[str, Any]) -> JobResponse:
+        """
+        Validate and queue a job.
+        
+        Args:
+            job_type: Handler name
+            params: Handler parameters
+        
+        Returns:
+            The queued job
+        
+        Raises:
+            ValueError: If the job type or parameters are invalid
+        """
+        normalized = get_handler(job_type).validate(params)
+        job = self._repository.create(job_type, json.dumps(normalized))
+        self._repository.commit()
+        logger.info("Queued job %d (%s)", job.id, job_type)
+        return describe_job(job)
+    
+    def get(self, job_id: int) -> JobResponse:
+        """
+        Retrieve a job with its progress.
+        
+        Args:
+            job_id: Job identifier
+        
+        Returns:
+            The job's status, progress, throughput and ETA
+        
+        Raises:
+            JobNotFoundError: If the job does not exist
+        """
+        job = self._repository.get(job_id)
+        if job is None:
+            raise JobNotFoundError(job_id)
+        return describe_job(job)
+    
+    def cancel(self, job_id: int) -> JobResponse:
+        """
+        Cancel a queued job, or stop a running one after its current chunk.
+        
+        Args:
+            job_id: Job identifier
+        
+        Returns:
+            The job after the request
+        
+        Raises:
+            JobNotFoundError: If the job does not exist
+        """
+        job = self._repository.request_cancel(job_id)
+        self._repository.commit()
+        if job is None:
+            raise JobNotFoundError(job_id)
+        return describe_job(job)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive timestamps (as SQLite returns them) as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def describe_job(job: Job) -> JobResponse:
+    """
+    Build the API view of a job, deriving progress, throughput and ETA.
+    
+    Throughput averages over the time since the job first started, so it
+    includes any time the job spent waiting to be resumed.
+    
+    Args:
+        job: Job row
+    
+    Returns:
+        Job response
+    """
+    progress = throughput = eta = None
+    if job.total:
+        progress = min(1.0, job.processed / job.total)
+    if job.started_at is not None and job.processed:
+        end = _as_utc(job.finished_at) if job.status in FINAL_STATUSES and job.finished_at else datetime.now(timezone.utc)
+        elapsed = (end - _as_utc(job.started_at)).total_seconds()
+        if elapsed > 0:
+            throughput = job.processed / elapsed
+            if job.status == RUNNING and job.total:
+                eta = max(0, job.total - job.processed) / throughput
+    return JobResponse(
+        id=job.id,
+        type=job.type,
+        status=job.status,
+        processed=job.processed,
+        total=job.total,
+        progress=progress,
+        throughput_per_second=throughput,
+        eta_seconds=eta,
+        cancel_requested=job.cancel_requested,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at
+    )
+
+
+def get_job_service(db: Session) -> JobService:
+    """
+    Factory function to create the job service with its repository.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Configured JobService instance
+    """
+    return JobService(JobRepository(db))
@@ -1,21 +1,47 @@
 """Main FastAPI application."""
-from fastapi import FastAPI
+from fastapi import FastAPI, Query, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+import asyncio
+import contextlib
 import logging
+from typing import List
 
+from app.core.admission import AdmissionBudget, AdmissionControlMiddleware
+from app.core.body_limits import BodySizeLimitMiddleware
 from app.core.config import settings
+from app.core.executor import run_blocking, shutdown_executor
+from app.core.logging_config import configure_logging
+from app.core.memoization import ResponseMemoMiddleware
+from app.core.memory_profiling import MemoryProfilingMiddleware, memory_profiler
+from app.core.metrics import metrics
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.readiness import readiness
+from app.core.tracing import TracingMiddleware, configure_tracing, tracer
 from app.core.startup import wait_for_database
+from app.dictionary.change_feed import run_change_feed_listener
+from app.dictionary.popularity import (
+    WARMUP_READINESS_CHECK,
+    run_hit_count_flusher,
+    warm_up_dictionary_cache
+)
 from app.dictionary.router import router as dictionary_router
+from app.dictionary.snapshot import run_snapshot_maintainer
+from app.dictionary.suggestions import run_suggestion_index_maintainer
+from app.dictionary.write_batcher import shutdown_write_batcher
+from app.jobs.router import router as jobs_router
+from app.jobs.runner import shutdown_job_runner, start_job_runner
 from app.shopping.router import router as shopping_router
 from app.words.router import router as words_router
+from app.words.service import shutdown_process_pool
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Configure non-blocking logging and tracing
+configure_logging(settings)
+configure_tracing(settings)
 logger = logging.getLogger(__name__)
 
+_startup_tasks: List[asyncio.Task] = []
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
@@ -24,13 +50,102 @@ app = FastAPI(
 )
 
 
+async def prepare_readiness() -> None:
+    """Wait for the database, then warm caches and start jobs before reporting ready."""
+    await wait_for_database()
+    await warm_up_dictionary_cache()
+    if settings.JOBS_ENABLED:
+        start_job_runner()
+
+
 @app.on_event("startup")
 async def startup_event() -> None:
-    """Initialize application on startup."""
-    wait_for_database()
+    """
+    Start background readiness work without delaying the server.
+    
+    The app starts serving liveness probes immediately; readiness is
+    reported by /health/ready once the database is reachable and the
+    dictionary cache is warm.
+    """
+    readiness.register("database")
+    readiness.register(WARMUP_READINESS_CHECK)
+    _startup_tasks.append(asyncio.create_task(prepare_readiness()))
+    _startup_tasks.append(asyncio.create_task(run_hit_count_flusher()))
+    _startup_tasks.append(asyncio.create_task(run_change_feed_listener()))
+    if settings.DICTIONARY_SUGGEST_ENABLED:
+        _startup_tasks.append(asyncio.create_task(run_suggestion_index_maintainer()))
+    if settings.DICTIONARY_SNAPSHOT_PATH:
+        _startup_tasks.append(asyncio.create_task(run_snapshot_maintainer()))
     logger.info("Application startup complete")
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Cancel pending startup work and release worker pools on shutdown."""
+    for task in _startup_tasks:
+        task.cancel()
+        with contextlib.suppress(Exception, asyncio.CancelledError):
+            await task
+    _startup_tasks.clear()
+    await shutdown_job_runner()
+    await shutdown_write_batcher()
+    shutdown_process_pool()
+    shutdown_executor()
+    tracer.shutdown()
+
+
+# Count SQL statements per request; innermost so it sees only route work
+app.add_middleware(QueryStatsMiddleware)
+
+# Record peak traced allocation per route when profiling is switched on
+if settings.MEMORY_PROFILING_ENABLED:
+    memory_profiler.start(settings.MEMORY_PROFILING_FRAMES)
+    app.add_middleware(MemoryProfilingMiddleware, profiler=memory_profiler)
+
+# Shed load before it queues up behind slow dependencies; added before
+# CORS so shed responses still carry CORS headers
+if settings.ADMISSION_CONTROL_ENABLED:
+    cheap_budget = AdmissionBudget(
+        "cheap",
+        max_concurrent=settings.ADMISSION_CHEAP_MAX_CONCURRENT,
+        max_queue=settings.ADMISSION_CHEAP_MAX_QUEUE,
+        max_wait_seconds=settings.ADMISSION_CHEAP_MAX_WAIT
+    )
+    db_budget = AdmissionBudget(
+        "db",
+        max_concurrent=settings.admission_db_max_concurrent,
+        max_queue=settings.ADMISSION_DB_MAX_QUEUE,
+        max_wait_seconds=settings.ADMISSION_DB_MAX_WAIT
+    )
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        budgets=[
+            ("/shopping", cheap_budget),
+            ("/word", cheap_budget),
+            ("/dictionary", db_budget),
+        ],
+        retry_after_seconds=settings.ADMISSION_RETRY_AFTER
+    )
+
+# Replay identical requests to pure routes before admission control, so
+# hits never take a slot
+if settings.memo_routes:
+    app.add_middleware(
+        ResponseMemoMiddleware,
+        paths=settings.memo_routes,
+        max_entries=settings.MEMO_CACHE_SIZE,
+        ttl_seconds=settings.MEMO_CACHE_TTL,
+        max_body_bytes=settings.MEMO_MAX_BODY_BYTES
+    )
+
+# Reject oversized bodies outermost, before memoization buffers them or
+# Pydantic parses them
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_bytes=settings.MAX_REQUEST_BODY_BYTES,
+    path_limits=settings.request_body_limits
+)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +155,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Trace requests outermost so server spans cover admission queueing and
+# memoized replays too
+if settings.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+
 # Include routers
 app.include_router(
     dictionary_router,
@@ -56,6 +176,11 @@ app.include_router(
     prefix="/word",
     tags=["Words"]
 )
+app.include_router(
+    jobs_router,
+    prefix="/jobs",
+    tags=["Jobs"]
+)
 
 
 @app.get("/")
@@ -70,6 +195,27 @@ async def root() -> dict:
 
 @app.get("/health")
 async def health() -> dict:
-    """Health check endpoint."""
+    """Liveness check endpoint; never touches dependencies."""
     return {"status": "healthy"}
 
+
+@app.get("/health/ready")
+async def health_ready() -> JSONResponse:
+    """Readiness check reflecting database and cache warm-up state."""
+    ready = readiness.is_ready
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "ready" if ready else "starting", "checks": readiness.checks}
+    )
+
+
+@app.get("/metrics")
+async def get_metrics() -> dict:
+    """Expose in-process counters, gauges and summaries."""
+    return metrics.snapshot()
+
+
+@app.get("/admin/memory")
+async def get_memory_profile(limit: int = Query(20, ge=1, le=200)) -> dict:
+    """Report RSS, per-route peak allocations and the top allocation sites."""
+    return await run_blocking(memory_profiler.report, limit)
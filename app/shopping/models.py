@@ -1,11 +1,41 @@
 from pydantic import BaseModel, Field
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+
+class DiscountTier(BaseModel):
+    min_quantity: int = Field(..., ge=1, description="Units of one item needed for this tier to apply")
+    percent: float = Field(..., ge=0, le=100, description="Percentage taken off the item's line")
+
+
+class ShoppingRuleSet(BaseModel):
+    version: str = Field(
+        ...,
+        min_length=1,
+        max_length=64,
+        description="Identifies the rule set; a version is compiled once and reused, so publish changes under a new one"
+    )
+    category_tax: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Tax rate per category as a decimal; other items use the request's tax rate"
+    )
+    discounts: Dict[str, List[DiscountTier]] = Field(
+        default_factory=dict,
+        description="Quantity discount tiers per category; the highest tier reached applies"
+    )
 
 
 class ShoppingTotalRequest(BaseModel):
     costs: Dict[str, float] = Field(..., description="Dictionary mapping item names to their costs")
     items: List[str] = Field(..., description="List of items to calculate total for")
     tax: float = Field(..., ge=0, description="Tax rate as a decimal (e.g., 0.1 for 10%)")
+    categories: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Dictionary mapping item names to rule set categories"
+    )
+    rules: Optional[ShoppingRuleSet] = Field(
+        default=None,
+        description="Per-category tax and discount rules; the flat tax rate applies when omitted"
+    )
 
 
 class ShoppingTotalResponse(BaseModel):
@@ -14,4 +44,5 @@ class ShoppingTotalResponse(BaseModel):
     total: float
     items_found: List[str]
     items_not_found: List[str]
-
+    discount_amount: Optional[float] = None
+    rule_set_version: Optional[str] = None
@@ -2,27 +2,40 @@
 from fastapi import APIRouter
 import logging
 
+from app.core.config import settings
+from app.core.content_negotiation import NegotiatedResponse, NegotiatedRoute
+from app.core.executor import run_blocking
 from app.shopping.models import ShoppingTotalRequest, ShoppingTotalResponse
 from app.shopping.service import ShoppingCalculatorService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
 calculator_service = ShoppingCalculatorService()
 
 
-@router.post("/total", response_model=ShoppingTotalResponse)
+@router.post(
+    "/total",
+    response_model=ShoppingTotalResponse,
+    response_model_exclude_none=True
+)
 async def calculate_total(
     request: ShoppingTotalRequest
 ) -> ShoppingTotalResponse:
     """
     Calculate total cost of purchased items plus tax.
     
+    With a rule set, items are taxed per category and quantity discount
+    tiers apply; the response then also reports the discount.
+    
     Args:
-        request: Shopping calculation request with costs, items, and tax rate
+        request: Shopping calculation request with costs, items, tax rate
+            and optional rules
         
     Returns:
         Shopping total response with breakdown
     """
+    if len(request.items) >= settings.EXECUTOR_OFFLOAD_MIN_ITEMS:
+        return await run_blocking(calculator_service.calculate_total, request)
     return calculator_service.calculate_total(request)
 
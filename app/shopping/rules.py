@@ -0,0 +1,226 @@
+"""Compiled per-category tax and quantity discount rules for shopping carts."""
+from bisect import bisect_right
+from collections import Counter
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, List
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.shopping.models import ShoppingRuleSet
+
+# Tax rates are kept in parts per million and discounts in basis points,
+# so every amount below is exact integer arithmetic on cents
+TAX_SCALE = 1_000_000
+DISCOUNT_SCALE = 10_000
+
+# Category slot for items without a rule set category
+DEFAULT_CATEGORY = 0
+
+
+def to_cents(amount: float) -> int:
+    """
+    Convert a currency amount to integer cents, rounding half up.
+    
+    Args:
+        amount: Amount in currency units
+    
+    Returns:
+        Amount in cents
+    """
+    return int((Decimal(str(amount)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def scale_rate(rate: float, scale: int) -> int:
+    """Convert a decimal rate to an integer on the given scale, rounding half up."""
+    return int((Decimal(str(rate)) * scale).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def _apply_rate(cents: int, scaled_rate: int, scale: int) -> int:
+    """Multiply cents by a scaled rate, rounding half away from zero."""
+    quotient, remainder = divmod(abs(cents) * scaled_rate, scale)
+    if remainder * 2 >= scale:
+        quotient += 1
+    return quotient if cents >= 0 else -quotient
+
+
+class CartPrice:
+    """Priced cart in integer cents."""
+    
+    __slots__ = ("subtotal", "discount", "tax", "items_found", "items_not_found")
+    
+    def __init__(
+        self,
+        subtotal: int,
+        discount: int,
+        tax: int,
+        items_found: List[str],
+        items_not_found: List[str]
+    ) -> None:
+        """
+        Initialize the price.
+        
+        Args:
+            subtotal: Cents before discounts and tax
+            discount: Cents taken off by discount tiers
+            tax: Cents of tax on the discounted lines
+            items_found: Requested items that have a cost, in request order
+            items_not_found: Requested items without a cost, in request order
+        """
+        self.subtotal = subtotal
+        self.discount = discount
+        self.tax = tax
+        self.items_found = items_found
+        self.items_not_found = items_not_found
+    
+    @property
+    def total(self) -> int:
+        """Cents payable after discounts and tax."""
+        return self.subtotal - self.discount + self.tax
+
+
+class CompiledRuleSet:
+    """
+    A rule set flattened into per-category lookup arrays.
+    
+    Categories become indices into tax_rates and the tier arrays; slot 0
+    holds items without a configured category, which are taxed at the
+    request's flat rate and get no discount.
+    """
+    
+    def __init__(self, rules: ShoppingRuleSet) -> None:
+        """
+        Compile a rule set.
+        
+        Args:
+            rules: Validated rule set from the request
+        """
+        self.version = rules.version
+        names = sorted(set(rules.category_tax) | set(rules.discounts))
+        self.category_index: Dict[str, int] = {name: index for index, name in enumerate(names, start=1)}
+        
+        size = len(names) + 1
+        self.tax_rates: List[int] = [0] * size
+        self.has_tax_rate: List[bool] = [False] * size
+        self.tier_quantities: List[List[int]] = [[] for _ in range(size)]
+        self.tier_discounts: List[List[int]] = [[] for _ in range(size)]
+        for name, rate in rules.category_tax.items():
+            index = self.category_index[name]
+            self.tax_rates[index] = scale_rate(rate, TAX_SCALE)
+            self.has_tax_rate[index] = True
+        for name, tiers in rules.discounts.items():
+            index = self.category_index[name]
+            ordered = sorted(tiers, key=lambda tier: tier.min_quantity)
+            self.tier_quantities[index] = [tier.min_quantity for tier in ordered]
+            self.tier_discounts[index] = [scale_rate(tier.percent, 100) for tier in ordered]
+    
+    def discount_rate(self, category: int, quantity: int) -> int:
+        """
+        Look up the discount tier reached by a line.
+        
+        Args:
+            category: Category index
+            quantity: Units of the item in the cart
+        
+        Returns:
+            Discount in basis points, 0 if no tier applies
+        """
+        tier = bisect_right(self.tier_quantities[category], quantity)
+        return self.tier_discounts[category][tier - 1] if tier else 0
+    
+    def price(
+        self,
+        items: List[str],
+        costs: Dict[str, float],
+        categories: Dict[str, str],
+        default_tax: float
+    ) -> CartPrice:
+        """
+        Price a cart in one grouped pass.
+        
+        Repeated items are counted once up front, so discounts and cost
+        conversions run per distinct item rather than per unit. Discounted
+        lines are summed per category and each category is taxed once.
+        
+        Args:
+            items: Requested item names, repeats meaning quantity
+            costs: Unit cost per item name
+            categories: Category per item name
+            default_tax: Flat tax rate for items without a categorized rate
+        
+        Returns:
+            The cart's price in cents
+        """
+        tax_rates = list(self.tax_rates)
+        tax_rates[DEFAULT_CATEGORY] = scale_rate(default_tax, TAX_SCALE)
+        for index, configured in enumerate(self.has_tax_rate):
+            if not configured:
+                tax_rates[index] = tax_rates[DEFAULT_CATEGORY]
+        
+        taxable = [0] * len(tax_rates)
+        subtotal = 0
+        discount = 0
+        for item, quantity in Counter(items).items():
+            cost = costs.get(item)
+            if cost is None:
+                continue
+            category = self.category_index.get(categories.get(item), DEFAULT_CATEGORY)
+            line = to_cents(cost) * quantity
+            line_discount = _apply_rate(line, self.discount_rate(category, quantity), DISCOUNT_SCALE)
+            subtotal += line
+            discount += line_discount
+            taxable[category] += line - line_discount
+        
+        tax = sum(
+            _apply_rate(cents, rate, TAX_SCALE)
+            for cents, rate in zip(taxable, tax_rates)
+            if cents
+        )
+        items_found = [item for item in items if item in costs]
+        items_not_found = [item for item in items if item not in costs]
+        return CartPrice(subtotal, discount, tax, items_found, items_not_found)
+
+
+class RuleSetCache:
+    """
+    Compiled rule sets keyed by version, shared across requests.
+    
+    A version is assumed to identify immutable rules: the first rule set
+    seen under a version is compiled and reused until it expires.
+    """
+    
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum compiled rule sets kept
+            ttl_seconds: Seconds a compiled rule set is reused
+        """
+        self._entries = LRUCache(max_size)
+        self._ttl_seconds = ttl_seconds
+    
+    def get(self, rules: ShoppingRuleSet) -> CompiledRuleSet:
+        """
+        Return the compiled form of a rule set, compiling it on first use.
+        
+        Args:
+            rules: Rule set from the request
+        
+        Returns:
+            The compiled rule set for rules.version
+        """
+        compiled = self._entries.get(rules.version)
+        if compiled is None:
+            metrics.increment("shopping.rule_set_compiles")
+            compiled = CompiledRuleSet(rules)
+            self._entries.set(rules.version, compiled, self._ttl_seconds)
+        return compiled
+    
+    def clear(self) -> None:
+        """Forget every compiled rule set."""
+        self._entries.clear()
+
+
+# Global cache of compiled rule sets for this worker process
+rule_set_cache = RuleSetCache(settings.SHOPPING_RULE_CACHE_SIZE, settings.SHOPPING_RULE_CACHE_TTL)
@@ -4,6 +4,7 @@ from decimal import Decimal, ROUND_HALF_UP
 from typing import List, Tuple
 
 from app.shopping.models import ShoppingTotalRequest, ShoppingTotalResponse
+from app.shopping.rules import RuleSetCache, rule_set_cache
 
 logger = logging.getLogger(__name__)
 
@@ -13,12 +14,23 @@ class ShoppingCalculatorService:
     Service for shopping cost calculations.
     
     Implements business logic for calculating shopping totals with tax.
+    Requests without rules use the flat tax rate; requests with a rule
+    set are priced by its compiled per-category tax and discount tables.
     Follows Single Responsibility Principle.
     """
     
     DECIMAL_PLACES = 2
     ROUNDING_PRECISION = Decimal('0.01')
     
+    def __init__(self, rule_sets: RuleSetCache = rule_set_cache) -> None:
+        """
+        Initialize the service.
+        
+        Args:
+            rule_sets: Cache of compiled rule sets shared across requests
+        """
+        self._rule_sets = rule_sets
+    
     @classmethod
     def _round_to_decimal_places(cls, value: float) -> float:
         """
@@ -63,7 +75,7 @@ class ShoppingCalculatorService:
                 items_found.append(item)
             else:
                 items_not_found.append(item)
-                logger.warning(f"Item not found in costs dictionary: {item}")
+                logger.warning("Item not found in costs dictionary: %s", item)
         
         return subtotal, items_found, items_not_found
     
@@ -96,6 +108,9 @@ class ShoppingCalculatorService:
         Returns:
             Shopping total response with breakdown
         """
+        if request.rules is not None:
+            return self._calculate_with_rules(request)
+        
         # Calculate subtotal and categorize items
         subtotal, items_found, items_not_found = self._calculate_subtotal(
             request.items,
@@ -114,9 +129,11 @@ class ShoppingCalculatorService:
         total_rounded = self._round_to_decimal_places(total)
         
         logger.info(
-            f"Calculated total: {total_rounded} for "
-            f"{len(items_found)} items (subtotal: {subtotal_rounded}, "
-            f"tax: {tax_amount_rounded})"
+            "Calculated total: %s for %d items (subtotal: %s, tax: %s)",
+            total_rounded,
+            len(items_found),
+            subtotal_rounded,
+            tax_amount_rounded
         )
         
         return ShoppingTotalResponse(
@@ -126,4 +143,37 @@ class ShoppingCalculatorService:
             items_found=items_found,
             items_not_found=items_not_found
         )
-
+    
+    def _calculate_with_rules(self, request: ShoppingTotalRequest) -> ShoppingTotalResponse:
+        """
+        Calculate the total with the request's rule set, in integer cents.
+        
+        Args:
+            request: Shopping calculation request with rules
+            
+        Returns:
+            Shopping total response with breakdown and discount
+        """
+        rules = self._rule_sets.get(request.rules)
+        price = rules.price(request.items, request.costs, request.categories, request.tax)
+        for item in price.items_not_found:
+            logger.warning("Item not found in costs dictionary: %s", item)
+        
+        logger.info(
+            "Calculated total: %d cents for %d items with rule set %s (discount: %d, tax: %d)",
+            price.total,
+            len(price.items_found),
+            rules.version,
+            price.discount,
+            price.tax
+        )
+        
+        return ShoppingTotalResponse(
+            subtotal=price.subtotal / 100,
+            tax_amount=price.tax / 100,
+            total=price.total / 100,
+            items_found=price.items_found,
+            items_not_found=price.items_not_found,
+            discount_amount=price.discount / 100,
+            rule_set_version=rules.version
+        )
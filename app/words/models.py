@@ -1,12 +1,27 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 
 
 class WordConcatRequest(BaseModel):
     words: List[str] = Field(..., min_items=1, description="List of words to concatenate")
+    include_words: bool = Field(
+        default=True,
+        description="Echo the input words back in the response"
+    )
 
 
 class WordConcatResponse(BaseModel):
     result: str
-    words: List[str]
+    words: Optional[List[str]] = None
 
+
+class WordConcatBatchRequest(BaseModel):
+    documents: List[WordConcatRequest] = Field(
+        ...,
+        min_items=1,
+        description="Independent word lists to concatenate"
+    )
+
+
+class WordConcatBatchResponse(BaseModel):
+    results: List[WordConcatResponse]
@@ -1,17 +1,37 @@
 """Word concatenation API routes."""
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, Response
+from starlette.types import Receive, Scope, Send
+import json
 import logging
+from typing import List
 
-from app.words.models import WordConcatRequest, WordConcatResponse
+from app.core.config import settings
+from app.core.content_negotiation import NegotiatedResponse, NegotiatedRoute
+from app.core.executor import run_blocking
+from app.words.models import (
+    WordConcatBatchRequest,
+    WordConcatBatchResponse,
+    WordConcatRequest,
+    WordConcatResponse
+)
 from app.words.service import WordConcatenationService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
 concatenation_service = WordConcatenationService()
 
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+MAX_LINE_BYTES = 64 * 1024
+STREAM_ERROR_MARKER = "\nerror: "
 
-@router.post("/concat", response_model=WordConcatResponse)
+
+@router.post(
+    "/concat",
+    response_model=WordConcatResponse,
+    response_model_exclude_none=True
+)
 async def concatenate_words(
     request: WordConcatRequest
 ) -> WordConcatResponse:
@@ -24,5 +44,167 @@ async def concatenate_words(
     Returns:
         Word concatenation response with result
     """
+    if len(request.words) >= settings.EXECUTOR_OFFLOAD_MIN_ITEMS:
+        return await run_blocking(concatenation_service.concatenate_words, request)
     return concatenation_service.concatenate_words(request)
 
+
+@router.post(
+    "/concat/batch",
+    response_model=WordConcatBatchResponse,
+    response_model_exclude_none=True
+)
+async def concatenate_words_batch(
+    request: WordConcatBatchRequest
+) -> WordConcatBatchResponse:
+    """
+    Concatenate many independent word lists in one request.
+    
+    Args:
+        request: Batch request with one word list per document
+        
+    Returns:
+        Batch response with results in request order
+    """
+    return await concatenation_service.concatenate_batch(request)
+
+
+@router.post("/concat/stream", response_class=Response)
+async def concatenate_words_stream(request: Request) -> Response:
+    """
+    Concatenate words streamed one per line in the request body.
+    
+    The body is read incrementally and result characters are emitted as soon
+    as each chunk is processed, so memory stays bounded by the chunk size
+    plus one line of at most MAX_LINE_BYTES. With an NDJSON content type
+    every line is a JSON string; otherwise each line is taken verbatim as a
+    word. Blank lines are ignored in both formats.
+    
+    Invalid input in the first body chunk is rejected with 400. Once the
+    response has started, invalid input ends the body with
+    STREAM_ERROR_MARKER followed by the error message; result characters
+    never contain a newline, so the marker is unambiguous.
+    
+    Args:
+        request: Raw HTTP request with a newline-delimited body
+        
+    Returns:
+        Plain-text response streaming the concatenated characters
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    return ConcatenationStreamResponse(is_ndjson=content_type in NDJSON_MEDIA_TYPES)
+
+
+class ConcatenationStreamResponse(Response):
+    """
+    ASGI response that reads the request body and writes the result in one coroutine.
+    
+    StreamingResponse listens for client disconnects on the same receive
+    channel the body arrives on, so it cannot consume the request body.
+    """
+    
+    media_type = "text/plain"
+    
+    def __init__(self, is_ndjson: bool) -> None:
+        """
+        Initialize the response.
+        
+        Args:
+            is_ndjson: Whether body lines are JSON-encoded strings
+        """
+        self.status_code = 200
+        self.background = None
+        self.is_ndjson = is_ndjson
+        self.init_headers()
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Consume the request body line by line and stream the result."""
+        stream = concatenation_service.create_stream()
+        buffer = bytearray()
+        started = False
+        try:
+            more_body = True
+            while more_body:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                buffer += message.get("body", b"")
+                more_body = message.get("more_body", False)
+                
+                if more_body:
+                    end = buffer.rfind(b"\n")
+                    if end == -1:
+                        if len(buffer) > MAX_LINE_BYTES:
+                            raise ValueError(f"Line exceeds {MAX_LINE_BYTES} bytes")
+                        continue
+                    lines = bytes(buffer[:end]).split(b"\n")
+                    del buffer[:end + 1]
+                else:
+                    lines = bytes(buffer).split(b"\n")
+                    buffer.clear()
+                
+                chars = stream.feed(_decode_lines(lines, self.is_ndjson))
+                if not started:
+                    await self._send_start(send)
+                    started = True
+                if chars:
+                    await send({
+                        "type": "http.response.body",
+                        "body": chars.encode("utf-8"),
+                        "more_body": True
+                    })
+            
+            if not started:
+                await self._send_start(send)
+            await send({"type": "http.response.body", "body": b""})
+        except ValueError as e:
+            logger.warning("Rejected streamed concatenation input: %s", e)
+            if started:
+                await send({
+                    "type": "http.response.body",
+                    "body": f"{STREAM_ERROR_MARKER}{e}".encode("utf-8")
+                })
+            else:
+                error = JSONResponse(status_code=400, content={"detail": str(e)})
+                await error(scope, receive, send)
+        finally:
+            stream.log_summary()
+    
+    async def _send_start(self, send: Send) -> None:
+        """Send the 200 status line and headers."""
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers
+        })
+
+
+def _decode_lines(lines: List[bytes], is_ndjson: bool) -> List[str]:
+    """
+    Decode raw body lines into words.
+    
+    Args:
+        lines: Complete lines without their trailing newline
+        is_ndjson: Whether lines are JSON-encoded strings
+        
+    Returns:
+        Decoded words; blank lines are ignored
+        
+    Raises:
+        ValueError: If a line is too long, not UTF-8, or not a JSON string
+    """
+    words: List[str] = []
+    for line in lines:
+        if len(line) > MAX_LINE_BYTES:
+            raise ValueError(f"Line exceeds {MAX_LINE_BYTES} bytes")
+        text = line.decode("utf-8").rstrip("\r")
+        if not text.strip():
+            continue
+        if not is_ndjson:
+            words.append(text)
+            continue
+        word = json.loads(text)
+        if not isinstance(word, str):
+            raise ValueError("NDJSON lines must be JSON strings")
+        words.append(word)
+    return words
@@ -1,61 +1,177 @@
 """Business logic for word concatenation."""
+import asyncio
 import logging
-from typing import List
+import os
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
 
-from app.words.models import WordConcatRequest, WordConcatResponse
+from app.core.config import settings
+from app.core.executor import run_blocking
+from app.words.models import (
+    WordConcatBatchRequest,
+    WordConcatBatchResponse,
+    WordConcatRequest,
+    WordConcatResponse
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+_process_pool: Optional["ProcessPoolExecutor"] = None
 
-class WordConcatenationService:
+
+def _is_valid_index(word: str, index: int) -> bool:
     """
-    Service for word concatenation operations.
+    Check if index is valid for word extraction.
     
-    Implements business logic for concatenating specific characters from words.
-    Follows Single Responsibility Principle.
+    Args:
+        word: The word to check
+        index: The index position
+        
+    Returns:
+        True if index is valid, False otherwise
+    """
+    return 0 <= index < len(word)
+
+
+def _concatenate_chunk(word_lists: List[List[str]]) -> List[str]:
+    """
+    Concatenate several independent word lists.
+    
+    Module-level so it can be pickled and run in a process pool worker.
+    
+    Args:
+        word_lists: Word lists to process independently
+        
+    Returns:
+        One result string per word list, in order
+    """
+    return [ConcatenationStream().feed(words) for words in word_lists]
+
+
+def get_process_pool() -> "ProcessPoolExecutor":
     """
+    Return the shared process pool, creating it on first use.
     
-    def _extract_characters_by_index(self, words: List[str]) -> List[str]:
+    Uses the spawn start method so workers never inherit the server's
+    threads or open database connections.
+    
+    Returns:
+        Process pool sized by WORD_BATCH_POOL_WORKERS
+    """
+    global _process_pool
+    if _process_pool is None:
+        # Imported lazily: most processes never start the pool
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        
+        workers = settings.WORD_BATCH_POOL_WORKERS or os.cpu_count() or 1
+        _process_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info("Started word concatenation process pool with %d workers", workers)
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool if it was started."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True, cancel_futures=True)
+        _process_pool = None
+
+
+class ConcatenationStream:
+    """
+    Incremental word concatenation state.
+    
+    Keeps the running word index across successive batches so inputs of any
+    size can be processed without materializing them. Short words are
+    counted instead of being logged one by one.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty stream positioned at index 0."""
+        self.words_processed = 0
+        self.words_skipped = 0
+        self.characters_emitted = 0
+    
+    def feed(self, words: Iterable[str]) -> str:
         """
-        Extract characters from words based on their index position.
+        Process the next batch of words.
         
         Args:
-            words: List of words to process
+            words: Words continuing the sequence of previous batches
             
         Returns:
-            List of extracted characters
+            Characters extracted from this batch
         """
-        result_chars: List[str] = []
-        
-        for index, word in enumerate(words):
-            if self._is_valid_index(word, index):
-                result_chars.append(word[index])
-            else:
-                logger.warning(
-                    f"Word '{word}' at index {index} is too short (length: {len(word)}), skipping"
-                )
-        
-        return result_chars
+        chars = "".join(self.iter_characters(words))
+        self.characters_emitted += len(chars)
+        return chars
     
-    @staticmethod
-    def _is_valid_index(word: str, index: int) -> bool:
+    def iter_characters(self, words: Iterable[str]) -> Iterator[str]:
         """
-        Check if index is valid for word extraction.
+        Yield the character at each word's position in the sequence.
         
         Args:
-            word: The word to check
-            index: The index position
+            words: Words continuing the sequence of previous batches
             
+        Yields:
+            One character per word long enough to contain its index
+        """
+        index = self.words_processed
+        skipped = 0
+        try:
+            for word in words:
+                if _is_valid_index(word, index):
+                    yield word[index]
+                else:
+                    skipped += 1
+                index += 1
+        finally:
+            self.words_processed = index
+            self.words_skipped += skipped
+    
+    def log_summary(self) -> None:
+        """Log one summary line for everything processed by this stream."""
+        if self.words_skipped:
+            logger.warning(
+                "Skipped %d of %d words shorter than their index",
+                self.words_skipped,
+                self.words_processed
+            )
+        logger.info(
+            "Concatenated %d characters from %d words",
+            self.characters_emitted,
+            self.words_processed
+        )
+
+
+class WordConcatenationService:
+    """
+    Service for word concatenation operations.
+    
+    Implements business logic for concatenating specific characters from words.
+    Follows Single Responsibility Principle.
+    """
+    
+    def create_stream(self) -> ConcatenationStream:
+        """
+        Create an incremental concatenation stream.
+        
         Returns:
-            True if index is valid, False otherwise
+            A new stream positioned at index 0
         """
-        return 0 <= index < len(word)
+        return ConcatenationStream()
     
     def concatenate_words(self, request: WordConcatRequest) -> WordConcatResponse:
         """
         Concatenate the n-th letter of each word, where n is the index.
         
-        For example: ["hello", "world"] -> "hw" 
+        For example: ["hello", "world"] -> "hw"
         (h from index 0, w from index 1)
         
         Args:
@@ -64,16 +180,64 @@ class WordConcatenationService:
         Returns:
             Word concatenation response with result
         """
-        extracted_chars = self._extract_characters_by_index(request.words)
-        result = "".join(extracted_chars)
-        
-        logger.info(
-            f"Concatenated {len(extracted_chars)} characters from "
-            f"{len(request.words)} words. Result: '{result}'"
-        )
+        stream = self.create_stream()
+        result = stream.feed(request.words)
+        stream.log_summary()
         
         return WordConcatResponse(
             result=result,
-            words=request.words
+            words=request.words if request.include_words else None
         )
-
+    
+    async def concatenate_batch(
+        self,
+        request: WordConcatBatchRequest
+    ) -> WordConcatBatchResponse:
+        """
+        Concatenate many independent word lists, preserving their order.
+        
+        Batches with at least WORD_BATCH_POOL_THRESHOLD words in total are
+        split into chunks and fanned out across the process pool; smaller
+        batches run on the service executor or inline, where pickling would
+        cost more than the extraction itself.
+        
+        Args:
+            request: Batch of word concatenation requests
+            
+        Returns:
+            Batch response with one result per document, in request order
+        """
+        word_lists = [document.words for document in request.documents]
+        total_words = sum(len(words) for words in word_lists)
+        
+        if total_words >= settings.WORD_BATCH_POOL_THRESHOLD:
+            chunk_size = settings.WORD_BATCH_CHUNK_SIZE
+            chunks = [
+                word_lists[start:start + chunk_size]
+                for start in range(0, len(word_lists), chunk_size)
+            ]
+            loop = asyncio.get_running_loop()
+            pool = get_process_pool()
+            chunk_results = await asyncio.gather(*(
+                loop.run_in_executor(pool, _concatenate_chunk, chunk)
+                for chunk in chunks
+            ))
+            results = [result for chunk in chunk_results for result in chunk]
+        elif total_words >= settings.EXECUTOR_OFFLOAD_MIN_ITEMS:
+            results = await run_blocking(_concatenate_chunk, word_lists)
+        else:
+            results = _concatenate_chunk(word_lists)
+        
+        logger.info(
+            "Concatenated batch of %d documents (%d words)",
+            len(word_lists),
+            total_words
+        )
+        
+        return WordConcatBatchResponse(results=[
+            WordConcatResponse(
+                result=result,
+                words=document.words if document.include_words else None
+            )
+            for result, document in zip(results, request.documents)
+        ])
@@ -0,0 +1,70 @@
+"""
+Measure memory per cached dictionary entry.
+
+Builds the same entries as transient ORM ``DictionaryEntry`` instances,
+as ``DictionaryRecord`` values and as a memory-mapped snapshot, and
+reports bytes per entry for each. Word and definition strings are
+counted separately so the per-object overhead is visible.
+
+Usage:
+    python -m benchmarks.bench_entry_memory [entries]
+"""
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from app.dictionary.db_models import DictionaryEntry
+from app.dictionary.records import DictionaryRecord
+from app.dictionary.snapshot import build_snapshot
+
+
+def _traced_bytes(build: Callable[[], object]) -> Tuple[int, object]:
+    """Return bytes allocated by build() and still alive, plus its result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return allocated, result
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows: List[Tuple[int, str, str]] = [
+        (i, f"word{i}", f"Definition of word number {i}") for i in range(count)
+    ]
+    
+    strings, _ = _traced_bytes(lambda: [(f"word{i}", f"Definition of word number {i}") for i in range(count)])
+    orm, orm_entries = _traced_bytes(lambda: [
+        DictionaryEntry(id=i, word=word, definition=definition)
+        for i, word, definition in rows
+    ])
+    del orm_entries
+    records, record_entries = _traced_bytes(lambda: [
+        DictionaryRecord(i, word, definition)
+        for i, word, definition in rows
+    ])
+    del record_entries
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "dictionary.snapshot")
+        build_snapshot(rows, path)
+        snapshot_size = os.path.getsize(path)
+    
+    print(f"entries: {count:,}")
+    print(f"{'representation':<38}{'bytes/entry':>12}")
+    print(f"{'strings only (baseline)':<38}{strings / count:>12.0f}")
+    print(f"{'ORM DictionaryEntry (no strings)':<38}{orm / count:>12.0f}")
+    print(f"{'DictionaryRecord (no strings)':<38}{records / count:>12.0f}")
+    print(f"{'snapshot file (shared, with strings)':<38}{snapshot_size / count:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
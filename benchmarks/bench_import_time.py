@@ -0,0 +1,54 @@
+"""
+Measure cold import time of the application.
+
+Runs ``python -X importtime -c "import app.main"`` in fresh interpreters
+and reports the total plus the slowest application and third-party
+top-level packages.
+
+Usage:
+    python -m benchmarks.bench_import_time [runs]
+"""
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+
+def _import_profile() -> List[Tuple[str, int]]:
+    """Return (module, cumulative microseconds) pairs for one cold import."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    profile = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile.append((name.strip(), int(cumulative)))
+    return profile
+
+
+def main() -> None:
+    """Run the measurement and print a summary."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    totals: List[int] = []
+    packages: Dict[str, List[int]] = defaultdict(list)
+    for _ in range(runs):
+        profile = _import_profile()
+        totals.append(dict(profile)["app.main"])
+        for name, cumulative in profile:
+            if "." not in name or name.startswith("app."):
+                packages[name].append(cumulative)
+    
+    print(f"app.main cold import: {min(totals) / 1000:.1f} ms (best of {runs})")
+    print(f"{'module':<40}{'ms':>10}")
+    slowest = sorted(packages.items(), key=lambda item: -min(item[1]))[:15]
+    for name, samples in slowest:
+        print(f"{name:<40}{min(samples) / 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark per-request logging overhead.
+
+Compares the previous blocking ``basicConfig`` stream handler with the
+queue-based configuration from ``app.core.logging_config`` by timing the
+shopping and word-concatenation service calls, which log on every request.
+
+Usage:
+    python -m benchmarks.bench_logging [iterations]
+"""
+import logging
+import os
+import sys
+import time
+from typing import Callable
+
+from app.core.config import Settings
+from app.core.logging_config import TEXT_FORMAT, configure_logging, stop_logging
+from app.shopping.models import ShoppingTotalRequest
+from app.shopping.service import ShoppingCalculatorService
+from app.words.models import WordConcatRequest
+from app.words.service import WordConcatenationService
+
+
+def _reset_root() -> None:
+    """Remove all handlers from the root logger."""
+    stop_logging()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+
+
+def _configure_blocking(devnull) -> None:
+    """Reproduce the previous synchronous basicConfig setup."""
+    _reset_root()
+    handler = logging.StreamHandler(devnull)
+    handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    logging.getLogger().addHandler(handler)
+    logging.getLogger().setLevel(logging.INFO)
+
+
+def _configure_queued(devnull, sampling: str) -> None:
+    """Apply the queue-based configuration writing to devnull."""
+    _reset_root()
+    original_stderr = sys.stderr
+    sys.stderr = devnull
+    try:
+        configure_logging(Settings(LOG_FORMAT="json", LOG_SAMPLING_RATES=sampling))
+    finally:
+        sys.stderr = original_stderr
+
+
+def _time_per_call(func: Callable[[], object], iterations: int) -> float:
+    """Return mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    shopping = ShoppingCalculatorService()
+    words = WordConcatenationService()
+    cart = ShoppingTotalRequest(
+        costs={"apple": 1.5, "banana": 0.75},
+        items=["apple", "banana", "missing"],
+        tax=0.1
+    )
+    word_list = WordConcatRequest(words=["hello", "hi", "world", "a"])
+    
+    def request() -> None:
+        shopping.calculate_total(cart)
+        words.concatenate_words(word_list)
+    
+    with open(os.devnull, "w") as devnull:
+        scenarios = [
+            ("blocking basicConfig", lambda: _configure_blocking(devnull)),
+            ("queue + json", lambda: _configure_queued(devnull, "")),
+            (
+                "queue + json, sampled 1%",
+                lambda: _configure_queued(devnull, "app.shopping=0.01,app.words=0.01")
+            ),
+        ]
+        print(f"{'configuration':<28}{'us/request':>12}")
+        for name, configure in scenarios:
+            configure()
+            _time_per_call(request, iterations // 10)
+            print(f"{name:<28}{_time_per_call(request, iterations):>12.1f}")
+        _reset_root()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Measure CPU time per dictionary lookup.
+
+Compares the ORM query the repository used to build on every call with
+the prebuilt Core statement ``DictionaryRepository.find_by_word`` runs
+now. Both run against the same in-memory SQLite database, so the
+difference is the Python-side cost of building, compiling and loading
+the result.
+
+Usage:
+    python -m benchmarks.bench_repository_lookup [lookups]
+"""
+import sys
+import time
+from typing import Callable
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.dictionary.db_models import DictionaryEntry
+from app.dictionary.repository import DictionaryRepository
+
+
+def _orm_lookup(db: Session, word: str) -> object:
+    """Look a word up the way the repository did before prebuilt statements."""
+    return db.query(DictionaryEntry).filter(
+        func.lower(DictionaryEntry.word) == word.lower().strip()
+    ).first()
+
+
+def _time_per_call(lookup: Callable[[str], object], words: list) -> float:
+    """Return process CPU microseconds per call of lookup over words."""
+    started = time.process_time()
+    for word in words:
+        lookup(word)
+    return (time.process_time() - started) / len(words) * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    
+    with Session(engine) as db:
+        repository = DictionaryRepository(db)
+        repository.create_many([(f"word{i}", f"definition {i}") for i in range(1_000)])
+        db.commit()
+        words = [f"Word{i % 1_000}" for i in range(lookups)]
+        
+        # Warm both paths so statement compilation is cached
+        _orm_lookup(db, words[0])
+        repository.find_by_word(words[0])
+        
+        orm = _time_per_call(lambda word: _orm_lookup(db, word), words)
+        db.expunge_all()
+        prebuilt = _time_per_call(repository.find_by_word, words)
+    
+    print(f"{'lookups':<24}{lookups:>12}")
+    print(f"{'ORM query (us/lookup)':<24}{orm:>12.1f}")
+    print(f"{'prebuilt (us/lookup)':<24}{prebuilt:>12.1f}")
+    print(f"{'speedup':<24}{orm / prebuilt:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
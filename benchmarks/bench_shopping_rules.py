@@ -0,0 +1,104 @@
+"""
+Measure CPU time to price a cart with per-category tax and discount rules.
+
+Compares a per-unit Decimal pass, the way clients priced carts before
+rule sets, with the compiled rule set that groups repeated items and
+works in integer cents. Compiling the rule set on every request is
+timed separately to show what the version cache saves.
+
+Usage:
+    python -m benchmarks.bench_shopping_rules [cart_items]
+"""
+import sys
+import time
+from collections import defaultdict
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Callable
+
+from app.shopping.models import ShoppingRuleSet, ShoppingTotalRequest
+from app.shopping.rules import CompiledRuleSet
+
+CATEGORIES = 20
+DISTINCT_ITEMS = 500
+CENT = Decimal("0.01")
+
+
+def _build_request(cart_items: int) -> ShoppingTotalRequest:
+    """Build a cart of repeated items spread over the categories."""
+    names = [f"item{i}" for i in range(DISTINCT_ITEMS)]
+    rules = ShoppingRuleSet(
+        version="bench",
+        category_tax={f"cat{c}": 0.01 * (c % 10) for c in range(CATEGORIES)},
+        discounts={
+            f"cat{c}": [{"min_quantity": 5, "percent": 5}, {"min_quantity": 20, "percent": 10}]
+            for c in range(0, CATEGORIES, 2)
+        }
+    )
+    return ShoppingTotalRequest(
+        costs={name: 0.25 + (i % 97) * 1.13 for i, name in enumerate(names)},
+        items=[names[(i * 7) % DISTINCT_ITEMS] for i in range(cart_items)],
+        tax=0.1,
+        categories={name: f"cat{i % CATEGORIES}" for i, name in enumerate(names)},
+        rules=rules
+    )
+
+
+def _per_unit_decimal(request: ShoppingTotalRequest) -> Decimal:
+    """Price every unit with Decimal, then discount and tax in extra passes."""
+    rules = request.rules
+    quantities: dict = defaultdict(int)
+    for item in request.items:
+        quantities[item] += 1
+    taxable: dict = defaultdict(Decimal)
+    for item in request.items:
+        if item not in request.costs:
+            continue
+        category = request.categories.get(item)
+        price = Decimal(str(request.costs[item]))
+        percent = 0.0
+        for tier in sorted(rules.discounts.get(category, []), key=lambda tier: tier.min_quantity):
+            if quantities[item] >= tier.min_quantity:
+                percent = tier.percent
+        taxable[category] += price * (1 - Decimal(str(percent)) / 100)
+    total = Decimal(0)
+    for category, amount in taxable.items():
+        rate = Decimal(str(rules.category_tax.get(category, request.tax)))
+        total += (amount * (1 + rate)).quantize(CENT, rounding=ROUND_HALF_UP)
+    return total
+
+
+def _time_per_call(price: Callable[[], object], repeats: int) -> float:
+    """Return process CPU milliseconds per call."""
+    started = time.process_time()
+    for _ in range(repeats):
+        price()
+    return (time.process_time() - started) / repeats * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    cart_items = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    request = _build_request(cart_items)
+    compiled = CompiledRuleSet(request.rules)
+    repeats = 20
+    
+    baseline = _time_per_call(lambda: _per_unit_decimal(request), repeats)
+    cached = _time_per_call(
+        lambda: compiled.price(request.items, request.costs, request.categories, request.tax), repeats
+    )
+    uncached = _time_per_call(
+        lambda: CompiledRuleSet(request.rules).price(
+            request.items, request.costs, request.categories, request.tax
+        ),
+        repeats
+    )
+    
+    print(f"{'cart items':<28}{cart_items:>12}")
+    print(f"{'per-unit Decimal (ms)':<28}{baseline:>12.2f}")
+    print(f"{'compiled, recompiled (ms)':<28}{uncached:>12.2f}")
+    print(f"{'compiled, cached (ms)':<28}{cached:>12.2f}")
+    print(f"{'speedup':<28}{baseline / cached:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Measure dictionary read and write throughput on SQLite.
+
+Runs reader threads looking words up while one writer keeps adding
+entries, first with SQLite defaults (rollback journal) and then with the
+tuned profile from ``app.core.sqlite`` (WAL, mmap, serialized writer).
+Lock errors are counted rather than retried, so they show up in the table.
+
+Usage:
+    python -m benchmarks.bench_sqlite_profile [readers] [seconds]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import Settings
+from app.core.database import Base
+from app.core.sqlite import install_sqlite_profile
+from app.dictionary.repository import DictionaryRepository
+
+SEED_ENTRIES = 10_000
+
+
+def _run(path: str, tuned: bool, readers: int, seconds: float) -> Dict[str, float]:
+    """Run one profile and return reads/s, writes/s and lock errors."""
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    if tuned:
+        install_sqlite_profile(engine, Settings())
+    Base.metadata.create_all(engine)
+    sessions = sessionmaker(bind=engine)
+    with sessions() as db:
+        DictionaryRepository(db).create_many(
+            [(f"word{i}", f"definition {i}") for i in range(SEED_ENTRIES)]
+        )
+        db.commit()
+    
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+    
+    def count(key: str, n: int) -> None:
+        with lock:
+            counts[key] += n
+    
+    def reader(offset: int) -> None:
+        reads = errors = 0
+        with sessions() as db:
+            repository = DictionaryRepository(db)
+            while time.perf_counter() < deadline:
+                try:
+                    repository.find_by_word(f"word{(offset + reads) % SEED_ENTRIES}")
+                    db.rollback()
+                    reads += 1
+                except OperationalError:
+                    db.rollback()
+                    errors += 1
+        count("reads", reads)
+        count("errors", errors)
+    
+    def writer() -> None:
+        writes = errors = 0
+        with sessions() as db:
+            repository = DictionaryRepository(db)
+            while time.perf_counter() < deadline:
+                try:
+                    repository.create(f"new{writes}-{errors}", "fresh definition")
+                    db.commit()
+                    writes += 1
+                except OperationalError:
+                    db.rollback()
+                    errors += 1
+        count("writes", writes)
+        count("errors", errors)
+    
+    threads = [threading.Thread(target=reader, args=(i * 997,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    return {
+        "reads/s": counts["reads"] / seconds,
+        "writes/s": counts["writes"] / seconds,
+        "lock errors": counts["errors"],
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    readers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    
+    with tempfile.TemporaryDirectory() as directory:
+        default = _run(os.path.join(directory, "default.db"), False, readers, seconds)
+        tuned = _run(os.path.join(directory, "tuned.db"), True, readers, seconds)
+    
+    print(f"{readers} readers + 1 writer, {seconds:g}s per profile")
+    print(f"{'':<14}{'default':>12}{'tuned':>12}")
+    for key in default:
+        print(f"{key:<14}{default[key]:>12.0f}{tuned[key]:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare JSON and MessagePack wire formats on large payloads.
+
+Times request parsing and response rendering for a large cart and a long
+word list, then the full request through the application with each
+format.
+
+Usage:
+    python -m benchmarks.bench_wire_format [items]
+"""
+import json
+import logging
+import sys
+import time
+from typing import Any, Callable, Dict
+
+import msgpack
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.core.content_negotiation import MSGPACK_MEDIA_TYPE
+from app.main import app
+
+
+def _ms_per_call(func: Callable[[], Any], iterations: int) -> float:
+    """Return mean milliseconds per call."""
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e3
+
+
+def _compare(name: str, path: str, payload: Dict[str, Any], response: Dict[str, Any], client: TestClient) -> None:
+    """Print parse, render and end-to-end timings for one payload."""
+    json_body = json.dumps(payload).encode("utf-8")
+    msgpack_body = msgpack.packb(payload)
+    iterations = 20
+    
+    rows = [
+        ("request size (KiB)", len(json_body) / 1024, len(msgpack_body) / 1024),
+        (
+            "parse request (ms)",
+            _ms_per_call(lambda: json.loads(json_body), iterations),
+            _ms_per_call(lambda: msgpack.unpackb(msgpack_body), iterations),
+        ),
+        (
+            "render response (ms)",
+            _ms_per_call(lambda: JSONResponse(response).body, iterations),
+            _ms_per_call(lambda: msgpack.packb(response, use_bin_type=True), iterations),
+        ),
+        (
+            "full request (ms)",
+            _ms_per_call(lambda: client.post(
+                path, content=json_body, headers={"Content-Type": "application/json"}
+            ), iterations),
+            _ms_per_call(lambda: client.post(path, content=msgpack_body, headers={
+                "Content-Type": MSGPACK_MEDIA_TYPE, "Accept": MSGPACK_MEDIA_TYPE
+            }), iterations),
+        ),
+    ]
+    print(f"\n{name}")
+    print(f"{'':<22}{'json':>10}{'msgpack':>10}")
+    for label, json_value, msgpack_value in rows:
+        print(f"{label:<22}{json_value:>10.2f}{msgpack_value:>10.2f}")
+
+
+def main() -> None:
+    """Run the benchmark for a large cart and a long word list."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    with TestClient(app) as client:
+        cart = {
+            "costs": {f"item-{i}": round(i * 0.01, 2) for i in range(count)},
+            "items": [f"item-{i}" for i in range(0, count, 2)],
+            "tax": 0.1,
+        }
+        cart_response = client.post("/shopping/total", json=cart).json()
+        _compare(f"cart with {count:,} prices", "/shopping/total", cart, cart_response, client)
+        
+        words = {"words": [f"word{i}" for i in range(count)]}
+        words_response = client.post("/word/concat", json=words).json()
+        _compare(f"{count:,} words", "/word/concat", words, words_response, client)
+
+
+if __name__ == "__main__":
+    main()
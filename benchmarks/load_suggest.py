@@ -0,0 +1,73 @@
+"""
+Load harness for the autocomplete WebSocket.
+
+Opens many concurrent connections to a running server, sends prefixes
+one at a time on each and reports per-message latency percentiles and
+throughput. Latency includes the server-side debounce
+(DICTIONARY_SUGGEST_DEBOUNCE_MS); run the server with it set to 0 to
+measure lookup and transport cost alone.
+
+Usage:
+    python -m benchmarks.load_suggest [--url URL] [--connections N] [--messages M]
+"""
+import argparse
+import asyncio
+import json
+import random
+import string
+import time
+from typing import List
+
+import websockets
+
+
+async def _client(url: str, messages: int, latencies: List[float]) -> None:
+    """Send prefixes sequentially on one connection, recording latencies."""
+    async with websockets.connect(url) as websocket:
+        for message_id in range(messages):
+            prefix = "".join(random.choices(string.ascii_lowercase, k=random.randint(1, 3)))
+            started = time.perf_counter()
+            await websocket.send(json.dumps({"id": message_id, "prefix": prefix}))
+            while json.loads(await websocket.recv()).get("id") != message_id:
+                pass
+            latencies.append(time.perf_counter() - started)
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Return the value at a fraction of the sorted list."""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def _run(url: str, connections: int, messages: int) -> None:
+    """Run all clients and print a summary."""
+    latencies: List[float] = []
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_client(url, messages, latencies) for _ in range(connections)),
+        return_exceptions=True
+    )
+    elapsed = time.perf_counter() - started
+    failures = [result for result in results if isinstance(result, Exception)]
+    
+    latencies.sort()
+    print(f"connections: {connections} ({len(failures)} failed)")
+    print(f"messages:    {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.0f}/s)")
+    if latencies:
+        for label, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99)):
+            print(f"{label}:         {_percentile(latencies, fraction) * 1e3:.2f} ms")
+    if failures:
+        print(f"first failure: {failures[0]!r}")
+
+
+def main() -> None:
+    """Parse arguments and run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="ws://localhost:8000/dictionary/ws/suggest")
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--messages", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(_run(args.url, args.connections, args.messages))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
+from contextlib import contextmanager
+
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
 from app.core.database import Base, get_db
+from app.core.query_stats import capture_queries, install_query_hooks
+from app.dictionary.cache import dictionary_cache
+from app.dictionary.popularity import hit_counter
 from app.main import app
 
 # Use in-memory SQLite for tests
@@ -13,6 +18,7 @@ engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False}
 )
+install_query_hooks(engine)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -47,4 +53,26 @@ def client(db_session):
         yield test_client
     
     app.dependency_overrides.clear()
+    dictionary_cache.clear()
+    hit_counter.drain()
+
 
+@pytest.fixture
+def assert_max_queries():
+    """
+    Fail if a block issues more SQL statements than allowed.
+    
+    Usage:
+        with assert_max_queries(2):
+            client.get("/dictionary/word")
+    """
+    @contextmanager
+    def check(limit):
+        with capture_queries(engine) as captured:
+            yield captured
+        assert len(captured) <= limit, (
+            f"Expected at most {limit} queries, got {len(captured)}:\n"
+            + "\n".join(captured.statements)
+        )
+    
+    return check
@@ -0,0 +1,109 @@
+"""Tests for cache backends and the two-tier dictionary cache."""
+import multiprocessing
+
+import pytest
+
+from app.core.cache import LRUCache, RedisCache, SharedMemoryCache, TieredCache
+from app.dictionary.cache import DictionaryCache
+from app.dictionary.db_models import DictionaryEntry
+
+
+@pytest.fixture
+def shared_cache(tmp_path):
+    """Create a small shared-memory cache file."""
+    cache = SharedMemoryCache(str(tmp_path / "test.cache"), slots=64, slot_size=256)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def redis_cache():
+    """Create a Redis cache against an in-process fakeredis server."""
+    fakeredis = pytest.importorskip("fakeredis")
+    return RedisCache(fakeredis.FakeRedis(), prefix="test:")
+
+
+def _write_from_child(path):
+    """Write a value to the shared cache from another process."""
+    cache = SharedMemoryCache(path, slots=64, slot_size=256)
+    cache.set("shared", b"from child", 60)
+    cache.close()
+
+
+@pytest.mark.parametrize("backend_name", ["lru", "shared", "redis"])
+def test_backend_round_trip(backend_name, shared_cache, request):
+    """Test every backend stores, expires and deletes values"""
+    backend = {
+        "lru": lambda: LRUCache(max_size=10),
+        "shared": lambda: shared_cache,
+        "redis": lambda: request.getfixturevalue("redis_cache"),
+    }[backend_name]()
+    
+    backend.set("word", b"definition", 60)
+    assert backend.get("word") == b"definition"
+    assert backend.get("missing") is None
+    
+    backend.delete("word")
+    assert backend.get("word") is None
+    
+    backend.set("stale", b"old", -1)
+    assert backend.get("stale") is None
+
+
+def test_lru_evicts_least_recently_used():
+    """Test the LRU cache evicts the oldest untouched entry"""
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    cache.get("a")
+    cache.set("c", 3, 60)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_shared_memory_cache_visible_across_processes(tmp_path):
+    """Test a value written by one process is read by another"""
+    path = str(tmp_path / "cross.cache")
+    reader = SharedMemoryCache(path, slots=64, slot_size=256)
+    child = multiprocessing.get_context("spawn").Process(target=_write_from_child, args=(path,))
+    child.start()
+    child.join(timeout=30)
+    try:
+        assert reader.get("shared") == b"from child"
+    finally:
+        reader.close()
+
+
+def test_shared_memory_cache_skips_oversized_values(shared_cache):
+    """Test values larger than a slot are not cached"""
+    shared_cache.set("big", b"x" * 1024, 60)
+    
+    assert shared_cache.get("big") is None
+
+
+def test_tiered_cache_promotes_l2_hits():
+    """Test an L2 hit is decoded and promoted into L1"""
+    l2 = LRUCache(max_size=10)
+    tiers = TieredCache(LRUCache(max_size=10), l2, str.encode, bytes.decode, 60, 60)
+    l2.set("key", b"value", 60)
+    
+    assert tiers.get("key") == "value"
+    assert tiers.l1.get("key") == "value"
+    
+    tiers.delete("key")
+    assert tiers.get("key") is None
+
+
+def test_dictionary_cache_shares_entries_through_l2(redis_cache):
+    """Test two workers' dictionary caches share entries and invalidations"""
+    worker_a = DictionaryCache(max_size=10, ttl_seconds=60, shared=redis_cache)
+    worker_b = DictionaryCache(max_size=10, ttl_seconds=60, shared=redis_cache)
+    
+    worker_a.set("Hello", DictionaryEntry(id=1, word="Hello", definition="A greeting"))
+    entry = worker_b.get("HELLO")
+    assert entry.word == "Hello"
+    assert entry.definition == "A greeting"
+    
+    worker_a.invalidate("hello")
+    assert redis_cache.get("hello") is None
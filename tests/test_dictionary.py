@@ -1,4 +1,24 @@
+import asyncio
+import time
+
 import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.config import settings
+from app.core.exceptions import DatabaseUnavailableError, DictionaryWordAlreadyExistsError
+from app.core.metrics import metrics
+from app.dictionary.cache import DictionaryCache, dictionary_cache
+from app.dictionary.change_feed import ChangeFeed
+from app.dictionary.db_models import DictionaryEntry
+from app.dictionary.popularity import hit_counter
+from app.dictionary.records import DictionaryRecord
+from app.dictionary.repository import CircuitBreakerRepository, DictionaryRepository
+from app.dictionary.service import DictionaryService
+from app.dictionary.snapshot import DictionarySnapshot, build_snapshot
+from app.dictionary.suggestions import SuggestionIndex
+from app.dictionary.write_batcher import WriteBatcher
 
 
 def test_add_word(client):
@@ -68,3 +88,254 @@ def test_get_word_case_insensitive(client):
     assert response.status_code == 200
     assert response.json()["definition"] == "A test"
 
+
+def test_get_word_counts_hits_and_uses_cache(client, db_session):
+    """Test lookups are counted in memory and repeated lookups hit the cache"""
+    client.post(
+        "/dictionary/add",
+        json={"word": "Popular", "definition": "Often looked up"}
+    )
+    for _ in range(3):
+        assert client.get("/dictionary/popular").status_code == 200
+    
+    # Cached as a detached record, not an ORM instance
+    assert isinstance(dictionary_cache.get("POPULAR"), DictionaryRecord)
+    
+    counts = hit_counter.drain()
+    assert counts == {"popular": 3}
+    
+    repository = DictionaryRepository(db_session)
+    repository.increment_hit_counts(counts)
+    repository.commit()
+    
+    popular = repository.find_most_popular(10)
+    assert [entry.word for entry in popular] == ["Popular"]
+    assert popular[0].hit_count == 3
+
+
+def test_add_word_publishes_change_to_other_workers(client, db_session):
+    """Test writes are recorded in the change feed and invalidate local caches"""
+    feed = ChangeFeed()
+    seen = []
+    feed.subscribe(lambda word, operation: seen.append((word, operation)))
+    repository = DictionaryRepository(db_session)
+    
+    # First poll only positions the cursor
+    assert feed.poll(repository) == 0
+    
+    # Simulate a stale entry cached by this worker before another worker's write
+    dictionary_cache.set("Fresh", DictionaryEntry(id=0, word="Fresh", definition="Stale"))
+    client.post(
+        "/dictionary/add",
+        json={"word": "Fresh", "definition": "Just added"}
+    )
+    dictionary_cache.set("Fresh", DictionaryEntry(id=0, word="Fresh", definition="Stale"))
+    
+    feed.subscribe(lambda word, operation: dictionary_cache.invalidate_local(word))
+    assert feed.poll(repository) == 1
+    assert seen == [("fresh", "add")]
+    assert client.get("/dictionary/fresh").json()["definition"] == "Just added"
+    
+    # Nothing new on the next poll
+    assert feed.poll(repository) == 0
+
+
+def test_search_and_batch_lookup(client):
+    """Test prefix search and batch lookup endpoints"""
+    for word in ["Apple", "Apricot", "Banana"]:
+        client.post(
+            "/dictionary/add",
+            json={"word": word, "definition": f"A {word.lower()}"}
+        )
+    
+    response = client.get("/dictionary/search", params={"prefix": "AP"})
+    assert response.status_code == 200
+    assert [entry["word"] for entry in response.json()["entries"]] == ["Apple", "Apricot"]
+    
+    response = client.post(
+        "/dictionary/batch",
+        json={"words": ["banana", "Cherry", "APPLE", "apple"]}
+    )
+    assert response.status_code == 200
+    assert [entry["word"] for entry in response.json()["entries"]] == ["Banana", "Apple"]
+    assert response.json()["missing"] == ["Cherry"]
+
+
+def test_snapshot_serves_reads_and_falls_back_for_newer_entries(client, db_session, tmp_path):
+    """Test snapshot lookups, prefix search and the database fallback"""
+    for word in ["cat", "Car", "dog"]:
+        client.post(
+            "/dictionary/add",
+            json={"word": word, "definition": f"A {word.lower()}"}
+        )
+    repository = DictionaryRepository(db_session)
+    path = str(tmp_path / "dictionary.snapshot")
+    assert build_snapshot(repository.iter_all_entries(), path) == 3
+    
+    snapshot = DictionarySnapshot(path)
+    assert snapshot.get("CAT").definition == "A cat"
+    assert snapshot.get("cow") is None
+    assert [entry.word for entry in snapshot.search_prefix("ca", 10)] == ["Car", "cat"]
+    
+    # Added after the snapshot was built
+    client.post(
+        "/dictionary/add",
+        json={"word": "Cab", "definition": "A cab"}
+    )
+    service = DictionaryService(repository, snapshot=snapshot)
+    assert service.get_word("cab").definition == "A cab"
+    assert [entry.word for entry in service.search_prefix("CA", 10)] == ["Cab", "Car", "cat"]
+
+
+def test_write_batcher_group_commits_with_per_caller_errors(db_session):
+    """Test concurrent adds share one commit but fail individually"""
+    repository = DictionaryRepository(db_session)
+    repository.create("Old", "Already there")
+    repository.commit()
+    
+    def batch_stats():
+        summary = metrics.snapshot()["summaries"].get("dictionary.write_batch_size", {})
+        return summary.get("count", 0), summary.get("sum", 0)
+    
+    count_before, sum_before = batch_stats()
+    batcher = WriteBatcher(
+        session_factory=sessionmaker(bind=db_session.get_bind()),
+        max_batch_size=10,
+        max_delay_seconds=0.01
+    )
+    
+    async def scenario():
+        return await asyncio.gather(
+            batcher.submit("One", "First"),
+            batcher.submit("Two", "Second"),
+            batcher.submit("one", "Duplicate within the batch"),
+            batcher.submit("OLD", "Duplicate of an existing word"),
+            batcher.submit("  ", "Empty word"),
+            return_exceptions=True
+        )
+    
+    one, two, duplicate, existing, empty = asyncio.run(scenario())
+    assert (one.word, two.word) == ("One", "Two")
+    assert isinstance(duplicate, DictionaryWordAlreadyExistsError)
+    assert isinstance(existing, DictionaryWordAlreadyExistsError)
+    assert isinstance(empty, ValueError)
+    
+    # The four valid-looking adds went to the database together
+    count_after, sum_after = batch_stats()
+    assert (count_after - count_before, sum_after - sum_before) == (1, 4)
+    assert repository.find_by_word("two").definition == "Second"
+
+
+def test_open_circuit_serves_stale_cache_and_fails_writes(db_session):
+    """Test reads fall back to expired cache entries and writes fail fast"""
+    breaker = CircuitBreaker(
+        "test-database",
+        failure_threshold=1,
+        recovery_timeout=60,
+        failure_exceptions=(OperationalError,)
+    )
+    cache = DictionaryCache(max_size=10, ttl_seconds=0.01)
+    repository = CircuitBreakerRepository(DictionaryRepository(db_session), breaker)
+    service = DictionaryService(repository, cache=cache)
+    
+    service.add_word("Cached", "Looked up before the outage")
+    entry, stale = service.get_word_with_fallback("cached")
+    assert (entry.definition, stale) == ("Looked up before the outage", False)
+    
+    # Let the cache entry expire, then open the circuit
+    time.sleep(0.02)
+    breaker.record_failure()
+    
+    entry, stale = service.get_word_with_fallback("CACHED")
+    assert (entry.definition, stale) == ("Looked up before the outage", True)
+    with pytest.raises(DatabaseUnavailableError):
+        service.get_word_with_fallback("uncached")
+    with pytest.raises(DatabaseUnavailableError):
+        service.add_word("New", "Rejected while the circuit is open")
+
+
+def test_websocket_suggestions_answer_latest_prefix(client, db_session, monkeypatch):
+    """Test the autocomplete socket debounces and answers the newest prefix"""
+    for word in ["Apple", "Apricot", "Banana"]:
+        client.post(
+            "/dictionary/add",
+            json={"word": word, "definition": f"A {word.lower()}"}
+        )
+    index = SuggestionIndex()
+    assert index.refresh(DictionaryRepository(db_session)) == 3
+    assert index.search("ap", 10) == ["Apple", "Apricot"]
+    monkeypatch.setattr("app.dictionary.router.suggestion_index", index)
+    monkeypatch.setattr(settings, "DICTIONARY_SUGGEST_DEBOUNCE_MS", 100)
+    
+    with client.websocket_connect("/dictionary/ws/suggest") as websocket:
+        # The first prefix is superseded before its debounce expires
+        websocket.send_text("a")
+        websocket.send_text('{"id": 2, "prefix": "APR"}')
+        assert websocket.receive_json() == {"id": 2, "prefix": "APR", "suggestions": ["Apricot"]}
+        
+        websocket.send_text("b")
+        assert websocket.receive_json()["suggestions"] == ["Banana"]
+        
+        websocket.send_text('{"prefix": 1}')
+        assert "error" in websocket.receive_json()
+
+
+def test_dictionary_query_budgets(client, assert_max_queries):
+    """Test endpoints stay within their SQL statement budgets"""
+    with assert_max_queries(5) as captured:
+        client.post(
+            "/dictionary/add",
+            json={"word": "Budget", "definition": "Counted statements"}
+        )
+    assert len(captured) > 0
+    
+    # Cache hit: no statements at all
+    client.get("/dictionary/budget")
+    with assert_max_queries(0):
+        client.get("/dictionary/budget")
+    
+    # Batch lookups resolve misses with a single query
+    with assert_max_queries(1):
+        client.post("/dictionary/batch", json={"words": [f"missing{i}" for i in range(50)]})
+
+
+def test_slow_queries_are_logged_with_plan(db_session, monkeypatch, caplog):
+    """Test statements over the threshold are logged with EXPLAIN output"""
+    monkeypatch.setattr(settings, "DB_SLOW_QUERY_SECONDS", 0)
+    
+    with caplog.at_level("WARNING", logger="app.core.query_stats"):
+        DictionaryRepository(db_session).find_by_word("planned")
+    
+    slow = [record.getMessage() for record in caplog.records if "Slow query" in record.getMessage()]
+    assert slow and ("SCAN" in slow[0] or "SEARCH" in slow[0])
+
+
+def test_dictionary_stats_from_daily_counters(client, db_session, assert_max_queries):
+    """Test stats come from counters kept by every insert path"""
+    client.post("/dictionary/add", json={"word": "First", "definition": "One"})
+    repository = DictionaryRepository(db_session)
+    repository.create_many([("Second", "Two"), ("Third", "Three")])
+    repository.commit()
+    
+    with assert_max_queries(2) as captured:
+        response = client.get("/dictionary/stats?days=7")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["total_words"] == 3
+    assert stats["added_today"] == 3
+    assert len(stats["daily"]) == 1
+    assert not any("dictionary_entries" in statement for statement in captured.statements)
+
+
+def test_recent_entries_keyset_pagination(client):
+    """Test the recent feed pages newest first with a before_id cursor"""
+    for word in ("alpha", "beta", "gamma"):
+        client.post("/dictionary/add", json={"word": word, "definition": f"The word {word}"})
+    
+    first = client.get("/dictionary/stats/recent?limit=2").json()
+    assert [entry["word"] for entry in first["entries"]] == ["gamma", "beta"]
+    assert first["next_before_id"] is not None
+    
+    second = client.get(f"/dictionary/stats/recent?limit=2&before_id={first['next_before_id']}").json()
+    assert [entry["word"] for entry in second["entries"]] == ["alpha"]
+    assert second["next_before_id"] is None
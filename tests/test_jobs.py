@@ -0,0 +1,119 @@
+import asyncio
+import json
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.dictionary.repository import DictionaryRepository
+from app.jobs.repository import JobRepository
+from app.jobs.runner import JobRunner
+from app.jobs.service import JobService
+
+
+@pytest.fixture
+def import_dir(tmp_path, monkeypatch):
+    """Allow dictionary imports from a temporary directory"""
+    monkeypatch.setattr(settings, "JOBS_IMPORT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def make_runner(db_session, worker_id, **kwargs):
+    return JobRunner(
+        session_factory=sessionmaker(bind=db_session.get_bind()),
+        worker_id=worker_id,
+        **kwargs
+    )
+
+
+def test_submit_and_get_job(client, import_dir):
+    """Test submitting an import queues it and reports its status"""
+    (import_dir / "glossary.csv").write_text("alpha,First letter\n")
+    
+    response = client.post("/jobs", json={"type": "dictionary_import", "params": {"path": "glossary.csv"}})
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert job["processed"] == 0
+    
+    response = client.get(f"/jobs/{job['id']}")
+    assert response.status_code == 200
+    assert response.json()["type"] == "dictionary_import"
+    
+    assert client.get("/jobs/999").status_code == 404
+
+
+def test_submit_rejects_invalid_jobs(client, import_dir):
+    """Test unknown types and files outside the import directory are rejected"""
+    response = client.post("/jobs", json={"type": "reindex_everything"})
+    assert response.status_code == 400
+    
+    response = client.post("/jobs", json={"type": "dictionary_import", "params": {"path": "../secrets.csv"}})
+    assert response.status_code == 400
+    
+    response = client.post("/jobs", json={"type": "dictionary_import", "params": {"path": "missing.csv"}})
+    assert response.status_code == 400
+
+
+def test_cancel_queued_job(client, import_dir):
+    """Test cancelling a queued job finishes it immediately"""
+    (import_dir / "glossary.csv").write_text("alpha,First letter\n")
+    job = client.post("/jobs", json={"type": "dictionary_import", "params": {"path": "glossary.csv"}}).json()
+    
+    response = client.post(f"/jobs/{job['id']}/cancel")
+    assert response.status_code == 200
+    assert response.json()["status"] == "cancelled"
+    assert client.post("/jobs/999/cancel").status_code == 404
+
+
+def test_import_job_resumes_from_checkpoint(db_session, import_dir):
+    """Test an import abandoned after one chunk resumes without redoing it"""
+    (import_dir / "glossary.ndjson").write_text("\n".join([
+        json.dumps({"word": "alpha", "definition": "First letter"}),
+        json.dumps({"word": "beta", "definition": "Second letter"}),
+        json.dumps({"word": "ALPHA", "definition": "Duplicate"}),
+        "not json",
+        json.dumps({"word": "gamma", "definition": "Third letter"}),
+    ]) + "\n")
+    job_id = JobService(JobRepository(db_session)).submit(
+        "dictionary_import", {"path": "glossary.ndjson"}
+    ).id
+    
+    # First worker runs one chunk, then disappears without finishing
+    crashed = make_runner(db_session, "crashed", chunk_size=2)
+    job = crashed.claim_next()
+    outcome, checkpoint, processed = crashed.run_chunk(job.id, job.type, job.params, None, 0)
+    assert (outcome, processed) == ("continue", 2)
+    
+    resumed = make_runner(db_session, "resumed", chunk_size=2, stale_after_seconds=0)
+    job = resumed.claim_next()
+    assert job.id == job_id and job.processed == 2
+    assert asyncio.run(resumed.run_job(job)) == "succeeded"
+    
+    db_session.expire_all()
+    job = JobRepository(db_session).get(job_id)
+    assert (job.status, job.processed, job.total) == ("succeeded", 5, 5)
+    assert json.loads(job.checkpoint)["imported"] == 3
+    assert json.loads(job.checkpoint)["skipped"] == 2
+    words = {entry.word for entry in DictionaryRepository(db_session).find_by_words(["alpha", "beta", "gamma"])}
+    assert words == {"alpha", "beta", "gamma"}
+
+
+def test_running_job_stops_after_cancel(db_session, import_dir):
+    """Test a running job stops at the next chunk boundary once cancelled"""
+    (import_dir / "glossary.csv").write_text("".join(f"word{i},definition {i}\n" for i in range(10)))
+    service = JobService(JobRepository(db_session))
+    job_id = service.submit("dictionary_import", {"path": "glossary.csv"}).id
+    
+    runner = make_runner(db_session, "worker", chunk_size=3)
+    job = runner.claim_next()
+    runner.run_chunk(job.id, job.type, job.params, None, 0)
+    assert service.cancel(job_id).cancel_requested
+    
+    db_session.expire_all()
+    job = JobRepository(db_session).get(job_id)
+    assert asyncio.run(runner.run_job(job)) == "cancelled"
+    
+    db_session.expire_all()
+    job = service.get(job_id)
+    assert (job.status, job.processed, job.progress) == ("cancelled", 3, 0.3)
@@ -1,9 +1,36 @@
 """Unit tests for main application endpoints."""
+import asyncio
+import json
+import logging
+import threading
+import time
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
 
 from app.main import app
-from app.core.config import settings
+from app.core.admission import AdmissionBudget, AdmissionControlMiddleware
+from app.core.body_limits import BodySizeLimitMiddleware
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.core.config import Settings, settings
+from app.core.database import get_db
+from app.core.executor import BoundedExecutor
+from app.core.logging_config import JsonFormatter, SamplingFilter
+from app.core.memory_profiling import MemoryProfiler, MemoryProfilingMiddleware
+from app.core.metrics import metrics
+from app.core.readiness import readiness
+from app.core.server import build_uvicorn_config, cgroup_cpu_limit, resolve_worker_count
+from app.core.sqlite import install_sqlite_profile
+from app.core.tracing import (
+    BatchSpanProcessor,
+    FileSpanExporter,
+    ParentBasedRatioSampler,
+    TracingMiddleware,
+    install_tracing_hooks,
+    parse_traceparent,
+    tracer
+)
 
 
 @pytest.fixture
@@ -39,3 +66,468 @@ class TestHealthEndpoint:
         data = response.json()
         assert data["status"] == "healthy"
 
+
+
+class TestLoggingConfig:
+    """Test cases for structured, sampled logging."""
+    
+    def test_json_formatter_merges_arguments(self):
+        """Test JSON formatter output includes the lazily formatted message."""
+        record = logging.LogRecord(
+            "app.words.service", logging.INFO, __file__, 1, "Skipped %d words", (3,), None
+        )
+        payload = json.loads(JsonFormatter().format(record))
+        
+        assert payload["message"] == "Skipped 3 words"
+        assert payload["logger"] == "app.words.service"
+        assert payload["level"] == "INFO"
+    
+    def test_sampling_filter_uses_longest_prefix(self):
+        """Test sampling rates resolve by logger prefix and keep errors."""
+        sampling = SamplingFilter({"app": 1.0, "app.dictionary": 0.0})
+        
+        def make(name, level):
+            return logging.LogRecord(name, level, __file__, 1, "msg", (), None)
+        
+        assert sampling.filter(make("app.words.service", logging.INFO))
+        assert not sampling.filter(make("app.dictionary.service", logging.INFO))
+        assert sampling.filter(make("app.dictionary.service", logging.ERROR))
+    
+    def test_sampling_rates_setting_parsed(self):
+        """Test LOG_SAMPLING_RATES is parsed into a mapping."""
+        config = Settings(LOG_SAMPLING_RATES="app.words=0.5, app.shopping=2")
+        
+        assert config.log_sampling_rates == {"app.words": 0.5, "app.shopping": 1.0}
+
+
+class TestServerRunner:
+    """Test cases for the python -m app server runner."""
+    
+    def test_cgroup_v2_quota(self, tmp_path):
+        """Test cpu.max quota and period are turned into a CPU count."""
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+        
+        assert cgroup_cpu_limit(str(cpu_max)) == 1.5
+    
+    def test_cgroup_v2_unlimited(self, tmp_path):
+        """Test an unlimited cpu.max reports no limit."""
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("max 100000\n")
+        
+        assert cgroup_cpu_limit(str(cpu_max)) is None
+    
+    def test_cgroup_v1_fallback(self, tmp_path):
+        """Test the v1 CFS files are used when cpu.max is missing."""
+        quota = tmp_path / "quota"
+        period = tmp_path / "period"
+        quota.write_text("200000\n")
+        period.write_text("100000\n")
+        
+        assert cgroup_cpu_limit(str(tmp_path / "missing"), str(quota), str(period)) == 2.0
+        quota.write_text("-1\n")
+        assert cgroup_cpu_limit(str(tmp_path / "missing"), str(quota), str(period)) is None
+    
+    def test_worker_count_setting_overrides_quota(self):
+        """Test an explicit SERVER_WORKERS wins over CPU detection."""
+        assert resolve_worker_count(Settings(SERVER_WORKERS=3)) == 3
+        assert resolve_worker_count(Settings(SERVER_WORKERS=0)) >= 1
+    
+    def test_uvicorn_config_from_settings(self):
+        """Test server settings are passed through to uvicorn."""
+        config = build_uvicorn_config(Settings(
+            SERVER_PORT=9000,
+            SERVER_BACKLOG=512,
+            SERVER_KEEPALIVE_TIMEOUT=15
+        ))
+        
+        assert config.port == 9000
+        assert config.backlog == 512
+        assert config.timeout_keep_alive == 15
+        assert config.loop in ("uvloop", "asyncio")
+        assert config.http in ("httptools", "h11")
+
+
+class TestSqliteProfile:
+    """Test cases for the tuned SQLite profile."""
+    
+    @pytest.fixture
+    def sqlite_engine(self, tmp_path):
+        """Create a tuned engine on a file database."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'edge.db'}", connect_args={"check_same_thread": False})
+        install_sqlite_profile(engine, Settings(SQLITE_BUSY_TIMEOUT_MS=2_000))
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        yield engine
+        engine.dispose()
+    
+    def test_pragmas_applied(self, sqlite_engine):
+        """Test new connections use WAL, NORMAL sync and the busy timeout."""
+        with sqlite_engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 2_000
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+    
+    def test_writers_serialized_while_readers_proceed(self, sqlite_engine):
+        """Test a second writer waits for the first while reads still run."""
+        first_wrote = threading.Event()
+        release_first = threading.Event()
+        second_done = threading.Event()
+        
+        def first_writer():
+            with sqlite_engine.begin() as conn:
+                conn.execute(text("INSERT INTO items (name) VALUES ('first')"))
+                first_wrote.set()
+                release_first.wait(5)
+        
+        def second_writer():
+            with sqlite_engine.begin() as conn:
+                conn.execute(text("INSERT INTO items (name) VALUES ('second')"))
+            second_done.set()
+        
+        writers = [threading.Thread(target=first_writer), threading.Thread(target=second_writer)]
+        writers[0].start()
+        assert first_wrote.wait(5)
+        writers[1].start()
+        
+        with sqlite_engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 0
+        assert not second_done.wait(0.2)
+        
+        release_first.set()
+        for writer in writers:
+            writer.join(5)
+        assert second_done.is_set()
+        with sqlite_engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 2
+
+
+class TestServiceExecutor:
+    """Test cases for the bounded service executor."""
+    
+    def test_blocking_call_does_not_stall_event_loop(self):
+        """Test a slow call on the executor leaves the loop free for other work."""
+        executor = BoundedExecutor(max_workers=2, name="test")
+        
+        async def scenario():
+            slow = asyncio.create_task(executor.run(time.sleep, 0.2))
+            started = time.perf_counter()
+            await asyncio.sleep(0.01)
+            loop_latency = time.perf_counter() - started
+            await slow
+            return loop_latency
+        
+        try:
+            assert asyncio.run(scenario()) < 0.1
+        finally:
+            executor.shutdown()
+        
+        snapshot = metrics.snapshot()
+        assert snapshot["summaries"]["executor.test.wait_seconds"]["count"] == 1
+        assert snapshot["gauges"]["executor.test.queue_depth"] == 0
+    
+    def test_executor_size_follows_db_pool(self):
+        """Test the default executor size matches the connection pool capacity."""
+        config = Settings(DB_POOL_SIZE=4, DB_MAX_OVERFLOW=6)
+        
+        assert config.executor_max_workers == 10
+        assert Settings(EXECUTOR_MAX_WORKERS=3).executor_max_workers == 3
+    
+    def test_metrics_endpoint(self, client):
+        """Test metrics endpoint returns all metric sections."""
+        response = client.get("/metrics")
+        
+        assert response.status_code == 200
+        assert set(response.json()) == {"counters", "gauges", "summaries"}
+
+
+class TestAdmissionControl:
+    """Test cases for admission control and load shedding."""
+    
+    def test_budget_queues_then_sheds(self):
+        """Test requests beyond the limit wait briefly, then are shed."""
+        budget = AdmissionBudget("test", max_concurrent=1, max_queue=1, max_wait_seconds=0.05)
+        
+        async def scenario():
+            assert await budget.acquire()
+            # Queue is full once one request waits
+            waiting = asyncio.create_task(budget.acquire())
+            await asyncio.sleep(0)
+            assert not await budget.acquire()
+            # The waiter times out because the slot is never released
+            assert not await waiting
+            budget.release()
+            # Releasing hands the slot to a waiter
+            assert await budget.acquire()
+            waiting = asyncio.create_task(budget.acquire())
+            await asyncio.sleep(0)
+            budget.release()
+            assert await waiting
+        
+        asyncio.run(scenario())
+        
+        counters = metrics.snapshot()["counters"]
+        assert counters["admission.test.shed_queue_full"] == 1
+        assert counters["admission.test.shed_timeout"] == 1
+    
+    def test_middleware_returns_503_with_retry_after(self):
+        """Test shed requests get 503 and Retry-After; other paths pass through."""
+        calls = []
+        
+        async def inner(scope, receive, send):
+            calls.append(scope["path"])
+        
+        budget = AdmissionBudget("full", max_concurrent=1, max_queue=0, max_wait_seconds=1)
+        middleware = AdmissionControlMiddleware(inner, [("/dictionary", budget)], retry_after_seconds=3)
+        messages = []
+        
+        async def send(message):
+            messages.append(message)
+        
+        async def scenario():
+            await budget.acquire()
+            await middleware({"type": "http", "path": "/dictionary/word"}, None, send)
+            await middleware({"type": "http", "path": "/health"}, None, send)
+        
+        asyncio.run(scenario())
+        
+        assert messages[0]["status"] == 503
+        assert (b"retry-after", b"3") in messages[0]["headers"]
+        assert calls == ["/health"]
+
+
+class TestResponseMemoization:
+    """Test cases for memoized pure routes."""
+    
+    def test_identical_requests_replay_stored_response(self, client):
+        """Test a repeated body is served from the memo cache."""
+        payload = {"costs": {"memo-apple": 2.0}, "items": ["memo-apple"], "tax": 0.5}
+        
+        def counters():
+            snapshot = metrics.snapshot()["counters"]
+            return snapshot.get("memo.hits", 0), snapshot.get("memo.misses", 0)
+        
+        hits, misses = counters()
+        first = client.post("/shopping/total", json=payload)
+        second = client.post("/shopping/total", json=payload)
+        client.post("/shopping/total", json={**payload, "tax": 0.25})
+        
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert counters() == (hits + 1, misses + 2)
+    
+    def test_invalid_requests_are_not_stored(self, client):
+        """Test error responses are recomputed each time."""
+        payload = {"costs": {}, "items": [], "tax": -1}
+        
+        assert client.post("/shopping/total", json=payload).status_code == 422
+        hits = metrics.snapshot()["counters"].get("memo.hits", 0)
+        assert client.post("/shopping/total", json=payload).status_code == 422
+        assert metrics.snapshot()["counters"].get("memo.hits", 0) == hits
+
+
+class TestCircuitBreaker:
+    """Test cases for the circuit breaker."""
+    
+    def test_opens_after_failures_and_closes_after_probe(self):
+        """Test the closed -> open -> half-open -> closed cycle."""
+        breaker = CircuitBreaker(
+            "test",
+            failure_threshold=2,
+            recovery_timeout=0.05,
+            failure_exceptions=(ConnectionError,)
+        )
+        
+        def fail():
+            raise ConnectionError("database down")
+        
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                breaker.call(fail)
+        assert breaker.state == "open"
+        
+        # Rejected without calling the dependency
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "not called")
+        
+        time.sleep(0.06)
+        assert breaker.call(lambda: "probe") == "probe"
+        assert breaker.state == "closed"
+        assert metrics.snapshot()["counters"]["circuit.test.rejected"] == 1
+    
+    def test_failed_probe_reopens_circuit(self):
+        """Test a failing half-open probe opens the circuit again."""
+        breaker = CircuitBreaker(
+            "test-probe",
+            failure_threshold=1,
+            recovery_timeout=0.05,
+            failure_exceptions=(ConnectionError,)
+        )
+        breaker.record_failure()
+        time.sleep(0.06)
+        
+        def fail():
+            raise ConnectionError("still down")
+        
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+        assert breaker.is_open
+
+
+class TestReadinessEndpoint:
+    """Test cases for the readiness check endpoint."""
+    
+    def test_ready_reflects_registered_checks(self, client):
+        """Test readiness is 503 until every registered check passes."""
+        readiness.register("test-check")
+        try:
+            response = client.get("/health/ready")
+            assert response.status_code == 503
+            assert response.json()["checks"]["test-check"] is False
+            
+            readiness.mark("test-check")
+            response = client.get("/health/ready")
+            assert response.json()["checks"]["test-check"] is True
+        finally:
+            readiness.reset()
+    
+    def test_liveness_ignores_readiness(self, client):
+        """Test liveness stays healthy while the app is not ready."""
+        readiness.register("test-check")
+        try:
+            assert client.get("/health").status_code == 200
+        finally:
+            readiness.reset()
+
+
+class TestBodySizeLimits:
+    """Test cases for request body size limits."""
+    
+    def test_declared_oversized_body_rejected(self, client):
+        """Test a Content-Length over the limit gets 413 before parsing."""
+        body = json.dumps({"words": ["a" * settings.MAX_REQUEST_BODY_BYTES]})
+        response = client.post("/word/concat", content=body, headers={"Content-Type": "application/json"})
+        assert response.status_code == 413
+        
+        response = client.post("/word/concat", json={"words": ["abc", "def"]})
+        assert response.status_code == 200
+    
+    def test_chunked_body_counted_as_received(self):
+        """Test a body without Content-Length is cut off once it crosses the limit."""
+        read = []
+        
+        async def inner(scope, receive, send):
+            while True:
+                message = await receive()
+                read.append(len(message["body"]))
+                if not message.get("more_body"):
+                    break
+        
+        middleware = BodySizeLimitMiddleware(inner, max_body_bytes=10, path_limits={"/word/concat/stream": 0})
+        chunks = [{"type": "http.request", "body": b"x" * 6, "more_body": True} for _ in range(3)]
+        messages = []
+        
+        async def receive():
+            return chunks.pop(0)
+        
+        async def send(message):
+            messages.append(message)
+        
+        scope = {"type": "http", "method": "POST", "path": "/word/concat", "headers": []}
+        asyncio.run(middleware(scope, receive, send))
+        
+        assert read == [6]
+        assert messages[0]["status"] == 413
+        assert middleware.limit_for("/word/concat/stream") == 0
+    
+    def test_body_limits_setting_parsed(self):
+        """Test per-path body limits parse from the setting string."""
+        config = Settings(REQUEST_BODY_LIMITS="/shopping=65536, /word/concat/stream=0,")
+        assert config.request_body_limits == {"/shopping": 65536, "/word/concat/stream": 0}
+
+
+class TestMemoryProfiling:
+    """Test cases for per-route memory profiling."""
+    
+    def test_peaks_recorded_per_route_template(self):
+        """Test requests are grouped by route template and reported with allocation sites."""
+        profiler = MemoryProfiler()
+        profiler.start()
+        try:
+            profiled = TestClient(MemoryProfilingMiddleware(app, profiler))
+            profiled.post("/word/concat", json={"words": ["abc", "def"]})
+            profiled.post("/word/concat", json={"words": ["ghi", "jkl"]})
+            profiled.get("/health")
+            
+            report = profiler.report(limit=5)
+        finally:
+            profiler.stop()
+        
+        routes = {route["route"]: route for route in report["routes"]}
+        assert routes["POST /word/concat"]["requests"] == 2
+        assert routes["GET /health"]["max_peak_bytes"] > 0
+        assert 0 < len(report["top_allocations"]) <= 5
+        assert report["max_rss_bytes"] > 0
+
+
+class TestTracing:
+    """Test cases for request tracing."""
+    
+    TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+    PARENT_ID = "00f067aa0ba902b7"
+    
+    def test_traceparent_parsing_and_sampling(self):
+        """Test W3C traceparent validation and parent-based sampling."""
+        assert parse_traceparent(f"00-{self.TRACE_ID}-{self.PARENT_ID}-01") == (self.TRACE_ID, self.PARENT_ID, True)
+        assert parse_traceparent(f"00-{self.TRACE_ID}-{self.PARENT_ID}-00")[2] is False
+        assert parse_traceparent(f"00-{'0' * 32}-{self.PARENT_ID}-01") is None
+        assert parse_traceparent(f"ff-{self.TRACE_ID}-{self.PARENT_ID}-01") is None
+        assert parse_traceparent("not-a-header") is None
+        
+        never = ParentBasedRatioSampler(0.0)
+        always = ParentBasedRatioSampler(1.0)
+        assert not never.should_sample(self.TRACE_ID, None)
+        assert never.should_sample(self.TRACE_ID, True)
+        assert always.should_sample(self.TRACE_ID, None)
+        assert not always.should_sample(self.TRACE_ID, False)
+    
+    def test_spans_cover_router_service_repository_and_sql(self, db_session, tmp_path):
+        """Test a traced lookup exports nested spans continuing the caller's trace."""
+        path = tmp_path / "traces.jsonl"
+        install_tracing_hooks(db_session.get_bind())
+        tracer.configure(
+            ParentBasedRatioSampler(0.0),
+            BatchSpanProcessor(FileSpanExporter(str(path)), resource={"service.name": "test"})
+        )
+        app.dependency_overrides[get_db] = lambda: db_session
+        try:
+            traced_client = TestClient(TracingMiddleware(app, tracer=tracer))
+            response = traced_client.get(
+                "/dictionary/missing",
+                headers={"traceparent": f"00-{self.TRACE_ID}-{self.PARENT_ID}-01"}
+            )
+            assert response.status_code == 404
+            assert response.headers["traceresponse"].startswith(f"00-{self.TRACE_ID}-")
+            
+            response = traced_client.get("/dictionary/missing")
+            assert "traceresponse" not in response.headers
+        finally:
+            app.dependency_overrides.clear()
+            tracer.shutdown()
+        
+        spans = {span["name"]: span for span in map(json.loads, path.read_text().splitlines())}
+        server = spans["GET /dictionary/{word}"]
+        service = spans["DictionaryService.get_word_with_fallback"]
+        lookup = spans["DictionaryService.get_word"]
+        repository = spans["DictionaryRepository.find_by_word"]
+        query = spans["SELECT"]
+        assert {span["traceId"] for span in spans.values()} == {self.TRACE_ID}
+        assert server["parentSpanId"] == self.PARENT_ID
+        assert server["attributes"]["http.response.status_code"] == 404
+        assert service["parentSpanId"] == server["spanId"]
+        assert service["status"]["code"] == "STATUS_CODE_ERROR"
+        assert lookup["parentSpanId"] == service["spanId"]
+        assert repository["parentSpanId"] == lookup["spanId"]
+        assert query["parentSpanId"] == repository["spanId"]
+        assert "dictionary_entries" in query["attributes"]["db.statement"]
@@ -1,6 +1,9 @@
+import msgpack
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
+from app.shopping.models import ShoppingRuleSet
+from app.shopping.rules import RuleSetCache
 
 client = TestClient(app)
 
@@ -57,3 +60,83 @@ def test_calculate_total_zero_tax():
     assert data["tax_amount"] == 0.00
     assert data["total"] == 10.00
 
+
+def test_calculate_total_msgpack():
+    """Test MessagePack request and response bodies share the JSON models"""
+    body = msgpack.packb({
+        "costs": {"apple": 1.50, "banana": 0.75},
+        "items": ["apple", "banana"],
+        "tax": 0.1
+    })
+    response = client.post(
+        "/shopping/total",
+        content=body,
+        headers={"Content-Type": "application/msgpack", "Accept": "application/msgpack"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/msgpack"
+    data = msgpack.unpackb(response.content)
+    assert data["total"] == 2.48
+    
+    # Same validation as JSON
+    response = client.post(
+        "/shopping/total",
+        content=msgpack.packb({"costs": {}, "items": [], "tax": -1}),
+        headers={"Content-Type": "application/msgpack"}
+    )
+    assert response.status_code == 422
+
+
+def test_flat_tax_response_unchanged():
+    """Test requests without rules keep the original response fields"""
+    response = client.post(
+        "/shopping/total",
+        json={"costs": {"apple": 1.50}, "items": ["apple"], "tax": 0.1}
+    )
+    assert response.status_code == 200
+    assert set(response.json()) == {"subtotal", "tax_amount", "total", "items_found", "items_not_found"}
+
+
+def test_calculate_total_with_rules():
+    """Test per-category tax and quantity discount tiers in integer cents"""
+    response = client.post(
+        "/shopping/total",
+        json={
+            "costs": {"apple": 1.50, "milk": 0.99, "tv": 199.99, "gum": 0.10},
+            "items": ["apple"] * 12 + ["milk", "tv", "gum", "nonexistent"],
+            "tax": 0.1,
+            "categories": {"apple": "produce", "milk": "grocery", "tv": "electronics"},
+            "rules": {
+                "version": "test-2026-10",
+                "category_tax": {"produce": 0.0, "grocery": 0.05, "electronics": 0.2},
+                "discounts": {
+                    "produce": [
+                        {"min_quantity": 10, "percent": 10},
+                        {"min_quantity": 5, "percent": 5}
+                    ]
+                }
+            }
+        }
+    )
+    assert response.status_code == 200
+    data = response.json()
+    # 12 apples reach the 10% tier; milk, tv and uncategorized gum are taxed at 5%, 20% and 10%
+    assert data["subtotal"] == 219.08
+    assert data["discount_amount"] == 1.80
+    assert data["tax_amount"] == 40.06
+    assert data["total"] == 257.34
+    assert data["rule_set_version"] == "test-2026-10"
+    assert data["items_found"].count("apple") == 12
+    assert data["items_not_found"] == ["nonexistent"]
+
+
+def test_rule_sets_compiled_once_per_version():
+    """Test a rule set version is compiled on first use and then reused"""
+    cache = RuleSetCache(max_size=2, ttl_seconds=60)
+    rules = ShoppingRuleSet(version="v1", category_tax={"grocery": 0.05})
+    compiled = cache.get(rules)
+    assert cache.get(ShoppingRuleSet(version="v1")) is compiled
+    assert cache.get(ShoppingRuleSet(version="v2")) is not compiled
+    
+    price = compiled.price(["bread", "bread"], {"bread": 0.35}, {"bread": "grocery"}, 0.5)
+    assert (price.subtotal, price.discount, price.tax, price.total) == (70, 0, 4, 74)
@@ -1,6 +1,11 @@
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
+from app.core.config import settings
 from app.main import app
+from app.words.router import ConcatenationStreamResponse, STREAM_ERROR_MARKER
+from app.words.service import ConcatenationStream, shutdown_process_pool
 
 client = TestClient(app)
 
@@ -53,3 +58,140 @@ def test_concatenate_single_word():
     # t (index 0 of "test")
     assert data["result"] == "t"
 
+
+def _run_stream(chunks, is_ndjson=False):
+    """Drive ConcatenationStreamResponse with the body split into chunks"""
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    sent = []
+    
+    async def receive():
+        return messages.pop(0)
+    
+    async def send(message):
+        sent.append(message)
+    
+    response = ConcatenationStreamResponse(is_ndjson=is_ndjson)
+    asyncio.run(response({"type": "http"}, receive, send))
+    status = sent[0]["status"]
+    body = b"".join(m.get("body", b"") for m in sent[1:]).decode("utf-8")
+    return status, body
+
+
+def test_concatenate_without_echoed_words():
+    """Test that callers can opt out of the echoed words list"""
+    response = client.post(
+        "/word/concat",
+        json={"words": ["abc", "xyz"], "include_words": False}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["result"] == "ay"
+    assert "words" not in data
+
+
+def test_concatenation_stream_carries_index_across_batches():
+    """Test that the word index continues from one batch to the next"""
+    stream = ConcatenationStream()
+    assert stream.feed(["ab"]) == "a"
+    assert stream.feed(["c", "xy"]) == ""
+    assert stream.feed(["wxyz"]) == "z"
+    assert stream.words_processed == 4
+    assert stream.words_skipped == 2
+    assert stream.characters_emitted == 2
+
+
+def test_concatenate_stream_plain_text():
+    """Test streaming concatenation with one word per line"""
+    response = client.post(
+        "/word/concat/stream",
+        content="abc\nxy\nxyz\nabcd\n",
+        headers={"Content-Type": "text/plain"}
+    )
+    assert response.status_code == 200
+    # a (0) + y (1) + z (2) + d (3)
+    assert response.text == "ayzd"
+
+
+def test_concatenate_stream_ndjson_skips_short_words():
+    """Test streaming concatenation of NDJSON strings with short words"""
+    body = "\n".join(['"abc"', '"x"', "", '"xyz"'])
+    response = client.post(
+        "/word/concat/stream",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    # a (0) + "x" too short for index 1 + z (2)
+    assert response.text == "az"
+
+
+def test_concatenate_stream_ignores_blank_lines():
+    """Test that blank lines are ignored in plain-text and NDJSON bodies"""
+    plain = client.post("/word/concat/stream", content="abc\n\nxyz")
+    ndjson = client.post(
+        "/word/concat/stream",
+        content='"abc"\n\n"xyz"',
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    # a (0) + y (1)
+    assert plain.text == "ay"
+    assert ndjson.text == "ay"
+
+
+def test_concatenate_stream_rejects_bad_ndjson_line():
+    """Test that an invalid first NDJSON line is rejected with 400"""
+    response = client.post(
+        "/word/concat/stream",
+        content='123\n"abc"',
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 400
+    assert "json strings" in response.json()["detail"].lower()
+
+
+def test_concatenate_stream_across_chunks():
+    """Test a chunked body with a word split across two chunks"""
+    status, body = _run_stream([b"abc\nx", b"yz\nxy", b"z\nabcd"])
+    assert status == 200
+    # a (0) + y (1) + z (2) + d (3)
+    assert body == "ayzd"
+
+
+def test_concatenate_stream_bad_line_after_start():
+    """Test that invalid input after the response started ends with an error marker"""
+    status, body = _run_stream([b'"abc"\n', b'{"word": 1}\n'], is_ndjson=True)
+    assert status == 200
+    assert body.startswith("a" + STREAM_ERROR_MARKER)
+
+
+def test_concatenate_batch_preserves_order():
+    """Test batch concatenation returns one result per document in order"""
+    response = client.post(
+        "/word/concat/batch",
+        json={"documents": [
+            {"words": ["abc", "xyz"]},
+            {"words": ["cat", "dog", "bird"], "include_words": False}
+        ]}
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["result"] for r in results] == ["ay", "cor"]
+    assert results[0]["words"] == ["abc", "xyz"]
+    assert "words" not in results[1]
+
+
+def test_concatenate_batch_process_pool(monkeypatch):
+    """Test that large batches fan out to the process pool"""
+    monkeypatch.setattr(settings, "WORD_BATCH_POOL_THRESHOLD", 1)
+    monkeypatch.setattr(settings, "WORD_BATCH_POOL_WORKERS", 2)
+    monkeypatch.setattr(settings, "WORD_BATCH_CHUNK_SIZE", 2)
+    documents = [{"words": ["abc", "xyz"]}, {"words": ["cat", "dog", "bird"]}] * 3
+    try:
+        response = client.post("/word/concat/batch", json={"documents": documents})
+    finally:
+        shutdown_process_pool()
+    assert response.status_code == 200
+    assert [r["result"] for r in response.json()["results"]] == ["ay", "cor"] * 3